@@ -2,14 +2,16 @@
 import os
 import sys
 from typing import List, Tuple
-
-IMAGE_EXTS = {".jpg", ".jpeg"}
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root not in sys.path:
+    sys.path.insert(0, root)
+from vat.utils.media_naming import media_type
 
 def list_videos(folder: str) -> List[str]:
     try:
         return sorted([
             f for f in os.listdir(folder)
-            if not f.startswith('.') and f.lower().endswith('.mpg') and os.path.isfile(os.path.join(folder, f))
+            if not f.startswith('.') and media_type(f) == "video" and os.path.isfile(os.path.join(folder, f))
         ])
     except Exception:
         return []
@@ -22,7 +24,7 @@ def list_images(folder: str) -> List[Tuple[str, str]]:
             full = os.path.join(folder, name)
             if name.startswith('.'):
                 continue
-            if os.path.isfile(full) and os.path.splitext(name)[1].lower() in IMAGE_EXTS:
+            if os.path.isfile(full) and media_type(name) == "image":
                 out.append((name, full))
     except Exception:
         pass
@@ -34,7 +36,7 @@ def list_images(folder: str) -> List[Tuple[str, str]]:
                     full = os.path.join(subpath, name)
                     if name.startswith('.'):
                         continue
-                    if os.path.isfile(full) and os.path.splitext(name)[1].lower() in IMAGE_EXTS:
+                    if os.path.isfile(full) and media_type(name) == "image":
                         out.append((name, full))
             except Exception:
                 pass
@@ -56,17 +58,17 @@ def scan_folder(folder: str) -> str:
     first4_mpgs = videos[:4]
     lines = []
     lines.append(f"Folder: {folder}")
-    lines.append(f"  MPG count: {len(videos)}")
-    lines.append(f"  JPG count: {len(images)}")
+    lines.append(f"  Video count: {len(videos)}")
+    lines.append(f"  Image count: {len(images)}")
     lines.append(f"  Matches: {len(v_bases & i_bases)}")
-    lines.append(f"  Unmatched MPG (no JPG): {len(unmatched_videos)}")
+    lines.append(f"  Unmatched videos (no image): {len(unmatched_videos)}")
     if unmatched_videos:
         lines.append(f"    - {', '.join(unmatched_videos[:10])}{' ...' if len(unmatched_videos) > 10 else ''}")
-    lines.append(f"  Unmatched JPG (no MPG): {len(unmatched_images)}")
+    lines.append(f"  Unmatched images (no video): {len(unmatched_images)}")
     if unmatched_images:
         lines.append(f"    - {', '.join(unmatched_images[:10])}{' ...' if len(unmatched_images) > 10 else ''}")
-    lines.append(f"  First 4 JPGs (sorted): {', '.join(first4_jpgs) if first4_jpgs else 'None'}")
-    lines.append(f"  First 4 MPGs (sorted): {', '.join(first4_mpgs) if first4_mpgs else 'None'}")
+    lines.append(f"  First 4 images (sorted): {', '.join(first4_jpgs) if first4_jpgs else 'None'}")
+    lines.append(f"  First 4 videos (sorted): {', '.join(first4_mpgs) if first4_mpgs else 'None'}")
     return "\n".join(lines)
 
 def main():
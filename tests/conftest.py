@@ -7,6 +7,7 @@ out because an unattended run must never block on a message box.
 
 import os
 import sys
+import time
 import wave
 import struct
 
@@ -28,13 +29,33 @@ def qapp():
 @pytest.fixture(autouse=True)
 def _no_modal_dialogs(monkeypatch):
     """Stub every modal dialog so tests can never hang on one."""
-    from PySide6.QtWidgets import QMessageBox, QFileDialog
+    from PySide6.QtWidgets import QMessageBox, QFileDialog, QDialog
     monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *a, **k: QMessageBox.Ok))
     monkeypatch.setattr(QMessageBox, "warning", staticmethod(lambda *a, **k: QMessageBox.Ok))
     monkeypatch.setattr(QMessageBox, "critical", staticmethod(lambda *a, **k: QMessageBox.Ok))
     monkeypatch.setattr(QMessageBox, "question", staticmethod(lambda *a, **k: QMessageBox.Yes))
     monkeypatch.setattr(QFileDialog, "getOpenFileName", staticmethod(lambda *a, **k: ("", "")))
     monkeypatch.setattr(QFileDialog, "getExistingDirectory", staticmethod(lambda *a, **k: ""))
+    # Custom dialogs (e.g. the startup welcome dialog queued with
+    # QTimer.singleShot) would block any test that spins the event loop.
+    monkeypatch.setattr(QDialog, "exec", lambda self, *a, **k: QDialog.Rejected)
+
+
+def wait_until(qapp, predicate, timeout=10.0):
+    """Spin the event loop until ``predicate()`` holds or ``timeout`` passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    return predicate()
+
+
+def age_dirs(*roots, seconds=60):
+    """Backdate every directory under ``roots`` out of the index's racy window."""
+    past = time.time() - seconds
+    for root in roots:
+        for dirpath, _dirs, _files in os.walk(root):
+            os.utime(dirpath, (past, past))
 
 
 def make_image(path, size=(64, 48), color=(200, 30, 30)):
@@ -90,6 +111,10 @@ def app_window(qapp, media_folder, tmp_path, monkeypatch):
     """A real VideoAnnotationApp pointed at media_folder, with isolated settings."""
     monkeypatch.setenv("HOME", str(tmp_path / "home"))
     os.makedirs(str(tmp_path / "home"), exist_ok=True)
+    # Process-wide caches: start empty and rooted under the temp HOME.
+    from vat.utils import thumb_cache, pixmap_cache
+    monkeypatch.setattr(thumb_cache, "_shared_cache", None)
+    monkeypatch.setattr(pixmap_cache, "_shared_cache", None)
     from vat.ui.app import VideoAnnotationApp
     w = VideoAnnotationApp()
     w.fs.set_folder(media_folder)
@@ -0,0 +1,75 @@
+"""Tests for opening a folder on a worker thread
+(FolderAccessManager.open_folder_async) and the app's open_folder()."""
+
+import os
+
+import pytest
+
+from tests.conftest import make_image, make_wav, wait_until
+
+
+@pytest.fixture
+def big_folder(tmp_path):
+    d = tmp_path / "big"
+    d.mkdir()
+    for i in range(40):
+        make_image(str(d / f"img{i:02d}.png"), size=(8, 8))
+    for i in range(0, 40, 4):
+        make_wav(str(d / f"img{i:02d}.png.wav"))
+    return str(d)
+
+
+def test_views_get_a_first_page_then_the_rest_as_changes(qapp, big_folder):
+    from vat.utils.fs_access import FolderAccessManager
+    fs = FolderAccessManager()
+    fs.SCAN_PAGE_SIZE = 5
+    seen = {"folder": [], "images": [], "added": [], "recordings": [], "progress": [], "done": []}
+    fs.folderChanged.connect(seen["folder"].append)
+    fs.imagesUpdated.connect(lambda _f, imgs: seen["images"].append(list(imgs)))
+    fs.mediaAdded.connect(seen["added"].extend)
+    fs.recordingsChanged.connect(seen["recordings"].extend)
+    fs.scanProgress.connect(lambda _f, n: seen["progress"].append(n))
+    fs.scanFinished.connect(lambda f, _errors: seen["done"].append(f))
+    assert fs.open_folder_async(big_folder)
+    assert fs.current_folder is None                  # nothing happens before the first page
+    assert wait_until(qapp, lambda: seen["done"])
+
+    assert seen["folder"] == [big_folder] and len(seen["images"]) == 1
+    first_page = seen["images"][0]
+    assert 0 < len(first_page) < 40
+    everything = sorted(os.path.join(big_folder, f"img{i:02d}.png") for i in range(40))
+    assert sorted(first_page + seen["added"]) == everything
+    assert seen["progress"] and seen["progress"] == sorted(seen["progress"])
+    # Every recording is known by the end: found on the first page or announced later.
+    assert all(fs.has_recording(p, refresh=False) == (int(p[-6:-4]) % 4 == 0) for p in everything)
+    assert fs.list_images() == everything and not fs.is_scanning()
+
+
+def test_choosing_another_folder_cancels_the_running_open(qapp, big_folder, media_folder):
+    from vat.utils.fs_access import FolderAccessManager
+    fs = FolderAccessManager()
+    folders, failed = [], []
+    fs.folderChanged.connect(folders.append)
+    fs.scanFailed.connect(lambda *args: failed.append(args))
+    fs.open_folder_async(big_folder)
+    fs.open_folder_async(media_folder)
+    assert wait_until(qapp, lambda: not fs.is_scanning())
+    fs.cancel_scan(wait=True)
+    qapp.processEvents()
+    assert folders == [media_folder] and fs.current_folder == media_folder and not failed
+
+    fs.open_folder_async(os.path.join(media_folder, "missing"))
+    assert wait_until(qapp, lambda: failed)
+    assert failed[0][1] == "FolderNotFoundError" and fs.current_folder == media_folder
+
+
+def test_open_folder_fills_views_and_enables_kit_actions(qapp, app_window, big_folder):
+    w = app_window
+    w.export_wavs_button.setEnabled(False)
+    with open(os.path.join(big_folder, "Thumbs.db"), "w") as f:
+        f.write("x")
+    assert w.open_folder(big_folder)
+    assert wait_until(qapp, lambda: not w.fs.is_scanning() and w.images_model.rowCount() == 40)
+    assert w.fs.current_folder == big_folder and w.export_wavs_button.isEnabled()
+    assert not os.path.exists(os.path.join(big_folder, "Thumbs.db"))
+    assert w.folder_display_label.text() == "big"
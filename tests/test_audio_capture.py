@@ -0,0 +1,52 @@
+"""Tests for the callback-mode capture ring (vat/audio/capture.py)."""
+
+import threading
+
+from vat.audio.capture import (
+    CaptureBuffer, RingBuffer, PA_CONTINUE, PA_INPUT_OVERFLOW, PA_INPUT_UNDERFLOW
+)
+
+
+def test_ring_wraps_around_and_refuses_what_does_not_fit():
+    ring = RingBuffer(10)
+    assert ring.write(b"abcdef") and ring.read(4) == b"abcd"
+    assert ring.write(b"ghijkl")                   # wraps past the end
+    assert len(ring) == 8 and ring.free() == 2
+    assert not ring.write(b"xyz") and len(ring) == 8
+    assert ring.read() == b"efghijkl" and ring.read() == b""
+
+
+def test_producer_and_consumer_threads_lose_nothing():
+    ring = RingBuffer(1000)
+    chunks = [bytes([i % 251]) * 37 for i in range(2000)]
+    received = bytearray()
+
+    def produce():
+        for chunk in chunks:
+            while not ring.write(chunk):
+                pass
+
+    t = threading.Thread(target=produce)
+    t.start()
+    total = sum(map(len, chunks))
+    while len(received) < total:
+        received += ring.read()
+    t.join()
+    assert bytes(received) == b"".join(chunks)
+
+
+def test_callback_counts_overruns_underruns_and_drops():
+    capture = CaptureBuffer(3 * 1024 * 3)         # three buffers of 24-bit mono
+    buf = b"\x01" * 1024 * 3
+    for _ in range(3):
+        assert capture.callback(buf, 1024, {}, 0) == (None, PA_CONTINUE)
+    assert capture.stats.gap_free and capture.stats.peak_fill == len(buf) * 3
+
+    capture.callback(buf, 1024, {}, 0)              # ring full: dropped, not blocked
+    capture.callback(buf, 1024, {}, PA_INPUT_OVERFLOW | PA_INPUT_UNDERFLOW)
+    s = capture.stats
+    assert (s.buffers, s.frames) == (5, 5 * 1024)
+    assert (s.dropped_buffers, s.dropped_frames) == (2, 2048)
+    assert (s.input_overflows, s.input_underflows) == (1, 1)
+    assert (s.overruns, s.underruns) == (3, 1) and not s.gap_free
+    assert capture.drain() == buf * 3 and capture.drain(timeout=0.01) == b""
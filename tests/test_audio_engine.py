@@ -0,0 +1,158 @@
+"""Tests for the shared PortAudio host and output stream pool
+(vat/audio/engine.py)."""
+
+import threading
+
+import pytest
+
+from tests.conftest import make_wav
+
+
+class _FakeOutput:
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+        self.written = 0
+        self.active = True
+        self.closed = False
+
+    def write(self, data):
+        self.written += len(data)
+
+    def start_stream(self):
+        self.active = True
+
+    def stop_stream(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakePyAudio:
+    """Stands in for both the pyaudio module and a PyAudio host."""
+
+    def __init__(self, int24_input=True):
+        self.int24_input = int24_input
+        self.hosts = 0
+        self.terminated = 0
+        self.opened = []
+        self.format_checks = 0
+
+    def PyAudio(self):
+        self.hosts += 1
+        return self
+
+    def get_format_from_width(self, width):
+        return width
+
+    def get_device_count(self):
+        return 2
+
+    def get_device_info_by_index(self, i):
+        return {"index": i, "name": f"dev{i}"}
+
+    def get_default_input_device_info(self):
+        return {"index": 0}
+
+    def is_format_supported(self, rate, input_format=None, **kwargs):
+        self.format_checks += 1
+        if input_format == 3 and not self.int24_input:
+            raise ValueError("Invalid sample format")
+        return True
+
+    def open(self, **kwargs):
+        self.opened.append(_FakeOutput(kwargs))
+        return self.opened[-1]
+
+    def terminate(self):
+        self.terminated += 1
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    from vat.audio import engine
+    pa = FakePyAudio()
+    monkeypatch.setattr(engine, "_shared_engine", engine.AudioEngine(pa))
+    return pa
+
+
+def _play(path):
+    from vat.audio import playback
+    worker = playback.AudioPlaybackWorker(path)
+    errors = []
+    worker.error.connect(errors.append)
+    worker.run()
+    assert errors == []
+
+
+def test_playbacks_share_one_host_and_reuse_the_output_stream(fake, tmp_path, monkeypatch):
+    from vat.audio import playback
+    monkeypatch.setattr(playback, "PYAUDIO_AVAILABLE", True)
+    prompt = str(tmp_path / "prompt.wav")
+    sfx = str(tmp_path / "ding.wav")
+    make_wav(prompt, seconds=0.1)
+    make_wav(sfx, seconds=0.05, rate=44100, sampwidth=2)
+    for path in (prompt, prompt, sfx, sfx, prompt):
+        _play(path)
+    assert fake.hosts == 1 and fake.terminated == 0
+    # One stream per format, each stopped (not closed) between sounds.
+    assert len(fake.opened) == 2
+    assert [s.kwargs["rate"] for s in fake.opened] == [48000, 44100]
+    assert not any(s.closed or s.active for s in fake.opened)
+    assert fake.opened[0].written == 3 * 4800 * 3
+
+
+def test_input_format_support_is_cached_and_drives_the_fallback(monkeypatch):
+    from vat.audio import engine, recording
+    pa = FakePyAudio(int24_input=False)
+    eng = engine.AudioEngine(pa)
+    for _ in range(3):
+        stream, width = recording.open_input_stream(eng, lambda *a: None)
+        assert width == 2 and stream.kwargs["format"] == 2 and stream.kwargs["input"]
+    assert pa.format_checks == 1 and len(pa.opened) == 3
+    assert [d["name"] for d in eng.devices()] == ["dev0", "dev1"]
+
+
+def test_shutdown_closes_the_pool_and_terminates_portaudio(fake):
+    from vat.audio.engine import shared_audio_engine
+    eng = shared_audio_engine()
+    a = eng.acquire_output(2, 1, 44100)
+    b = eng.acquire_output(2, 1, 44100)                 # a is busy: a second stream
+    a.release()
+    b.release()                                         # pool keeps one per format
+    assert eng.idle_count() == 1 and b.stream.closed and not a.stream.closed
+    eng.shutdown()
+    assert a.stream.closed and fake.terminated == 1 and eng.idle_count() == 0
+    c = eng.acquire_output(2, 1, 44100)                 # starts PortAudio again
+    assert fake.hosts == 2 and c.stream is fake.opened[-1]
+
+
+def test_a_draining_stream_does_not_hold_up_the_next_sound():
+    from vat.audio.engine import AudioEngine
+    eng = AudioEngine(FakePyAudio())
+    draining = eng.acquire_output(3, 1, 48000)
+    drained = threading.Event()
+    draining.stream.stop_stream = drained.wait        # queued audio still playing
+    t = threading.Thread(target=draining.release)
+    t.start()
+    try:
+        # Acquiring on another thread would deadlock if stop ran under the lock.
+        acquired = []
+        other = threading.Thread(target=lambda: acquired.append(eng.acquire_output(2, 1, 44100)))
+        other.start()
+        other.join(2.0)
+        assert acquired and eng.idle_count() == 0
+    finally:
+        drained.set()
+        t.join()
+    assert eng.idle_count() == 1
+    acquired[0].release()
+
+
+def test_engine_without_pyaudio_is_unavailable():
+    from vat.audio.engine import AudioEngine
+    eng = AudioEngine()
+    eng._pa = None
+    assert not eng.available
+    with pytest.raises(RuntimeError):
+        eng.host()
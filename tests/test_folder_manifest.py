@@ -0,0 +1,97 @@
+"""Tests for folder manifests (vat/utils/folder_manifest.py) and
+FolderAccessManager.reopen_folder()."""
+
+import os
+
+import pytest
+
+from tests.conftest import age_dirs, make_image, make_wav, wait_until
+
+
+@pytest.fixture
+def kit(media_folder):
+    images = os.path.join(media_folder, "images")
+    os.mkdir(images)
+    make_image(os.path.join(images, "cat.png"))
+    make_wav(os.path.join(images, "cat.png.wav"))
+    make_wav(os.path.join(media_folder, "ant.wav"))
+    with open(os.path.join(media_folder, "metadata.txt"), "w") as f:
+        f.write("kit")
+    age_dirs(media_folder)
+    return media_folder
+
+
+@pytest.fixture
+def root(tmp_path_factory):
+    # Not under tmp_path: that is the kit folder itself.
+    return str(tmp_path_factory.mktemp("manifests"))
+
+
+def test_manifest_round_trips_the_index(kit, root):
+    from vat.utils.folder_manifest import load_manifest, manifest_path, save_manifest
+    from vat.utils.fs_access import FolderAccessManager
+    from vat.utils.media_index import scan_folder
+    index = scan_folder(kit, FolderAccessManager.VIDEO_EXTS, FolderAccessManager.IMAGE_EXTS)
+    assert load_manifest(kit, root) is None
+    assert save_manifest(index, root)
+
+    loaded = load_manifest(kit, root)
+    for name in ("videos", "images", "wavs", "subfolder_wavs", "metadata", "recordings", "dir_mtimes", "dir_keys"):
+        assert getattr(loaded, name) == getattr(index, name), name
+    assert loaded.is_current()
+    assert loaded.has_wav(os.path.join(kit, "images", "cat.png.wav"))
+
+    with open(manifest_path(kit, root), "w") as f:
+        f.write("{not json")
+    assert load_manifest(kit, root) is None
+
+
+def test_reopen_uses_a_current_manifest_without_scanning(qapp, kit, root, monkeypatch):
+    from vat.utils import fs_access
+    from vat.utils.fs_access import FolderAccessManager
+    first = FolderAccessManager(manifest_dir=root)
+    assert first.set_folder(kit)
+    expected = first.list_all_media()
+
+    def no_scan(*_args, **_kwargs):
+        raise AssertionError("folder was rescanned")
+    monkeypatch.setattr(fs_access, "scan_folder", no_scan)
+    fs = FolderAccessManager(manifest_dir=root)
+    folders = []
+    fs.folderChanged.connect(folders.append)
+    assert fs.reopen_folder(kit)
+    assert folders == [kit] and not fs.is_scanning()
+    assert fs.list_all_media() == expected
+    assert fs.has_recording(os.path.join(kit, "images", "cat.png"), refresh=False)
+
+
+def test_reopen_shows_a_stale_manifest_then_reconciles(qapp, kit, root):
+    from vat.utils.fs_access import FolderAccessManager
+    FolderAccessManager(manifest_dir=root).set_folder(kit)
+    os.remove(os.path.join(kit, "zebra.png"))
+    make_image(os.path.join(kit, "yak.png"))
+    make_wav(os.path.join(kit, "yak.png.wav"))
+    age_dirs(kit)
+
+    fs = FolderAccessManager(manifest_dir=root)
+    seen = {"images": [], "added": [], "removed": [], "recordings": [], "done": []}
+    fs.imagesUpdated.connect(lambda _f, imgs: seen["images"].append(list(imgs)))
+    fs.mediaAdded.connect(seen["added"].extend)
+    fs.mediaRemoved.connect(seen["removed"].extend)
+    fs.recordingsChanged.connect(seen["recordings"].extend)
+    fs.scanFinished.connect(lambda f, _errors: seen["done"].append(f))
+    assert fs.reopen_folder(kit)
+    # The saved listing is shown straight away, before the rescan finishes.
+    assert fs.current_folder == kit and fs.is_scanning()
+    assert os.path.join(kit, "zebra.png") in seen["images"][0]
+    assert wait_until(qapp, lambda: seen["done"])
+
+    assert len(seen["images"]) == 1
+    assert seen["added"] == [os.path.join(kit, "yak.png")]
+    assert seen["removed"] == [os.path.join(kit, "zebra.png")]
+    assert seen["recordings"] == [os.path.join(kit, "yak.png.wav")]
+    # The manifest now matches the folder again.
+    again = FolderAccessManager(manifest_dir=root)
+    again.reopen_folder(kit)
+    assert not again.is_scanning() and os.path.join(kit, "yak.png") in again.list_images()
+    fs.cancel_scan(wait=True)
@@ -0,0 +1,84 @@
+"""Tests for incremental folder updates: FolderWatcher
+(vat/utils/folder_watcher.py), FolderAccessManager.rescan_changes and the
+row patching in the Videos, Images and All views."""
+
+import os
+
+from tests.conftest import make_image, make_video, make_wav, wait_until
+
+
+def test_rescan_reports_added_removed_and_recordings(qapp, fs, media_folder):
+    seen = {"added": [], "removed": [], "recordings": []}
+    fs.mediaAdded.connect(lambda p: seen["added"].extend(p))
+    fs.mediaRemoved.connect(lambda p: seen["removed"].extend(p))
+    fs.recordingsChanged.connect(lambda p: seen["recordings"].extend(p))
+    make_image(os.path.join(media_folder, "cat.png"))
+    os.remove(os.path.join(media_folder, "ant.mp4"))
+    make_wav(os.path.join(media_folder, "bird.wav"))
+    fs.rescan_changes()
+    assert seen["added"] == [os.path.join(media_folder, "cat.png")]
+    assert seen["removed"] == [os.path.join(media_folder, "ant.mp4")]
+    assert seen["recordings"] == [os.path.join(media_folder, "bird.wav")]
+    # Reported once: a second rescan with no changes is silent.
+    fs.rescan_changes()
+    assert len(seen["added"]) == 1 and len(seen["recordings"]) == 1
+
+
+def test_watcher_collapses_a_burst_into_one_change(qapp, tmp_path):
+    from vat.utils.folder_watcher import FolderWatcher
+    watcher = FolderWatcher(debounce_ms=150, poll_ms=100)
+    hits = []
+    watcher.changed.connect(lambda: hits.append(1))
+    watcher.watch([str(tmp_path)])
+    for i in range(5):
+        make_wav(str(tmp_path / f"take{i}.wav"))
+    assert wait_until(qapp, lambda: hits)
+    wait_until(qapp, lambda: len(hits) > 1, timeout=0.5)
+    assert len(hits) == 1
+    watcher.stop()
+
+
+def test_views_patch_rows_instead_of_rebuilding(app_window, media_folder):
+    w = app_window
+    w.right_panel.setCurrentIndex(1)                 # Videos tab owns the drawer
+    resets = []
+    w.images_model.modelReset.connect(lambda: resets.append(1))
+    make_image(os.path.join(media_folder, "cat.png"))
+    make_video(os.path.join(media_folder, "cow.mp4"))
+    w.fs.rescan_changes()
+    assert [w.video_listbox.item(i).text() for i in range(w.video_listbox.count())] == \
+        ["ant.mp4", "bird.mp4", "cow.mp4"]
+    assert [os.path.basename(p) for p in w.images_model.paths()] == ["bird.jpg", "cat.png", "zebra.png"]
+    assert [os.path.basename(p) for p in w.all_tab.queue] == \
+        ["ant.mp4", "bird.jpg", "bird.mp4", "cat.png", "cow.mp4", "zebra.png"]
+
+    os.remove(os.path.join(media_folder, "cat.png"))
+    os.remove(os.path.join(media_folder, "ant.mp4"))
+    w.fs.rescan_changes()
+    assert [w.video_listbox.item(i).text() for i in range(w.video_listbox.count())] == ["bird.mp4", "cow.mp4"]
+    assert w.images_model.row_of(os.path.join(media_folder, "cat.png")) < 0
+    assert w.images_model.rowCount() == 2 and len(w.all_tab.queue) == 4
+    # Rows were inserted/removed one by one; the grid was never reset.
+    assert resets == []
+
+
+def test_converted_video_is_selected_when_it_appears(app_window, media_folder):
+    w = app_window
+    w.right_panel.setCurrentIndex(1)
+    make_video(os.path.join(media_folder, "new.mp4"))
+    w._reload_folder_and_select("new.mp4")
+    assert w.current_video == "new.mp4"
+    assert w.video_listbox.currentItem().text() == "new.mp4"
+    assert w._pending_select_video_name is None
+
+
+def test_all_tab_drawer_patches_rows_and_keeps_current(app_window, media_folder):
+    w = app_window
+    w.right_panel.setCurrentIndex(0)
+    w.all_tab.select_index(2)                        # bird.mp4
+    make_image(os.path.join(media_folder, "aardvark.png"))
+    w.fs.rescan_changes()
+    rows = [w.video_listbox.item(i).text() for i in range(w.video_listbox.count())]
+    assert rows[0] == "aardvark.png" and len(rows) == 5
+    assert os.path.basename(w.all_tab.current) == "bird.mp4" and w.all_tab.index == 3
+    assert w.video_listbox.currentRow() == 3
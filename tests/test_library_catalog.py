@@ -0,0 +1,107 @@
+"""Tests for the multi-kit library catalogue (vat/utils/library_catalog.py) and
+the Library dialog built on it."""
+
+import os
+
+import pytest
+
+from tests.conftest import age_dirs, make_image, make_video, make_wav, wait_until
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "library"
+    kit_a = root / "kitA"
+    kit_b = root / "group" / "kitB"
+    images_b = kit_b / "images"
+    for d in (kit_a, images_b, root / "notes"):
+        d.mkdir(parents=True)
+    make_video(str(kit_a / "ant.mp4"), frames=20, fps=10.0)
+    make_image(str(kit_a / "bird.jpg"))
+    make_wav(str(kit_a / "ant.wav"), seconds=0.5)
+    make_wav(str(kit_a / "bird.jpg.wav"), seconds=0.25)
+    make_image(str(images_b / "cat.png"))
+    make_image(str(images_b / "dog.png"))
+    make_wav(str(images_b / "cat.png.wav"), seconds=1.0)
+    (root / "notes" / "readme.txt").write_text("not a kit")
+    age_dirs(str(root))
+    return str(root)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    from vat.utils.library_catalog import LibraryCatalog
+    return LibraryCatalog(str(tmp_path / "catalog.sqlite3"))
+
+
+def test_scan_catalogues_every_kit_with_recordings_and_durations(library, catalog):
+    stats = catalog.scan(library)
+    assert stats.kits_scanned == 2
+    kits = {os.path.relpath(k.path, library): k for k in catalog.kits(library)}
+    assert set(kits) == {"kitA", os.path.join("group", "kitB")}
+    a, b = kits["kitA"], kits[os.path.join("group", "kitB")]
+    assert (a.media_count, a.recorded_count, a.video_count, a.image_count) == (2, 2, 1, 1) and a.complete
+    assert a.recorded_seconds == pytest.approx(0.75)
+    assert a.media_seconds == pytest.approx(2.0, abs=0.2)
+    assert (b.media_count, b.recorded_count) == (2, 1) and b.completion == 0.5
+    assert [k.path for k in catalog.kits(library, incomplete_only=True)] == [b.path]
+    assert catalog.missing_recordings(b.path) == [os.path.join(b.path, "images", "dog.png")]
+    cat = catalog.media(b.path)[0]
+    assert cat.recording.endswith("cat.png.wav") and cat.recording_duration == pytest.approx(1.0)
+
+
+def test_rescan_only_revisits_changed_directories(library, catalog, monkeypatch):
+    from vat.utils import library_catalog
+    catalog.scan(library)
+    probed = []
+    real_probe = library_catalog.video_duration
+    monkeypatch.setattr(library_catalog, "video_duration", lambda p: probed.append(p) or real_probe(p))
+
+    stats = catalog.scan(library)
+    assert stats.dirs_listed == 0 and stats.kits_scanned == 0 and probed == []
+
+    # A new recording in kitB's images/ folder: only kitB is re-indexed.
+    kit_b = os.path.join(library, "group", "kitB")
+    make_wav(os.path.join(kit_b, "images", "dog.png.wav"))
+    stats = catalog.scan(library)
+    assert stats.dirs_listed == 0 and stats.kits_scanned == 1 and probed == []
+    assert catalog.kit(kit_b).complete
+
+    # A new kit folder is found through its (changed) parent; a deleted one is dropped.
+    new_kit = os.path.join(library, "group", "kitC")
+    os.mkdir(new_kit)
+    make_video(os.path.join(new_kit, "eel.mp4"))
+    for name in os.listdir(os.path.join(library, "kitA")):
+        os.remove(os.path.join(library, "kitA", name))
+    os.rmdir(os.path.join(library, "kitA"))
+    stats = catalog.scan(library)
+    assert stats.kits_removed == 1 and probed == [os.path.join(new_kit, "eel.mp4")]
+    assert [os.path.relpath(k.path, library) for k in catalog.kits(library)] == [
+        os.path.join("group", "kitB"), os.path.join("group", "kitC")]
+
+
+def test_cli_scans_and_lists_incomplete_kits(library, tmp_path, capsys):
+    from vat.utils.library_catalog import main
+    db = str(tmp_path / "cli.sqlite3")
+    assert main(["--db", db, "scan", library]) == 0
+    assert "2 kit(s) indexed" in capsys.readouterr().out
+    assert main(["--db", db, "kits", library, "--incomplete"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2 and lines[0].split()[0] == "1/2" and lines[0].endswith("kitB")
+    assert main(["--db", db, "missing", os.path.join(library, "group", "kitB")]) == 0
+    assert capsys.readouterr().out.strip().endswith("dog.png")
+
+
+def test_library_dialog_scans_in_background_and_opens_a_kit(qapp, library, catalog):
+    from vat.ui.library_dialog import LibraryDialog
+    dlg = LibraryDialog(catalog, library)
+    assert dlg.table.rowCount() == 0
+    assert dlg.start_scan()
+    assert wait_until(qapp, lambda: not dlg.is_scanning())
+    assert dlg.table.rowCount() == 2
+    dlg.incomplete_check.setChecked(True)
+    assert dlg.table.rowCount() == 1
+    dlg.table.selectRow(0)
+    dlg.open_selected()
+    assert dlg.selected_kit == os.path.join(library, "group", "kitB")
+    dlg.deleteLater()
@@ -0,0 +1,180 @@
+"""Tests for the one-pass folder index (vat/utils/media_index.py) behind the
+FolderAccessManager list helpers and recording lookups."""
+
+import os
+import time
+
+import pytest
+
+from tests.conftest import age_dirs, make_image, make_wav
+
+
+@pytest.fixture
+def kit(media_folder):
+    sub = os.path.join(media_folder, "images")
+    os.mkdir(sub)
+    make_image(os.path.join(sub, "cat.png"))
+    make_wav(os.path.join(sub, "cat.png.wav"))
+    make_wav(os.path.join(media_folder, "ant.wav"))
+    make_wav(os.path.join(media_folder, ".hidden.wav"))
+    with open(os.path.join(media_folder, "metadata.txt"), "w") as f:
+        f.write("kit")
+    age_dirs(media_folder, sub)
+    return media_folder
+
+
+def test_scan_builds_typed_sorted_index(kit):
+    from vat.utils.fs_access import FolderAccessManager
+    from vat.utils.media_index import scan_folder
+    idx = scan_folder(kit, FolderAccessManager.VIDEO_EXTS, FolderAccessManager.IMAGE_EXTS)
+    names = lambda paths: [os.path.relpath(p, kit) for p in paths]
+    assert names(idx.videos) == ["ant.mp4", "bird.mp4"]
+    assert names(idx.images) == ["bird.jpg", os.path.join("images", "cat.png"), "zebra.png"]
+    assert names(idx.wavs) == ["ant.wav"]
+    assert names(idx.subfolder_wavs) == [os.path.join("images", "cat.png.wav")]
+    assert idx.metadata == os.path.join(kit, "metadata.txt")
+    assert [os.path.basename(p) for p in idx.all_media()] == ["ant.mp4", "bird.jpg", "bird.mp4", "cat.png", "zebra.png"]
+
+
+def test_list_helpers_share_one_scan_until_the_folder_changes(qapp, kit, monkeypatch):
+    from vat.utils import media_index
+    from vat.utils.fs_access import FolderAccessManager
+    listed = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(media_index.os, "scandir", lambda p: (listed.append(p), real_scandir(p))[1])
+    fs = FolderAccessManager()
+    assert fs.set_folder(kit)
+    fs.list_videos(); fs.list_images(); fs.recordings_in(); fs.list_all_media()
+    assert sorted(listed) == sorted([kit, os.path.join(kit, "images")]), "folder listed more than once"
+
+    # A new file changes the directory mtime, so the next call rescans.
+    make_wav(os.path.join(kit, "bird.wav"))
+    assert [os.path.basename(p) for p in fs.recordings_in()] == ["ant.wav", "bird.wav"]
+    assert len(listed) == 4
+
+
+def test_recent_change_is_rescanned_until_two_scans_agree(kit):
+    from vat.utils.fs_access import FolderAccessManager
+    fs = FolderAccessManager()
+    idx = fs.media_index(kit)
+    assert idx.is_current()
+    make_wav(os.path.join(kit, "bird.wav"))
+    fresh = fs.media_index(kit)
+    # Changed within the racy window: not trusted yet...
+    assert fresh is not idx and not fresh.is_current()
+    # ...until a rescan sees the same directory mtimes.
+    again = fs.media_index(kit)
+    assert again is not fresh and again.settled and again.is_current()
+    assert fs.media_index(kit) is again
+
+
+def test_a_server_clock_ahead_of_ours_does_not_force_rescans(qapp, kit, monkeypatch):
+    from vat.utils import media_index
+    from vat.utils.fs_access import FolderAccessManager
+    ahead = time.time() + 3600                       # NAS clock an hour fast
+    os.utime(kit, (ahead, ahead))
+    scans = []
+    real_scan = media_index.scan_folder
+    monkeypatch.setattr("vat.utils.fs_access.scan_folder",
+                        lambda *a, **k: (scans.append(a[0]), real_scan(*a, **k))[1])
+    fs = FolderAccessManager()
+    assert fs.set_folder(kit)
+    for _ in range(5):
+        fs.refresh_recordings()
+        assert fs.has_recording(os.path.join(kit, "ant.mp4"), refresh=False)
+    # The first scan is in the "future"; the second agrees and settles it.
+    assert scans == [kit, kit] and fs.media_index().settled
+
+
+def test_recording_lookups_are_in_memory(qapp, kit, monkeypatch):
+    from vat.utils import fs_access, media_index
+    from vat.utils.fs_access import FolderAccessManager
+    fs = FolderAccessManager()
+    assert fs.set_folder(kit)
+    fs.refresh_recordings()
+
+    def _no_io(*_a, **_k):
+        raise AssertionError("recording lookup touched the disk")
+    monkeypatch.setattr(fs_access.os.path, "exists", _no_io)
+    monkeypatch.setattr(media_index.os, "stat", _no_io)
+    ant, bird = os.path.join(kit, "ant.mp4"), os.path.join(kit, "bird.mp4")
+    cat = os.path.join(kit, "images", "cat.png")
+    assert fs.has_recording(ant, refresh=False) and not fs.has_recording(bird, refresh=False)
+    assert fs.find_existing_image_audio(cat, refresh=False) == os.path.join(kit, "images", "cat.png.wav")
+    # The app records/deletes through note_recording, still without I/O.
+    fs.note_recording(os.path.join(kit, "bird.wav"))
+    fs.note_recording(os.path.join(kit, "ant.wav"), present=False)
+    assert fs.has_recording(bird, refresh=False) and not fs.has_recording(ant, refresh=False)
+
+
+def test_recording_status_lists_each_directory_once(qapp, kit, monkeypatch):
+    from vat.utils import media_index
+    from vat.utils.fs_access import FolderAccessManager
+    fs = FolderAccessManager()
+    assert fs.set_folder(kit)
+    make_image(os.path.join(kit, "owl.jpg"))
+    make_wav(os.path.join(kit, "owl.wav"))           # legacy "<stem>.wav" image name
+    listed = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(media_index.os, "scandir", lambda p: (listed.append(p), real_scandir(p))[1])
+    media = fs.list_all_media() + [os.path.join(kit, "owl.jpg")]
+    listed.clear()
+
+    statuses = fs.recording_status(media)
+    assert sorted(listed) == sorted([kit, os.path.join(kit, "images")])
+    found = {os.path.basename(st.media): st for st in statuses}
+    assert found["ant.mp4"].exists and found["ant.mp4"].size == os.path.getsize(os.path.join(kit, "ant.wav"))
+    assert found["ant.mp4"].mtime_ns == os.stat(os.path.join(kit, "ant.wav")).st_mtime_ns
+    assert found["cat.png"].wav == os.path.join(kit, "images", "cat.png.wav") and found["cat.png"].exists
+    assert not found["bird.mp4"].exists and found["bird.mp4"].wav == os.path.join(kit, "bird.wav")
+    assert not found["owl.jpg"].exists and found["owl.jpg"].wav == os.path.join(kit, "owl.jpg.wav")
+
+    # Legacy image names only with image_fallbacks; existence-only checks use the index.
+    listed.clear()
+    fs.refresh_recordings()
+    listed.clear()
+    owl = fs.recording_status([os.path.join(kit, "owl.jpg")], stat=False, image_fallbacks=True)[0]
+    assert owl.exists and owl.wav == os.path.join(kit, "owl.wav") and owl.size is None
+    assert listed == []
+
+
+def test_files_without_a_media_suffix_are_sniffed_once(qapp, kit, monkeypatch):
+    import shutil
+    from vat.utils import media_index
+    from vat.utils.fs_access import FolderAccessManager
+    shutil.copy(os.path.join(kit, "zebra.png"), os.path.join(kit, "scan0042"))
+    shutil.copy(os.path.join(kit, "ant.mp4"), os.path.join(kit, "clip.dat"))
+    shutil.copy(os.path.join(kit, "images", "cat.png"), os.path.join(kit, "images", "dog.bin"))
+    age_dirs(kit, os.path.join(kit, "images"))
+    sniffed = []
+    real_sniff = media_index.sniff_media_type
+    monkeypatch.setattr(media_index, "sniff_media_type", lambda p: sniffed.append(os.path.basename(p)) or real_sniff(p))
+
+    fs = FolderAccessManager()
+    assert fs.set_folder(kit)
+    assert sorted(sniffed) == ["clip.dat", "dog.bin", "scan0042"]   # not the WAVs, metadata or known suffixes
+    assert os.path.join(kit, "clip.dat") in fs.list_videos()
+    assert {os.path.join(kit, "scan0042"), os.path.join(kit, "images", "dog.bin")} <= set(fs.list_images())
+    assert fs.media_type_of(os.path.join(kit, "clip.dat")) == "video"
+    assert fs.media_type_of(os.path.join(kit, "scan0042")) == "image"
+    assert len(sniffed) == 3
+
+
+def test_a_sniffed_image_uses_the_image_recording_name(qapp, kit):
+    import shutil
+    from vat.utils.fs_access import FolderAccessManager
+    img = os.path.join(kit, "img.jfif")
+    shutil.copy(os.path.join(kit, "bird.jpg"), img)             # JPEG bytes, unknown suffix
+    make_wav(img + ".wav")
+    make_wav(os.path.join(kit, "img.wav"))                     # a same-stem video's take
+    age_dirs(kit)
+    fs = FolderAccessManager()
+    assert fs.set_folder(kit)
+    assert img in fs.list_images() and fs.media_type_of(img) == "image"
+    assert fs.recording_path_for(img) == fs.wav_path_for_image(img) == img + ".wav"
+    assert fs.recording_path_for("img.jfif") == img + ".wav"     # bare names too
+    assert fs.has_recording(img) and fs.has_image_audio(img)
+    assert img + ".wav" in fs.all_recordings_in()
+    assert os.path.join(kit, "img.wav") not in fs.all_recordings_in()
+    status = fs.recording_status([img, "img.jfif"])
+    assert all(st.exists and st.wav == img + ".wav" for st in status)
@@ -0,0 +1,89 @@
+"""Tests for MediaListModel (vat/utils/media_model.py) and the row-level
+updates of the Images grid, Review grid and drawer list built on it."""
+
+import os
+
+from tests.conftest import make_wav
+
+
+def _rows(*keys):
+    from vat.utils.media_model import MediaRow
+    return [MediaRow(k, "/kit/" + k) for k in keys]
+
+
+def _watch(model):
+    seen = []
+    model.rowsInserted.connect(lambda _p, first, last: seen.append(("insert", first, last)))
+    model.rowsRemoved.connect(lambda _p, first, last: seen.append(("remove", first, last)))
+    model.modelReset.connect(lambda: seen.append(("reset",)))
+    model.dataChanged.connect(lambda a, b, _roles=None: seen.append(("changed", a.row(), b.row())))
+    return seen
+
+
+def test_sync_rows_patches_and_resets_only_for_unrelated_listings(qapp):
+    from vat.utils.media_model import MediaListModel
+    model = MediaListModel()
+    model.set_rows(_rows("a", "c", "d"))
+    seen = _watch(model)
+    assert model.sync_rows(_rows("a", "b", "d"))
+    assert seen == [("remove", 1, 1), ("insert", 1, 1)]
+    assert model.keys() == ["a", "b", "d"] and model.row_of("d") == 2
+
+    seen.clear()
+    assert not model.sync_rows(_rows("x", "y"))
+    assert seen == [("reset",)]
+
+
+def test_thumbnail_and_recording_changes_touch_one_row(qapp):
+    from PySide6.QtGui import QIcon, QPixmap
+    from vat.utils.media_model import MediaListModel, RecordedRole
+    model = MediaListModel()
+    model.set_rows(_rows("a", "b", "c"))
+    seen = _watch(model)
+    model.set_thumbnail("/kit/b", QIcon(QPixmap(4, 4)))
+    assert seen == [("changed", 1, 1)] and model.has_thumbnail("/kit/b")
+
+    seen.clear()
+    assert model.refresh_recorded(lambda r: r.key == "c") == [2]
+    assert seen == [("changed", 2, 2)] and model.index(2).data(RecordedRole)
+    # Nothing flipped: nothing repaints.
+    seen.clear()
+    assert model.refresh_recorded(lambda r: r.key == "c") == [] and seen == []
+
+
+def test_new_image_recording_repaints_one_grid_cell(app_window, media_folder):
+    from vat.utils.media_model import RecordedRole
+    w = app_window
+    seen = _watch(w.images_model)
+    bird = os.path.join(media_folder, "bird.jpg")
+    make_wav(w.fs.wav_path_for_image(bird))
+    w.fs.rescan_changes()
+    row = w.images_model.row_of(bird)
+    assert seen == [("changed", row, row)]
+    assert w.images_model.index(row).data(RecordedRole)
+
+
+def test_drawer_recording_updates_one_row(app_window, media_folder):
+    w = app_window
+    w.right_panel.setCurrentIndex(1)                 # Videos tab owns the drawer
+    changed = []
+    w.video_listbox.model().dataChanged.connect(lambda a, b, _r=None: changed.append((a.row(), b.row())))
+    make_wav(os.path.join(media_folder, "bird.wav"))
+    w.fs.rescan_changes()
+    # ant.mp4 already had no recording; only bird.mp4's row changes.
+    assert changed and {r for pair in changed for r in pair} == {1}
+
+
+def test_review_grid_populate_keeps_existing_rows(qapp, fs, media_folder):
+    from vat.review.thumbnail_grid import ThumbnailGridWidget
+    grid = ThumbnailGridWidget(fs)
+    ant = ("ant", os.path.join(media_folder, "ant.mp4"), "")
+    bird = ("bird", os.path.join(media_folder, "bird.mp4"), "")
+    grid.populate([ant])
+    grid.list_widget.setCurrentIndex(grid.model.index(0))
+    seen = _watch(grid.model)
+    grid.populate([ant, bird])
+    assert seen == [("insert", 1, 1)]
+    assert grid.model.keys() == ["ant", "bird"]
+    assert grid.get_item_by_id("bird").row() == 1 and grid.list_widget.currentIndex().row() == 0
+    grid.cancel_thumbnails()
@@ -9,7 +9,7 @@ than desired behavior, it says so explicitly.
 import os
 import pytest
 
-from vat.utils.media_naming import media_type, recording_name_for
+from vat.utils.media_naming import media_type, media_type_of_bytes, recording_name_for
 from tests.conftest import make_wav
 
 
@@ -28,6 +28,35 @@ def test_media_type(name, expected):
     assert media_type(name) == expected
 
 
+def test_extension_tables_have_one_source():
+    from vat.utils import media_naming
+    from vat.utils.fs_access import FolderAccessManager
+    assert FolderAccessManager.VIDEO_EXTS is media_naming.VIDEO_EXTS
+    assert FolderAccessManager.IMAGE_EXTS is media_naming.IMAGE_EXTS
+    assert media_type(".mp4") == "video" and media_type("archive.tar.png") == "image"
+
+
+@pytest.mark.parametrize("head,expected", [
+    (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image"),
+    (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image"),
+    (b"GIF89a\x01\x00", "image"),
+    (b"II*\x00\x08\x00\x00\x00", "image"),
+    (b"BM\x36\x10\x00\x00\x00\x00\x00\x00\x36\x00", "image"),
+    (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image"),
+    (b"\x00\x00\x00\x18ftypheic\x00\x00", "image"),
+    (b"\x00\x00\x00\x18ftypisom\x00\x00", "video"),
+    (b"\x00\x00\x00\x14ftypqt  \x00\x00", "video"),
+    (b"RIFF\x24\x00\x00\x00AVI LIST", "video"),
+    (b"\x1a\x45\xdf\xa3\x01\x00", "video"),
+    (b"\x00\x00\x01\xba\x44\x00", "video"),
+    (b"RIFF\x24\x00\x00\x00WAVEfmt ", None),
+    (b"BMW service log", None),
+    (b"", None),
+])
+def test_media_type_of_bytes(head, expected):
+    assert media_type_of_bytes(head) == expected
+
+
 def test_recording_name_video_strips_extension():
     assert recording_name_for("clip01.mp4") == "clip01.wav"
     assert recording_name_for("clip01.mpg") == "clip01.wav"
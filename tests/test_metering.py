@@ -0,0 +1,80 @@
+"""Tests for recording level metering (vat/audio/metering.py) and the meter
+widget (vat/ui/level_meter.py)."""
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+
+def _pcm24(values):
+    return b"".join(int(v).to_bytes(3, "little", signed=True) for v in values)
+
+
+def test_decode_keeps_the_sign_of_24_and_16_bit_samples():
+    from vat.audio.metering import decode_pcm
+    values = [0, 1, -1, 2**23 - 1, -2**23, 70000, -70000]
+    assert decode_pcm(_pcm24(values), 3).tolist() == values
+    assert decode_pcm(_pcm24(values) + b"\x01", 3).tolist() == values    # partial sample
+    pcm16 = np.array([0, 1, -1, 32767, -32768], dtype="<i2")
+    assert decode_pcm(pcm16.tobytes(), 2).tolist() == pcm16.tolist()
+    with pytest.raises(ValueError):
+        decode_pcm(b"\x00", 1)
+
+
+def test_peak_rms_and_clipping_of_a_block():
+    from vat.audio.metering import InputMeter
+    half = 2**22
+    meter = InputMeter(3, 1000, interval=0.01)                          # 10 frames per update
+    assert meter.feed(_pcm24([half, -half] * 4)) is None                # 8 frames: not yet
+    levels = meter.feed(_pcm24([2**23 - 1, -2**23]))
+    assert levels.frames == 10 and levels.clipped == 2 and levels.clipped_total == 2
+    assert levels.peak == pytest.approx(1.0)
+    assert levels.rms == pytest.approx(math.sqrt((8 * 0.25 + 2) / 10), rel=1e-5)
+    assert levels.peak_db == pytest.approx(0.0, abs=1e-3)
+    quiet = meter.feed(_pcm24([0] * 10))
+    assert quiet.peak == 0.0 and quiet.rms_db == -60.0
+    assert quiet.clipped == 0 and quiet.clipped_total == 2
+
+
+def test_sixteen_bit_clipping_is_counted_at_both_rails():
+    from vat.audio.metering import InputMeter
+    meter = InputMeter(2, 48000)
+    block = np.zeros(2400, dtype="<i2")
+    block[[3, 7, 9]] = [32767, -32768, 32766]                           # the last is just below
+    levels = meter.feed(block.tobytes())
+    assert levels.clipped == 2 and levels.peak == pytest.approx(1.0)
+
+
+def test_updates_are_throttled_to_the_interval():
+    from vat.audio.metering import InputMeter
+    meter = InputMeter(3, 48000)                                         # 2400 frames per update
+    chunk = _pcm24([1000] * 1024)
+    updates = [meter.feed(chunk) for _ in range(47)]                     # about 1 s of audio
+    # An update needs 2400 frames, i.e. every third 1024-frame chunk.
+    assert [i for i, u in enumerate(updates) if u is not None] == list(range(2, 47, 3))
+
+
+def test_metering_is_cheap_at_48_khz():
+    from vat.audio.metering import InputMeter
+    meter = InputMeter(3, 48000)
+    chunk = np.random.default_rng(1).integers(0, 256, 1024 * 3, dtype=np.uint8).tobytes()
+    start = time.perf_counter()
+    for _ in range(470):                                                 # 10 s of audio
+        meter.feed(chunk)
+    # 1% of a core would be 100 ms; stay well under it even on slow CI.
+    assert time.perf_counter() - start < 0.1
+
+
+def test_meter_widget_latches_the_clip_light(qapp):
+    from vat.audio.metering import Levels
+    from vat.ui.level_meter import LevelMeterWidget
+    w = LevelMeterWidget()
+    w.resize(160, 14)
+    w.set_levels(Levels(peak=1.0, rms=0.5, clipped=3, clipped_total=3))
+    w.set_levels(Levels(peak=0.1, rms=0.05, clipped=0, clipped_total=3))
+    assert w.clipped and "Clipped samples: 3" in w.toolTip()
+    w.grab()                                                             # paints without error
+    w.reset()
+    assert not w.clipped and w.toolTip() == ""
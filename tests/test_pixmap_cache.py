@@ -0,0 +1,47 @@
+"""Tests for the byte-budgeted pixmap cache (vat/utils/pixmap_cache.py)."""
+
+from tests.conftest import make_image
+
+
+def _pix(qapp, w=100, h=100):
+    from PySide6.QtGui import QPixmap, QColor
+    pix = QPixmap(w, h)
+    pix.fill(QColor(0, 0, 0))
+    return pix
+
+
+def test_tiers_are_bounded_independently_and_evict_lru(qapp):
+    from vat.utils.pixmap_cache import PixmapCache, pixmap_cost, TIER_FULL, TIER_THUMB
+    one = pixmap_cost(_pix(qapp))
+    cache = PixmapCache(max_bytes=one * 12)   # thumb tier: 3 entries, full tier: 9
+    for i in range(4):
+        cache.put(f"t{i}", _pix(qapp), TIER_THUMB)
+    assert cache.get("t0", TIER_THUMB) is None, "oldest thumbnail should have been evicted"
+    assert cache.get("t3", TIER_THUMB) is not None
+    for i in range(9):
+        cache.put(f"f{i}", _pix(qapp), TIER_FULL)
+    cache.get("f0", TIER_FULL)                # most recently used now
+    cache.put("f9", _pix(qapp), TIER_FULL)
+    assert cache.get("f0", TIER_FULL) is not None
+    assert cache.get("f1", TIER_FULL) is None
+    stats = cache.stats()
+    assert stats[TIER_THUMB]["bytes"] <= stats[TIER_THUMB]["budget"]
+    assert stats[TIER_FULL]["count"] == 9
+    assert stats[TIER_FULL]["hits"] == 2 and stats[TIER_FULL]["misses"] == 1
+    # Larger than the whole tier: refused rather than flushing everything.
+    assert not cache.put("huge", _pix(qapp, 1000, 1000), TIER_THUMB)
+    cache.set_max_bytes(0)
+    assert cache.stats()[TIER_FULL]["count"] == 0
+
+
+def test_folder_change_drops_full_size_previews(qapp, app_window, tmp_path):
+    from vat.utils.pixmap_cache import TIER_FULL
+    w = app_window
+    img = w.fs.list_images()[0]
+    assert w._load_image_pixmap(img) is not None
+    assert w._pixmap_cache.get(img, TIER_FULL) is not None
+    other = tmp_path / "other_kit"
+    other.mkdir()
+    make_image(str(other / "cat.png"))
+    w.fs.set_folder(str(other))
+    assert w._pixmap_cache.get(img, TIER_FULL) is None
@@ -0,0 +1,173 @@
+"""Tests for the always-armed input and its pre-roll (vat/audio/preroll.py)."""
+
+import threading
+import wave
+
+import pytest
+
+
+class _FakeStream:
+    """Input stream whose callbacks the test delivers with push()."""
+
+    def __init__(self, callback, started=True):
+        self.callback = callback
+        self.started = started
+        self.closed = False
+        # Buffers the "device" delivers the moment the stream starts.
+        self.on_start = []
+
+    def push(self, value, frames=1024, sample_width=3):
+        self.callback(bytes([value]) * frames * sample_width, frames, {}, 0)
+
+    def start_stream(self):
+        self.started = True
+        for value in self.on_start:
+            self.push(value)
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pyaudio(monkeypatch):
+    from vat.audio import engine, recording
+
+    class FakePyAudio:
+        def __init__(self):
+            self.hosts = 0
+            self.streams = []
+            self.on_start = []
+
+        def PyAudio(self):
+            self.hosts += 1
+            return self
+
+        def get_format_from_width(self, width):
+            return width
+
+        def get_default_input_device_info(self):
+            return {"index": 0}
+
+        def is_format_supported(self, rate, **kwargs):
+            return True
+
+        def open(self, stream_callback=None, start=True, **kwargs):
+            stream = _FakeStream(stream_callback, started=start)
+            stream.on_start = list(self.on_start)
+            self.streams.append(stream)
+            return stream
+
+        def terminate(self):
+            pass
+
+    fake = FakePyAudio()
+    monkeypatch.setattr(recording, "PYAUDIO_AVAILABLE", True)
+    monkeypatch.setattr(engine, "_shared_engine", engine.AudioEngine(fake))
+    return fake
+
+
+def test_preroll_keeps_only_the_last_seconds(fake_pyaudio):
+    from vat.audio.preroll import ArmedInput
+    armed = ArmedInput(preroll_seconds=0.05)                  # 2400 frames = 3 buffers
+    assert armed.arm() and armed.arm() and fake_pyaudio.hosts == 1
+    stream = fake_pyaudio.streams[0]
+    for value in range(1, 11):
+        stream.push(value)
+    capture, sample_width = armed.start_take()
+    assert sample_width == 3 and capture.stats.preroll_frames == 3 * 1024
+    data = capture.drain()
+    assert data[0] == 8 and data[-1] == 10                    # oldest buffers dropped
+    assert armed.start_take() is None                         # one take at a time
+    stream.push(11)
+    assert capture.drain() == bytes([11]) * 3072 and capture.stats.frames == 1024
+    armed.end_take()
+    stream.push(12)
+    assert capture.drain() == b""                             # back to pre-roll duty
+    armed.disarm()
+    assert stream.closed and not armed.is_armed and armed.start_take() is None
+
+
+def test_a_take_starts_with_the_preroll_and_leaves_the_stream_open(tmp_path, fake_pyaudio):
+    from vat.audio import recording
+    from vat.audio.preroll import ArmedInput
+    armed = ArmedInput(preroll_seconds=0.5)
+    armed.arm()
+    stream = fake_pyaudio.streams[0]
+    for _ in range(10):
+        stream.push(1)
+    target = str(tmp_path / "clip.wav")
+    worker = recording.AudioRecordingWorker(target, journal_dir=str(tmp_path / "journal"),
+                                            armed_input=armed)
+
+    def speak():
+        for _ in range(5):
+            stream.push(2)
+        worker.stop()
+
+    t = threading.Timer(0.05, speak)
+    t.start()
+    worker.run()
+    t.join()
+    with wave.open(target, "rb") as wf:
+        assert wf.getnframes() == 15 * 1024
+        frames = wf.readframes(wf.getnframes())
+    assert frames[:3] == b"\x01\x01\x01" and frames[-3:] == b"\x02\x02\x02"
+    assert worker.stats.preroll_frames == 10 * 1024 and worker.stats.frames == 5 * 1024
+    # No new host or stream for the take; the device stays armed.
+    assert fake_pyaudio.hosts == 1 and len(fake_pyaudio.streams) == 1
+    assert armed.is_armed and not stream.closed
+    armed.disarm()
+
+
+def test_buffers_delivered_as_the_stream_starts_go_to_the_preroll(fake_pyaudio):
+    from vat.audio.preroll import ArmedInput
+    fake_pyaudio.on_start = [1, 2]
+    armed = ArmedInput(preroll_seconds=0.5)
+    assert armed.arm()
+    stream = fake_pyaudio.streams[0]
+    assert stream.started
+    capture, sample_width = armed.start_take()
+    assert capture.stats.preroll_frames == 2 * 1024
+    assert capture.drain() == bytes([1]) * 3072 + bytes([2]) * 3072
+    armed.end_take()
+    armed.set_preroll(0.02)                                   # one buffer is enough
+    for value in (3, 4, 5):
+        stream.push(value)
+    capture, _ = armed.start_take()
+    assert capture.drain() == bytes([5]) * 3072
+    armed.disarm()
+
+
+def test_unarmed_input_falls_back_to_a_stream_per_take(fake_pyaudio):
+    from vat.audio.preroll import ArmedInput
+    armed = ArmedInput()
+    assert armed.start_take() is None
+    assert ArmedInput(preroll_seconds=99).preroll_seconds == 10.0
+
+
+def test_app_arms_the_input_while_a_kit_is_loaded(app_window, fake_pyaudio):
+    w = app_window
+    assert not w.armed_input.is_armed                         # off by default
+    w.armed_input_enabled = True
+    w._update_armed_input()
+    assert w.armed_input.is_armed
+    w.armed_input_enabled = False
+    w._update_armed_input()
+    assert not w.armed_input.is_armed and fake_pyaudio.streams[0].closed
+
+
+def test_drawer_controls_arm_the_input_and_persist(app_window, fake_pyaudio):
+    w = app_window
+    w.preroll_spin.setValue(2.5)
+    w.armed_input_cb.setChecked(True)
+    assert w.armed_input.is_armed and w.armed_input.preroll_seconds == 2.5
+    w.armed_input_enabled = False
+    w.armed_input.set_preroll(1.0)
+    w.load_settings()
+    assert w.armed_input_enabled and w.armed_input.preroll_seconds == 2.5
+    assert w.armed_input_cb.isChecked() and w.preroll_spin.value() == 2.5
+    w.armed_input_cb.setChecked(False)
+    assert not w.armed_input.is_armed
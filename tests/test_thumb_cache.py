@@ -0,0 +1,191 @@
+"""Tests for the thumbnail pipeline: the persistent on-disk cache
+(vat/utils/thumb_cache.py) and the background loader (vat/utils/thumb_loader.py)."""
+
+import os
+import time
+
+import pytest
+
+from tests.conftest import make_image, wait_until
+
+
+def _thumb(qapp, w=64, h=48):
+    from PySide6.QtGui import QImage, QColor
+    img = QImage(w, h, QImage.Format_RGB32)
+    img.fill(QColor(10, 200, 10))
+    return img
+
+
+def test_roundtrip_and_key_includes_target_size(qapp, tmp_path):
+    from vat.utils.thumb_cache import ThumbnailCache
+    src = make_image(str(tmp_path / "a.jpg"))
+    cache = ThumbnailCache(root=str(tmp_path / "cache"))
+    assert cache.get(src, (240, 180)) is None
+    assert cache.put(src, (240, 180), _thumb(qapp)) is not None
+    got = cache.get(src, (240, 180))
+    assert got is not None and got.width() == 64
+    # A clearly different box is a different entry.
+    assert cache.get(src, (640, 480)) is None
+
+
+def test_modified_source_invalidates_entry(qapp, tmp_path):
+    from vat.utils.thumb_cache import ThumbnailCache
+    src = make_image(str(tmp_path / "a.jpg"))
+    cache = ThumbnailCache(root=str(tmp_path / "cache"))
+    cache.put(src, (240, 180), _thumb(qapp))
+    make_image(src, size=(80, 60))          # replace the file: new size/mtime
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert cache.get(src, (240, 180)) is None
+
+
+def test_lru_eviction_by_total_bytes(qapp, tmp_path):
+    from vat.utils.thumb_cache import ThumbnailCache
+    cache = ThumbnailCache(root=str(tmp_path / "cache"), max_bytes=10**9)
+    srcs = [make_image(str(tmp_path / f"{i}.png")) for i in range(4)]
+    for s in srcs:
+        cache.put(s, (128, 128), _thumb(qapp, 128, 128))
+    per_entry = cache.total_bytes() // 4
+    # Touch the first entry so it becomes most-recently used.
+    past = time.time() - 100
+    for root, _dirs, files in os.walk(cache.root):
+        for f in files:
+            os.utime(os.path.join(root, f), (past, past))
+    assert cache.get(srcs[0], (128, 128)) is not None
+    cache.max_bytes = per_entry * 3
+    cache.put(srcs[1], (256, 256), _thumb(qapp, 128, 128))
+    assert cache.total_bytes() <= cache.max_bytes
+    assert cache.get(srcs[0], (128, 128)) is not None, "most recently used entry was evicted"
+
+
+def test_load_thumbnail_decodes_once_and_returns_box_sized_image(qapp, tmp_path):
+    from vat.utils.thumb_cache import ThumbnailCache, load_thumbnail
+    from vat.utils.media_decode import read_image
+    src = make_image(str(tmp_path / "big.png"), size=(640, 480))
+    cache = ThumbnailCache(root=str(tmp_path / "cache"))
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return read_image(path)
+
+    first = load_thumbnail(src, (128, 96), loader, cache=cache)
+    assert first is not None and first.width() <= 128 and first.height() <= 128
+    again = load_thumbnail(src, (128, 96), loader, cache=cache)
+    assert again is not None
+    assert calls == [src]
+
+
+def _jpeg_with_exif(path, size, orientation=1, thumb=None):
+    """Write a JPEG whose EXIF carries ``orientation`` and, optionally, an
+    IFD1 preview (a PIL image). Pillow cannot write IFD1, so the TIFF block
+    is packed by hand (little-endian)."""
+    import io
+    import struct
+    from PIL import Image
+    thumb_bytes = b""
+    if thumb is not None:
+        buf = io.BytesIO()
+        thumb.save(buf, "JPEG")
+        thumb_bytes = buf.getvalue()
+    entry = lambda tag, typ, val: struct.pack("<HHII", tag, typ, 1, val)
+    ifd0_at = 8
+    ifd1_at = ifd0_at + 2 + 12 + 4
+    data_at = ifd1_at + 2 + 2 * 12 + 4
+    ifd0 = struct.pack("<H", 1) + struct.pack("<HHIHH", 0x0112, 3, 1, orientation, 0)
+    ifd0 += struct.pack("<I", ifd1_at if thumb_bytes else 0)
+    tiff = b"II*\x00" + struct.pack("<I", ifd0_at) + ifd0
+    if thumb_bytes:
+        tiff += struct.pack("<H", 2) + entry(0x0201, 4, data_at) + entry(0x0202, 4, len(thumb_bytes))
+        tiff += struct.pack("<I", 0) + thumb_bytes
+    Image.new("RGB", size, (200, 30, 30)).save(path, "JPEG", exif=b"Exif\x00\x00" + tiff)
+    return path
+
+
+def test_scaled_decode_fits_box_and_respects_orientation(qapp, tmp_path):
+    from vat.utils.media_decode import read_image_scaled
+    # Stored landscape, EXIF says rotate 90 degrees: displayed portrait.
+    src = _jpeg_with_exif(str(tmp_path / "rot.jpg"), (1600, 1200), orientation=6)
+    img = read_image_scaled(src, (256, 192))
+    assert img is not None
+    assert img.height() > img.width(), "EXIF orientation was not applied"
+    assert img.width() <= 256 and img.height() <= 192
+
+
+def test_scaled_decode_uses_large_enough_exif_preview(qapp, tmp_path):
+    from PIL import Image
+    from vat.utils.media_decode import read_image_scaled
+    preview = Image.new("RGB", (320, 240), (0, 0, 255))
+    src = _jpeg_with_exif(str(tmp_path / "p.jpg"), (1600, 1200), thumb=preview)
+    img = read_image_scaled(src, (256, 192))
+    assert (img.width(), img.height()) == (320, 240)
+    assert img.pixelColor(10, 10).blue() > 200, "embedded preview was not used"
+    # Too small for the requested box: fall back to a real decode.
+    big = read_image_scaled(src, (640, 480))
+    assert big.pixelColor(10, 10).red() > 150
+
+
+# --------------------------------------------------------------------------
+# Background loader
+# --------------------------------------------------------------------------
+
+@pytest.fixture
+def private_cache(tmp_path, monkeypatch):
+    """Point the shared cache at a temp dir so tests never touch ~/."""
+    from vat.utils import thumb_cache
+    cache = thumb_cache.ThumbnailCache(root=str(tmp_path / "shared"))
+    monkeypatch.setattr(thumb_cache, "_shared_cache", cache)
+    return cache
+
+
+def test_loader_delivers_thumbnails_on_gui_thread(qapp, tmp_path, private_cache):
+    from PySide6.QtCore import QSize
+    from vat.utils.thumb_loader import ThumbnailLoader
+    src = make_image(str(tmp_path / "big.png"), size=(800, 600))
+    loader = ThumbnailLoader()
+    got = {}
+    loader.thumbnailReady.connect(lambda p, img: got.setdefault(p, img))
+    loader.request(src, QSize(160, 120))
+    assert wait_until(qapp, lambda: src in got)
+    assert not got[src].isNull()
+    assert got[src].width() <= 192 and got[src].height() <= 128
+    assert private_cache.get(src, QSize(160, 120)) is not None, "decode was not written back to the cache"
+
+
+def test_loader_reset_discards_stale_results(qapp, tmp_path, private_cache):
+    from PySide6.QtCore import QSize
+    from vat.utils.thumb_loader import ThumbnailLoader
+    srcs = [make_image(str(tmp_path / f"{i}.png")) for i in range(8)]
+    loader = ThumbnailLoader(max_threads=1)
+    got = []
+    loader.thumbnailReady.connect(lambda p, _img: got.append(p))
+    for s in srcs:
+        loader.request(s, QSize(160, 120))
+    loader.reset()
+    assert loader.wait_for_done(5000)
+    wait_until(qapp, lambda: False, timeout=0.1)
+    assert got == []
+    assert loader.pending() == 0
+
+
+def test_images_grid_is_filled_in_the_background(qapp, app_window, private_cache):
+    from PySide6.QtCore import Qt
+    w = app_window
+    w._populate_images_list(w.fs.list_images())
+    loader = w._images_thumb_loader
+    assert wait_until(qapp, lambda: loader.pending() == 0)
+    for i in range(w.images_model.rowCount()):
+        icon = w.images_model.index(i).data(Qt.DecorationRole)
+        assert not icon.isNull()
+        assert icon.cacheKey() != w._empty_icon.cacheKey(), "placeholder icon was never replaced"
+
+
+def test_visible_row_range_covers_first_rows(qapp, app_window, private_cache):
+    from vat.utils.thumb_loader import visible_row_range
+    w = app_window
+    w.resize(1000, 700)
+    w.show()
+    w._populate_images_list(w.fs.list_images())
+    qapp.processEvents()
+    rows = visible_row_range(w.images_list)
+    assert rows is not None and rows[0] == 0
@@ -0,0 +1,185 @@
+"""Tests for the video package: poster frames (vat/video/poster.py), the
+playback decode thread (vat/video/decoder.py) and the shared capture pool
+(vat/video/captures.py)."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def private_cache(tmp_path, monkeypatch):
+    from vat.utils import thumb_cache
+    cache = thumb_cache.ThumbnailCache(root=str(tmp_path / "cache"))
+    monkeypatch.setattr(thumb_cache, "_shared_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def poster_settings():
+    from vat.video import poster
+    saved = poster.current_settings()
+    yield poster
+    poster.configure(*saved)
+
+
+def _fade_in_video(path, black=5, lit=5, size=(64, 48), fps=10.0):
+    import numpy as np
+    import cv2
+    vw = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    for _ in range(black):
+        vw.write(np.zeros((size[1], size[0], 3), np.uint8))
+    for _ in range(lit):
+        vw.write(np.full((size[1], size[0], 3), 180, np.uint8))
+    vw.release()
+    return path
+
+
+def test_poster_skips_black_opening_and_is_cached(qapp, tmp_path, private_cache, poster_settings, monkeypatch):
+    poster = poster_settings
+    poster.configure(offset_seconds=0, skip_black=True)
+    src = _fade_in_video(str(tmp_path / "fade.mp4"))
+    img = poster.poster_frame(src)
+    assert img is not None and img.pixelColor(10, 10).red() > 100, "black opening frame was used"
+
+    # Served from the disk cache: the video is not opened again.
+    def _no_capture(*_a, **_k):
+        raise AssertionError("video re-decoded despite cached poster")
+    monkeypatch.setattr(poster.cv2, "VideoCapture", _no_capture)
+    again = poster.poster_frame(src)
+    assert again is not None and again.size() == img.size()
+
+
+def test_poster_without_black_skip_uses_offset_frame(qapp, tmp_path, private_cache, poster_settings):
+    poster = poster_settings
+    src = _fade_in_video(str(tmp_path / "fade.mp4"))
+    poster.configure(offset_seconds=0, skip_black=False)
+    assert poster.poster_frame(src).pixelColor(10, 10).red() < 30
+    # A different setting is a different cache entry.
+    poster.configure(offset_seconds=0.7, skip_black=False)
+    assert poster.poster_frame(src).pixelColor(10, 10).red() > 100
+    # Offset beyond the end of the clip falls back to the start.
+    poster.configure(offset_seconds=60, skip_black=False)
+    assert poster.poster_frame(src) is not None
+
+
+def test_decode_thread_drops_instead_of_queueing(qapp, tmp_path):
+    import cv2
+    from PySide6.QtCore import QSize
+    from vat.video.decoder import VideoDecodeThread
+    src = _fade_in_video(str(tmp_path / "clip.mp4"), black=0, lit=20, fps=100.0)
+    t = VideoDecodeThread(cv2.VideoCapture(src), 100.0, target_size=QSize(32, 24), buffer_frames=2)
+    t.start()
+    assert t.wait(5000)
+    latest = t.take_latest()
+    assert latest is not None and latest.width() <= 32
+    assert t.at_end()
+    # Every frame was either decoded or, if already late, grabbed past.
+    assert t.decoded + t.clock.skipped == 20
+    # Nothing was consumed while decoding: all but the newest were dropped.
+    assert t.dropped == t.decoded - 1 and t.displayed == 1
+
+
+def test_clock_skips_late_frames_instead_of_slowing_down(qapp, tmp_path, monkeypatch):
+    import cv2
+    from vat.video import clock as clock_mod
+    from vat.video.clock import PlaybackClock, read_due
+    src = _fade_in_video(str(tmp_path / "clip.mp4"), black=0, lit=30, fps=10.0)
+    now = [100.0]
+    monkeypatch.setattr(clock_mod.time, "monotonic", lambda: now[0])
+    clock = PlaybackClock(10.0)
+    clock.start()
+    cap = cv2.VideoCapture(src)
+    ok, _frame, index = read_due(cap, 0, clock.due_frame(), clock)
+    assert ok and index == 0
+    clock.presented(index)
+    now[0] += 1.25                      # a 1.25 s stall: frames 1..11 are late
+    ok, _frame, index = read_due(cap, 1, clock.due_frame(), clock)
+    assert ok and index == 12 and clock.skipped == 11
+    clock.presented(index)
+    media, wall, speed = clock.speed()
+    assert abs(speed - 1.0) < 0.05
+    clock.pause()
+    now[0] += 5.0                       # paused time does not count
+    clock.resume()
+    assert clock.due_frame() == 12
+    cap.release()
+
+
+def test_frame_to_qimage_wraps_bgr_without_copying(qapp, tmp_path):
+    import gc
+    import numpy as np
+    import cv2
+    from vat.video.frames import FrameBufferPool, frame_to_qimage
+    frame = np.zeros((8, 10, 3), np.uint8)
+    frame[:, :] = (255, 0, 0)               # pure blue in BGR
+    img = frame_to_qimage(frame)
+    assert np.frombuffer(img.constBits(), np.uint8).ctypes.data == frame.ctypes.data
+    del frame
+    gc.collect()                            # the image keeps its buffer alive
+    c = img.pixelColor(3, 3)
+    assert (c.red(), c.green(), c.blue()) == (0, 0, 255)
+
+    src = _fade_in_video(str(tmp_path / "clip.mp4"), black=0, lit=6)
+    cap = cv2.VideoCapture(src)
+    pool = FrameBufferPool(2)
+    addrs = [pool.read(cap)[1].ctypes.data for _ in range(6)]
+    cap.release()
+    assert len(set(addrs)) == 2, "pooled buffers were not reused"
+
+
+def test_decode_thread_downscales_to_the_pane_with_cv2(qapp, tmp_path):
+    import cv2
+    from PySide6.QtCore import QSize
+    from vat.video.decoder import VideoDecodeThread
+    from vat.video.frames import resize_to_fit
+    src = _fade_in_video(str(tmp_path / "wide.mp4"), black=0, lit=3, size=(640, 360), fps=100.0)
+    t = VideoDecodeThread(cv2.VideoCapture(src), 100.0, target_size=QSize(200, 200))
+    t.start()
+    assert t.wait(5000)
+    img = t.take_latest()
+    assert img.width() == 200 and img.height() in (112, 113)   # aspect kept, fits the box
+    import numpy as np
+    frame = np.zeros((360, 640, 3), np.uint8)
+    assert resize_to_fit(frame, 640, 360) is frame      # already the right size: untouched
+
+
+def test_capture_pool_reuses_idle_handles_lru(qapp, tmp_path):
+    from vat.video.captures import VideoCaptureManager
+    clips = [_fade_in_video(str(tmp_path / f"c{i}.mp4"), black=0, lit=4) for i in range(3)]
+    mgr = VideoCaptureManager(max_idle=2)
+    a = mgr.acquire(clips[0])
+    assert a.isOpened() and a.read()[0] and a.position == 1
+    a.release()
+    again = mgr.acquire(clips[0])
+    assert again is a and a.position == 0 and mgr.opened == 1 and mgr.reused == 1
+    again.release()
+    for clip in clips[1:]:
+        mgr.acquire(clip).release()
+    # Pool holds two idle captures: the oldest (clip 0) was really closed.
+    assert mgr.idle_count() == 2 and not a.isOpened()
+    assert mgr.acquire(str(tmp_path / "missing.mp4")).isOpened() is False
+    mgr.close_all()
+    assert mgr.idle_count() == 0
+
+
+def test_decode_thread_detach_hands_off_positioned_capture(qapp, tmp_path):
+    import time
+    from vat.video.captures import VideoCaptureManager
+    from vat.video.decoder import VideoDecodeThread
+    from vat.ui.fullscreen import FullscreenVideoViewer
+    src = _fade_in_video(str(tmp_path / "clip.mp4"), black=0, lit=40, fps=10.0)
+    cap = VideoCaptureManager().acquire(src)
+    t = VideoDecodeThread(cap, 10.0)
+    t.start()
+    deadline = time.monotonic() + 5
+    while t.decoded < 3 and time.monotonic() < deadline:
+        t.msleep(10)
+    handed, start = t.detach()
+    assert handed is cap and handed.isOpened() and start == cap.position >= 3
+    viewer = FullscreenVideoViewer(src, capture=handed, start_frame=start)
+    try:
+        assert viewer.cap is handed and viewer._next_frame == start
+        assert viewer._clock.due_frame() >= start
+    finally:
+        viewer.close()
@@ -0,0 +1,76 @@
+"""Tests for viewport-driven thumbnails (vat/utils/viewport_thumbs.py) on a
+virtualised QListView grid of 10,000 rows."""
+
+import time
+
+import pytest
+from PySide6.QtCore import QSize
+
+
+@pytest.fixture
+def big_grid(qapp, tmp_path):
+    from PySide6.QtWidgets import QListView
+    from vat.utils.media_model import MediaListModel, MediaRow
+    from vat.utils.viewport_thumbs import ViewportThumbnails, UniformCellDelegate
+    model = MediaListModel()
+    view = QListView()
+    view.setModel(model)
+    view.setViewMode(QListView.IconMode)
+    view.setResizeMode(QListView.Adjust)
+    view.setMovement(QListView.Static)
+    view.setWrapping(True)
+    view.setUniformItemSizes(True)
+    view.setIconSize(QSize(160, 120))
+    view.setGridSize(QSize(180, 135))
+    view.setItemDelegate(UniformCellDelegate(view))
+    view.resize(800, 600)
+    thumbs = ViewportThumbnails(view, model)
+    requested, cancelled = [], []
+    thumbs.loader.request = lambda path, *_a, **_k: requested.append(path)
+    thumbs.loader.cancel = lambda path: (cancelled.append(path), True)[1]
+    rows = [MediaRow(p, p) for p in (str(tmp_path / f"{i:05d}.png") for i in range(10000))]
+    started = time.monotonic()
+    model.set_rows(rows)
+    view.show()
+    qapp.processEvents()
+    elapsed = time.monotonic() - started
+    yield view, model, thumbs, requested, cancelled, elapsed
+    view.close()
+
+
+def test_ten_thousand_rows_lay_out_quickly_and_request_only_the_window(big_grid):
+    view, model, thumbs, requested, _cancelled, elapsed = big_grid
+    assert elapsed < 2.0, f"listing 10k rows took {elapsed:.2f}s"
+    thumbs.update()
+    first, last, lo, hi = thumbs.window()
+    assert first == 0 and lo == 0
+    assert 0 < len(requested) == hi - lo + 1 < 200
+    assert model.row_at(9999).path not in requested
+
+
+def test_scrolling_moves_the_window_and_forgets_far_rows(qapp, big_grid):
+    from PySide6.QtGui import QIcon, QPixmap
+    view, model, thumbs, requested, cancelled, _elapsed = big_grid
+    thumbs.update()
+    early = list(requested)
+    icon = QIcon(QPixmap(4, 4))
+    for path in early:
+        model.set_thumbnail(path, icon)
+    requested.clear()
+
+    view.scrollToBottom()
+    qapp.processEvents()
+    thumbs.update()
+    first, last, lo, hi = thumbs.window()
+    assert last == 9999 and lo > 9000
+    assert requested and all(model.row_of(p) >= lo for p in requested)
+    # Jobs still queued for the top rows were withdrawn.
+    assert set(early) <= set(cancelled)
+    # Icons up there are dropped once the model holds far more than the window.
+    for path in requested:
+        model.set_thumbnail(path, icon)
+    for row in range(0, 400):
+        model.set_thumbnail(model.row_at(row).path, icon)
+    thumbs.update()
+    assert not model.has_thumbnail(model.row_at(0).path)
+    assert model.has_thumbnail(model.row_at(9999).path)
@@ -0,0 +1,130 @@
+"""Tests for the streaming WAV writer (vat/audio/wav_writer.py) and the
+recording worker that uses it."""
+
+import os
+import wave
+
+import pytest
+
+
+def _pcm(frames, sample_width=3, value=1):
+    return bytes([value]) * frames * sample_width
+
+
+def _read(path):
+    with wave.open(path, "rb") as wf:
+        return wf.getnchannels(), wf.getsampwidth(), wf.getframerate(), wf.getnframes()
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return str(tmp_path / "journal")
+
+
+def test_take_streams_to_a_partial_file_and_is_moved_on_close(tmp_path, journal):
+    from vat.audio.wav_writer import StreamingWavWriter
+    target = str(tmp_path / "clip.wav")
+    w = StreamingWavWriter(target, 1, 3, 48000, sync_seconds=0.01, journal_dir=journal)   # sync every 480 frames
+    for _ in range(5):
+        w.write(_pcm(1024))
+    # Mid-take the partial file is already a valid WAV up to the last sync.
+    assert not os.path.exists(target) and len(os.listdir(journal)) == 1
+    assert _read(w.partial_path) == (1, 3, 48000, 5 * 1024)
+    w.write(_pcm(7))
+    assert w.close()
+    assert _read(target) == (1, 3, 48000, 5 * 1024 + 7)
+    assert os.path.getsize(target) % 2 == 0            # odd data chunk is padded
+    assert not os.path.exists(w.partial_path) and os.listdir(journal) == []
+
+
+def test_an_empty_take_writes_nothing_and_keeps_the_old_one(tmp_path, journal):
+    from vat.audio.wav_writer import StreamingWavWriter
+    target = tmp_path / "clip.wav"
+    target.write_bytes(b"old take")
+    w = StreamingWavWriter(str(target), 1, 2, 48000, journal_dir=journal)
+    assert not w.close()
+    assert target.read_bytes() == b"old take" and not os.path.exists(w.partial_path)
+
+
+def test_interrupted_takes_are_recovered_from_their_length(tmp_path, journal):
+    from vat.audio.wav_writer import StreamingWavWriter, recover_interrupted_recordings
+    fresh = str(tmp_path / "ant.wav")
+    retake = tmp_path / "bird.jpg.wav"
+    retake.write_bytes(b"previous take")
+    writers = []
+    for path in (fresh, str(retake)):
+        w = StreamingWavWriter(path, 1, 3, 48000, journal_dir=journal)   # never syncs: header says 0
+        w.write(_pcm(1000))
+        w.write(b"\x01\x02")                         # a torn last frame
+        w._file.close()                              # the app dies here
+        writers.append(w)
+
+    recovered = recover_interrupted_recordings(journal)
+    assert sorted(recovered) == sorted([fresh, str(tmp_path / "bird.jpg.recovered.wav")])
+    assert all(_read(p) == (1, 3, 48000, 1000) for p in recovered)
+    assert retake.read_bytes() == b"previous take"
+    assert os.listdir(journal) == [] and not any(os.path.exists(w.partial_path) for w in writers)
+    assert recover_interrupted_recordings(journal) == []
+
+
+class _FakeStream:
+    """Delivers ``buffers`` callbacks from its own thread, like PortAudio."""
+
+    def __init__(self, worker, callback, buffers):
+        import threading
+        self.worker = worker
+        self.thread = threading.Thread(target=self._run, args=(callback, buffers))
+        self.thread.start()
+
+    def _run(self, callback, buffers):
+        import time
+        for i in range(buffers):
+            callback(_pcm(1024), 1024, {}, 0)
+            if i % 8 == 0:
+                time.sleep(0.005)
+        self.worker.stop()
+
+    def stop_stream(self):
+        self.thread.join()
+
+    def close(self):
+        pass
+
+
+def test_recording_worker_streams_the_take_to_disk(tmp_path, journal, monkeypatch):
+    from vat.audio import recording
+    target = str(tmp_path / "clip.wav")
+    worker = recording.AudioRecordingWorker(target, journal_dir=journal)
+
+    from vat.audio import engine
+
+    class FakePyAudio:
+        def PyAudio(self):
+            return self
+
+        def get_format_from_width(self, width):
+            return width
+
+        def get_default_input_device_info(self):
+            return {"index": 0}
+
+        def is_format_supported(self, rate, **kwargs):
+            return True
+
+        def open(self, stream_callback=None, **kwargs):
+            return _FakeStream(worker, stream_callback, 40)
+
+        def terminate(self):
+            pass
+
+    monkeypatch.setattr(recording, "PYAUDIO_AVAILABLE", True)
+    monkeypatch.setattr(engine, "_shared_engine", engine.AudioEngine(FakePyAudio()))
+    errors, stats, levels = [], [], []
+    worker.error.connect(errors.append)
+    worker.statsReady.connect(stats.append)
+    worker.levels.connect(levels.append)
+    worker.run()
+    assert errors == []
+    assert levels and all(lv.clipped_total == 0 for lv in levels)
+    assert _read(target) == (1, 3, recording.SAMPLE_RATE, 40 * recording.FRAMES_PER_BUFFER)
+    assert stats == [worker.stats] and worker.stats.gap_free and worker.stats.buffers == 40
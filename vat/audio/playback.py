@@ -1,7 +1,8 @@
 import wave
 import logging
 from PySide6.QtCore import QObject, Signal, Slot
-from . import pyaudio, PYAUDIO_AVAILABLE
+from . import PYAUDIO_AVAILABLE
+from .engine import shared_audio_engine
 
 class AudioPlaybackWorker(QObject):
     finished = Signal()
@@ -20,22 +21,18 @@ class AudioPlaybackWorker(QObject):
             return
         try:
             logging.info(f"AudioPlaybackWorker.run: start path={self.wav_path}")
-            p = pyaudio.PyAudio()
             wf = wave.open(self.wav_path, 'rb')
-            stream = p.open(
-                format=p.get_format_from_width(wf.getsampwidth()),
-                channels=wf.getnchannels(),
-                rate=wf.getframerate(),
-                output=True
-            )
-            data = wf.readframes(1024)
-            while data and not self.should_stop:
-                stream.write(data)
+            # A pooled stream on the shared host: no PortAudio start-up per sound
+            stream = shared_audio_engine().acquire_output(
+                wf.getsampwidth(), wf.getnchannels(), wf.getframerate())
+            try:
                 data = wf.readframes(1024)
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
-            wf.close()
+                while data and not self.should_stop:
+                    stream.write(data)
+                    data = wf.readframes(1024)
+            finally:
+                stream.release()
+                wf.close()
         except Exception as e:
             self.error.emit(f"Audio playback failed: {e}")
         finally:
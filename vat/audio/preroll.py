@@ -0,0 +1,137 @@
+"""Always-armed microphone input with a rolling pre-roll.
+
+Each take used to open a new PyAudio host and input stream when Record was
+clicked. Device start-up takes a few hundred milliseconds, and speakers
+often start talking at the click, so the first syllable was lost.
+
+``ArmedInput`` opens the input stream once (the app arms it while a kit is
+loaded, if the ``armed_input`` setting is on) and keeps it running. Between
+takes the stream callback keeps only the last ``preroll_seconds`` of audio.
+``start_take()`` hands AudioRecordingWorker a CaptureBuffer that begins with
+that pre-roll and is then fed live by the same callback. ``end_take()``
+returns the stream to pre-roll duty. Takes therefore begin up to
+``preroll_seconds`` before the click, with no device start-up in between.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Optional, Tuple
+
+from . import recording
+from .capture import CaptureBuffer, PA_CONTINUE, RING_SECONDS
+from .engine import shared_audio_engine
+
+PREROLL_SECONDS = 1.0
+# Longest pre-roll the setting may ask for.
+MAX_PREROLL_SECONDS = 10.0
+
+
+class ArmedInput:
+    """An open input stream that keeps a pre-roll between takes.
+
+    The PortAudio callback and start_take()/end_take() share one lock. It is
+    held only to append one buffer (to the pre-roll or the take's ring) or to
+    switch between them, so the callback never waits long, and no buffer
+    reaches a take after end_take() returns.
+    """
+
+    def __init__(self, preroll_seconds: float = PREROLL_SECONDS):
+        self.preroll_seconds = self._clamp(preroll_seconds)
+        self.sample_width = 0
+        self._engine = None
+        self._stream = None
+        self._lock = threading.Lock()
+        self._preroll: deque = deque()
+        self._preroll_bytes = 0
+        self._take: Optional[CaptureBuffer] = None
+
+    @property
+    def is_armed(self) -> bool:
+        return self._stream is not None
+
+    @staticmethod
+    def _clamp(seconds: float) -> float:
+        return min(MAX_PREROLL_SECONDS, max(0.0, float(seconds)))
+
+    def set_preroll(self, seconds: float) -> None:
+        """Change the pre-roll length; takes effect with the next buffer."""
+        with self._lock:
+            self.preroll_seconds = self._clamp(seconds)
+
+    def _frame_bytes(self) -> int:
+        return recording.CHANNELS * self.sample_width
+
+    def arm(self) -> bool:
+        """Open the input stream (if not already open). Returns is_armed."""
+        if self._stream is not None:
+            return True
+        if not recording.PYAUDIO_AVAILABLE:
+            return False
+        engine = shared_audio_engine()
+        stream = None
+        try:
+            # Opened stopped: the callback needs sample_width to size the pre-roll.
+            stream, sample_width = recording.open_input_stream(engine, self._callback, start=False)
+            self.sample_width = sample_width
+            stream.start_stream()
+        except Exception as e:
+            logging.warning(f"ArmedInput.arm: could not open the input device: {e}")
+            engine.close_stream(stream)
+            return False
+        self._engine, self._stream = engine, stream
+        logging.info(f"ArmedInput.arm: input armed, preroll={self.preroll_seconds}s, "
+                     f"sample_width={sample_width}")
+        return True
+
+    def disarm(self) -> None:
+        """Close the stream. A take still running keeps what it captured."""
+        stream, engine = self._stream, self._engine
+        self._stream = self._engine = None
+        if stream is not None:
+            engine.close_stream(stream)
+        with self._lock:
+            self._preroll.clear()
+            self._preroll_bytes = 0
+            self._take = None
+
+    def start_take(self) -> Optional[Tuple[CaptureBuffer, int]]:
+        """Begin a take: (capture buffer holding the pre-roll, sample width),
+        or None if the input is not armed or a take is already running."""
+        if self._stream is None:
+            return None
+        frame_bytes = self._frame_bytes()
+        seconds = RING_SECONDS + self.preroll_seconds
+        capture = CaptureBuffer(int(seconds * recording.SAMPLE_RATE) * frame_bytes)
+        with self._lock:
+            if self._take is not None:
+                return None
+            data = b"".join(self._preroll)
+            self._preroll.clear()
+            self._preroll_bytes = 0
+            capture.preload(data, len(data) // frame_bytes)
+            self._take = capture
+        return capture, self.sample_width
+
+    def end_take(self) -> None:
+        with self._lock:
+            self._take = None
+
+    def _callback(self, in_data, frame_count, time_info, status_flags):
+        """PyAudio stream callback (runs on PortAudio's thread)."""
+        with self._lock:
+            take = self._take
+            if take is not None:
+                return take.callback(in_data, frame_count, time_info, status_flags)
+            if in_data:
+                self._keep(in_data)
+            return None, PA_CONTINUE
+
+    def _keep(self, data: bytes) -> None:
+        # Whole buffers are kept, so the pre-roll is never shorter than asked
+        # and at most one buffer longer.
+        limit = int(self.preroll_seconds * recording.SAMPLE_RATE) * self._frame_bytes()
+        self._preroll.append(data)
+        self._preroll_bytes += len(data)
+        while self._preroll and self._preroll_bytes - len(self._preroll[0]) >= limit:
+            self._preroll_bytes -= len(self._preroll.popleft())
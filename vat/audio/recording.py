@@ -1,6 +1,11 @@
-import wave
+import logging
+from typing import Optional
 from PySide6.QtCore import QObject, Signal
-from . import pyaudio, PYAUDIO_AVAILABLE
+from . import PYAUDIO_AVAILABLE
+from .capture import CaptureBuffer, CaptureStats, RING_SECONDS
+from .engine import shared_audio_engine
+from .metering import InputMeter
+from .wav_writer import StreamingWavWriter
 
 # Archival capture format. Language-documentation archives follow the IASA
 # TC-04 preservation standard: uncompressed linear PCM WAV, 48 kHz, 24-bit.
@@ -10,80 +15,136 @@ from . import pyaudio, PYAUDIO_AVAILABLE
 SAMPLE_RATE = 48000
 CHANNELS = 1
 FRAMES_PER_BUFFER = 1024
+# Longest the worker sleeps waiting for audio (bounds stop() latency).
+DRAIN_TIMEOUT = 0.05
+
+def open_input_stream(engine, callback, start: bool = True):
+    """Open a callback-mode input stream on the shared ``engine``, 24-bit
+    when the device supports it and 16-bit otherwise. With ``start=False``
+    the stream is opened stopped.
+
+    Returns (stream, sample_width_bytes)."""
+    widths = (3, 2) if engine.input_supports(3, SAMPLE_RATE, CHANNELS) else (2,)
+    for width in widths:
+        try:
+            return engine.open_input(width, SAMPLE_RATE, CHANNELS, FRAMES_PER_BUFFER, callback,
+                                     start=start), width
+        except Exception:
+            if width == widths[-1]:
+                raise
 
 class AudioRecordingWorker(QObject):
+    """Records the microphone to ``wav_path`` until stop() is called.
+
+    PortAudio (the shared host in engine.py) delivers audio in callback mode
+    into a ring buffer (see capture.py); this worker's thread drains the ring
+    and streams it to disk (see wav_writer.py), so a take's length is not limited by RAM and
+    survives a crash. If recording fails part-way, the audio captured so far
+    is still saved. ``stats`` (also sent with statsReady before finished)
+    counts overruns and underruns, so a take can be shown to be gap-free.
+    While recording, ``levels`` carries metering.Levels (peak, RMS, clipped
+    samples) about 20 times a second for a level meter.
+
+    With an armed ``armed_input`` (see preroll.py) the take uses its already
+    open stream and starts with its pre-roll, so nothing said just before
+    Record was clicked is lost; otherwise a stream is opened for the take.
+    """
     finished = Signal()
     error = Signal(str)
+    statsReady = Signal(object)
+    levels = Signal(object)
 
-    def __init__(self, wav_path: str):
+    def __init__(self, wav_path: str, journal_dir: Optional[str] = None, armed_input=None):
         super().__init__()
         self.wav_path = wav_path
+        self.journal_dir = journal_dir
+        self.armed_input = armed_input
         self.should_stop = False
-        self.frames = []
-
-    def _open_stream(self, p):
-        """Open an input stream, preferring 24-bit and falling back to 16-bit.
-
-        Returns (stream, sample_width_bytes)."""
-        try:
-            stream = p.open(
-                format=pyaudio.paInt24,
-                channels=CHANNELS,
-                rate=SAMPLE_RATE,
-                input=True,
-                frames_per_buffer=FRAMES_PER_BUFFER,
-            )
-            return stream, 3
-        except Exception:
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=CHANNELS,
-                rate=SAMPLE_RATE,
-                input=True,
-                frames_per_buffer=FRAMES_PER_BUFFER,
-            )
-            return stream, 2
+        self.stats: Optional[CaptureStats] = None
+        self.clipped_samples = 0
 
     def run(self):
         if not PYAUDIO_AVAILABLE:
             self.error.emit("PyAudio is not available")
             self.finished.emit()
             return
-        p = None
+        engine = shared_audio_engine()
         stream = None
+        writer = None
+        armed = None
+        capture = None
         try:
-            p = pyaudio.PyAudio()
-            stream, sample_width = self._open_stream(p)
+            take = self.armed_input.start_take() if self.armed_input is not None else None
+            if take is not None:
+                armed = self.armed_input
+                capture, sample_width = take
+            else:
+                # Sized for the widest format; allocated before the stream starts.
+                capture = CaptureBuffer(RING_SECONDS * SAMPLE_RATE * CHANNELS * 3)
+                stream, sample_width = open_input_stream(engine, capture.callback)
+            writer = StreamingWavWriter(self.wav_path, CHANNELS, sample_width, SAMPLE_RATE,
+                                        journal_dir=self.journal_dir)
+            meter = InputMeter(sample_width, SAMPLE_RATE, CHANNELS)
             while not self.should_stop:
-                data = stream.read(FRAMES_PER_BUFFER, exception_on_overflow=False)
-                self.frames.append(data)
-            stream.stop_stream()
-            stream.close()
-            stream = None
-            p.terminate()
-            p = None
-            if self.frames:
-                wf = wave.open(self.wav_path, 'wb')
-                wf.setnchannels(CHANNELS)
-                wf.setsampwidth(sample_width)
-                wf.setframerate(SAMPLE_RATE)
-                wf.writeframes(b''.join(self.frames))
-                wf.close()
+                data = capture.drain(DRAIN_TIMEOUT)
+                writer.write(data)
+                self._meter(meter, data)
+            if armed is not None:
+                # The stream stays open for the next take's pre-roll.
+                armed.end_take()
+                armed = None
+            else:
+                engine.close_stream(stream)
+                stream = None
+            writer.write(capture.drain())
+            writer.close()
+            writer = None
         except Exception as e:
             self.error.emit(f"Recording failed: {e}")
         finally:
             try:
-                if stream is not None:
-                    stream.stop_stream()
-                    stream.close()
+                if armed is not None:
+                    armed.end_take()
             except Exception:
                 pass
             try:
-                if p is not None:
-                    p.terminate()
+                engine.close_stream(stream)
             except Exception:
                 pass
+            try:
+                if writer is not None:
+                    writer.write(capture.drain())
+                    writer.close()
+            except Exception:
+                pass
+            self._report(capture.stats if capture is not None else CaptureStats())
             self.finished.emit()
 
+    def _meter(self, meter: InputMeter, data: bytes) -> None:
+        # Metering must never cost the take.
+        try:
+            levels = meter.feed(data)
+        except Exception:
+            return
+        if levels is not None:
+            self.clipped_samples = levels.clipped_total
+            self.levels.emit(levels)
+
+    def _report(self, stats: CaptureStats) -> None:
+        self.stats = stats
+        try:
+            msg = (f"Recording stats: path={self.wav_path}, frames={stats.frames}, "
+                   f"preroll_frames={stats.preroll_frames}, "
+                   f"overflows={stats.input_overflows}, underflows={stats.input_underflows}, "
+                   f"dropped_buffers={stats.dropped_buffers}, peak_fill={stats.peak_fill}, "
+                   f"clipped_samples={self.clipped_samples}")
+            if stats.gap_free:
+                logging.info(msg)
+            else:
+                logging.warning(msg + " (take has gaps)")
+        except Exception:
+            pass
+        self.statsReady.emit(stats)
+
     def stop(self):
         self.should_stop = True
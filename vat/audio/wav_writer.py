@@ -0,0 +1,227 @@
+"""Streaming, crash-safe WAV writer for microphone takes.
+
+AudioRecordingWorker used to keep every buffer of a take in a list and write
+the WAV only when recording stopped. A 30-minute narrative at 48 kHz/24-bit
+(about 260 MB) sat in RAM, was briefly doubled by the final join, and was
+lost entirely if the app crashed or the power went.
+
+``StreamingWavWriter`` appends PCM to ``<target>.partial`` as it arrives.
+Every ``sync_seconds`` of audio it patches the RIFF and data chunk sizes in
+the header and flushes the file to disk, so after a crash the partial file
+is a valid WAV up to the last sync, and its length tells how much more was
+written. ``close()`` patches the header a last time and renames the partial
+file over the target. An earlier take of the same item is therefore only
+replaced once the new one is complete.
+
+While a take is open, a small marker in ``~/.videooralannotation/recordings``
+names the partial file and its target. ``recover_interrupted_recordings``
+runs at startup and finishes every take whose marker survived a crash: the
+header is rebuilt from the file length and the file is moved to its target,
+or next to it as ``<name>.recovered.wav`` if a take already exists there.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import time
+from typing import List, Optional
+
+HEADER_BYTES = 44
+PARTIAL_SUFFIX = ".partial"
+# Audio written between header patches (and fsyncs).
+SYNC_SECONDS = 2.0
+
+
+def default_journal_dir() -> str:
+    return os.path.join(os.path.expanduser("~/.videooralannotation"), "recordings")
+
+
+def _header(channels: int, sample_width: int, rate: int, data_bytes: int) -> bytes:
+    """Canonical 44-byte PCM WAV header (the layout the wave module writes)."""
+    block_align = channels * sample_width
+    riff_bytes = 36 + data_bytes + (data_bytes & 1)
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_bytes, b"WAVE",
+        b"fmt ", 16, 1, channels, rate, rate * block_align, block_align, sample_width * 8,
+        b"data", data_bytes,
+    )
+
+
+def _patch_sizes(f, data_bytes: int) -> None:
+    f.seek(4)
+    f.write(struct.pack("<I", 36 + data_bytes + (data_bytes & 1)))
+    f.seek(40)
+    f.write(struct.pack("<I", data_bytes))
+    f.seek(0, os.SEEK_END)
+
+
+def _marker_path(journal_dir: str, path: str) -> str:
+    key = hashlib.sha1(os.path.abspath(path).encode("utf-8", "surrogatepass")).hexdigest()
+    return os.path.join(journal_dir, f"{key}.json")
+
+
+class StreamingWavWriter:
+    """Write a PCM WAV incrementally to ``<path>.partial``; ``close()`` moves
+    it to ``path``. Not thread-safe: one writer per recording thread."""
+
+    def __init__(self, path: str, channels: int, sample_width: int, rate: int,
+                 sync_seconds: float = SYNC_SECONDS, journal_dir: Optional[str] = None):
+        self.path = path
+        self.partial_path = path + PARTIAL_SUFFIX
+        self.channels = int(channels)
+        self.sample_width = int(sample_width)
+        self.rate = int(rate)
+        self.data_bytes = 0
+        self._synced_bytes = 0
+        self._sync_bytes = max(1, int(sync_seconds * self.rate)) * self.channels * self.sample_width
+        self._marker: Optional[str] = None
+        self._file = open(self.partial_path, "wb")
+        try:
+            self._file.write(_header(self.channels, self.sample_width, self.rate, 0))
+            self._write_marker(journal_dir or default_journal_dir())
+        except Exception:
+            self._file.close()
+            self._remove(self.partial_path)
+            raise
+
+    @property
+    def frames_written(self) -> int:
+        return self.data_bytes // (self.channels * self.sample_width)
+
+    def _write_marker(self, journal_dir: str) -> None:
+        try:
+            os.makedirs(journal_dir, exist_ok=True)
+            marker = _marker_path(journal_dir, self.path)
+            with open(marker, "w", encoding="utf-8") as f:
+                json.dump({"path": os.path.abspath(self.path),
+                           "partial": os.path.abspath(self.partial_path),
+                           "started": time.time()}, f)
+            self._marker = marker
+        except OSError as e:
+            # The take still streams to disk; it just cannot be recovered
+            # automatically after a crash.
+            logging.warning(f"StreamingWavWriter: no recovery marker for {self.path}: {e}")
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        self._file.write(data)
+        self.data_bytes += len(data)
+        if self.data_bytes - self._synced_bytes >= self._sync_bytes:
+            self.sync()
+
+    def sync(self) -> None:
+        """Patch the header sizes and flush everything written so far to disk."""
+        _patch_sizes(self._file, self.data_bytes)
+        self._file.flush()
+        try:
+            os.fsync(self._file.fileno())
+        except OSError:
+            pass
+        self._synced_bytes = self.data_bytes
+
+    def close(self) -> bool:
+        """Finish the take. Returns False (and writes nothing) if no audio was
+        written, as the old in-memory writer did."""
+        if self._file.closed:
+            return os.path.exists(self.path)
+        if self.data_bytes == 0:
+            self.abort()
+            return False
+        if self.data_bytes & 1:
+            self._file.write(b"\x00")
+        self.sync()
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+        self._remove(self._marker)
+        return True
+
+    def abort(self) -> None:
+        """Discard the take (partial file and marker)."""
+        if not self._file.closed:
+            self._file.close()
+        self._remove(self.partial_path)
+        self._remove(self._marker)
+
+    @staticmethod
+    def _remove(path: Optional[str]) -> None:
+        if not path:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _recovered_name(path: str) -> str:
+    stem = path[:-4] if path.lower().endswith(".wav") else path
+    candidate = f"{stem}.recovered.wav"
+    n = 2
+    while os.path.exists(candidate):
+        candidate = f"{stem}.recovered-{n}.wav"
+        n += 1
+    return candidate
+
+
+def recover_wav(partial: str, path: str) -> Optional[str]:
+    """Turn an interrupted ``partial`` take into a valid WAV for ``path``.
+
+    Sizes in the header are rebuilt from the file length (cut to whole
+    frames). Returns where the take was saved, or None if it held no audio
+    or was not a WAV written by StreamingWavWriter.
+    """
+    try:
+        with open(partial, "r+b") as f:
+            header = f.read(HEADER_BYTES)
+            if len(header) < HEADER_BYTES or header[:4] != b"RIFF" or header[8:16] != b"WAVEfmt " \
+                    or header[36:40] != b"data":
+                return None
+            block_align = struct.unpack_from("<H", header, 32)[0] or 1
+            size = os.fstat(f.fileno()).st_size
+            data_bytes = (size - HEADER_BYTES) // block_align * block_align
+            if data_bytes <= 0:
+                f.close()
+                os.remove(partial)
+                return None
+            f.truncate(HEADER_BYTES + data_bytes)
+            if data_bytes & 1:
+                f.seek(0, os.SEEK_END)
+                f.write(b"\x00")
+            _patch_sizes(f, data_bytes)
+        dest = path if not os.path.exists(path) else _recovered_name(path)
+        os.replace(partial, dest)
+        return dest
+    except OSError as e:
+        logging.warning(f"recover_wav: could not recover {partial}: {e}")
+        return None
+
+
+def recover_interrupted_recordings(journal_dir: Optional[str] = None) -> List[str]:
+    """Finish every take left open by a crash; returns the recovered WAVs."""
+    journal_dir = journal_dir or default_journal_dir()
+    recovered: List[str] = []
+    try:
+        markers = [e.path for e in os.scandir(journal_dir) if e.name.endswith(".json")]
+    except OSError:
+        return recovered
+    for marker in markers:
+        try:
+            with open(marker, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            partial, path = entry["partial"], entry["path"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"recover_interrupted_recordings: bad marker {marker}: {e}")
+            partial = path = None
+        if partial and os.path.exists(partial):
+            dest = recover_wav(partial, path)
+            if dest:
+                logging.info(f"Recovered interrupted recording: {dest}")
+                recovered.append(dest)
+        try:
+            os.remove(marker)
+        except OSError:
+            pass
+    return recovered
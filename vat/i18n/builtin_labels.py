@@ -19,6 +19,25 @@ LABELS_ALL = {
         "language_name": "English",
         "app_title": "Visual Stimulus Kit Tool",
         "select_folder": "Select Folder",
+        "folder_scanning": "{folder} — reading folder… ({count})",
+        "recovered_recordings_title": "Recordings Recovered",
+        "recovered_recordings_body": "These recordings were interrupted when the app last closed and have been saved:\n{files}",
+        "library_button": "Kit Library…",
+        "library_title": "Kit Library",
+        "library_root": "Library folder:",
+        "library_root_dialog": "Select Library Folder",
+        "library_browse": "Browse…",
+        "library_close": "Close",
+        "library_rescan": "Rescan",
+        "library_incomplete_only": "Only kits missing recordings",
+        "library_col_kit": "Kit",
+        "library_col_recorded": "Recorded",
+        "library_col_completion": "Complete",
+        "library_col_audio": "Audio",
+        "library_open_kit": "Open Kit",
+        "library_summary": "{count} kit(s), {done} complete",
+        "library_scanning": "Scanning…",
+        "library_scanning_kit": "Scanning {kit}…",
         "open_ocenaudio": "Open all Recordings in Ocenaudio (To Normalize, Trim, Edit...)",
         "export_wavs": "Export Recorded Data",
         "clear_wavs": "Clear Recorded Data",
@@ -106,6 +125,11 @@ LABELS_ALL = {
         "recording_indicator": "● Recording",
         "recording_started": "Recording started",
         "recording_stopped": "Recording stopped",
+        "recording_clipped": "The recording clipped ({count} samples at full scale); consider lowering the input level.",
+        "level_meter_tooltip": "Peak {peak:.1f} dBFS, RMS {rms:.1f} dBFS",
+        "level_meter_clipped": "Clipped samples: {count}",
+        "armed_input_toggle": "Keep microphone armed (pre-roll)",
+        "preroll_seconds_label": "Pre-roll:",
         "video_fullscreen_tip": "<b>Tip:</b> Double-click the video to open fullscreen. Use <b>+</b> and <b>-</b> to zoom in/out in fullscreen view.",
         "image_fullscreen_tip": "<b>Tip:</b> Double-click an image to open fullscreen. Use <b>+</b> and <b>-</b> to zoom in/out in fullscreen view.",
         "image_show_filenames": "Show filenames",
@@ -23,6 +23,7 @@ from vat.review.queue import ReviewQueue
 from vat.review.stats import ReviewStats
 from vat.review.yaml_exporter import YAMLExporter
 from vat.review.grouped_exporter import GroupedExporter
+from vat.video.captures import shared_capture_manager
 from vat.review.thumbnail_grid import ThumbnailGridWidget
 from vat.audio import PYAUDIO_AVAILABLE
 from vat.audio.playback import AudioPlaybackWorker
@@ -607,6 +608,15 @@ class ReviewTab(QWidget):
             self.fs.videosUpdated.connect(lambda *_args: self._refresh_grid())
         except Exception:
             pass
+        try:
+            # Watcher-driven changes: the grid shows one session page of
+            # recorded items, so rebuild that page (thumbnails come from the
+            # pixmap cache), but never under a running session.
+            self.fs.mediaAdded.connect(self._on_folder_contents_changed)
+            self.fs.mediaRemoved.connect(self._on_folder_contents_changed)
+            self.fs.recordingsChanged.connect(self._on_folder_contents_changed)
+        except Exception:
+            pass
 
         # Items per session slider → update grouping
         try:
@@ -676,6 +686,10 @@ class ReviewTab(QWidget):
         # Initial grouping UI population
         self._update_sessions_ui()
 
+    def _on_folder_contents_changed(self, _paths=None) -> None:
+        if not self.state.sessionActive:
+            self._refresh_grid()
+
     def _refresh_grid(self) -> None:
         """Populate the thumbnail grid with recorded items for current scope."""
         try:
@@ -727,7 +741,7 @@ class ReviewTab(QWidget):
         # Initialize stats
         self.stats.start_session()
         for item_id, media_path, wav_path in items:
-            media_type = "video" if media_path.lower().endswith(self.fs.VIDEO_EXTS) else "image"
+            media_type = "video" if self.fs.media_type_of(media_path) == "video" else "image"
             self.stats.add_item(item_id, media_type, media_path, wav_path)
         
         # Populate grid (already populated by _refresh_grid; refresh to ensure order matches queue)
@@ -937,6 +951,8 @@ class ReviewTab(QWidget):
         try:
             export_format = self.export_format_combo.currentText().lower()
             from vat.review.grouped_exporter import GroupedExporter
+            # Idle pooled video captures would keep moved files open.
+            shared_capture_manager().close_all()
             # Transform sessions to list of (media_path, wav_path) pairs
             session_pairs = [[(item["mediaPath"], item["wavPath"]) for item in chunk] for chunk in sessions]
             # Resolve set names for each session (fallback to "Set N")
@@ -1073,7 +1089,7 @@ class ReviewTab(QWidget):
         
         # Determine media type and show appropriate viewer
         try:
-            if media_path.lower().endswith(self.fs.VIDEO_EXTS):
+            if self.fs.media_type_of(media_path) == "video":
                 from vat.ui.fullscreen import FullscreenVideoViewer
                 viewer = FullscreenVideoViewer(media_path)
                 # Persist reference so the viewer isn't GC'd immediately
@@ -1231,27 +1247,25 @@ class ReviewTab(QWidget):
             pass
     
     def _get_recorded_items(self) -> List[Tuple[str, str, str]]:
-        """Get list of recorded items based on scope."""
+        """Get list of recorded items based on scope.
+
+        Existence checks are one batched ``recording_status`` call per media
+        type, answered from the folder index's recording set (the list calls
+        revalidate it), so a refresh does not stat every WAV.
+        """
         items = []
         scope = self.scope_combo.currentText().lower()
         
         if scope in ("images", "both"):
-            images = self.fs.list_images()
-            for img_path in images:
-                # Use compatibility resolver to find existing audio for image
-                wav_path = self.fs.find_existing_image_audio(img_path) or self.fs.wav_path_for_image(img_path)
-                if wav_path and os.path.exists(wav_path):
-                    item_id = f"img_{os.path.basename(img_path)}"
-                    items.append((item_id, img_path, wav_path))
+            # Legacy image names are accepted too (find_existing_image_audio rules)
+            for st in self.fs.recording_status(self.fs.list_images(), stat=False, image_fallbacks=True):
+                if st.exists:
+                    items.append((f"img_{os.path.basename(st.media)}", st.media, st.wav))
         
         if scope in ("videos", "both"):
-            videos = self.fs.list_videos()
-            for vid_path in videos:
-                name = os.path.basename(vid_path)
-                wav_path = self.fs.wav_path_for(name)
-                if os.path.exists(wav_path):
-                    item_id = f"vid_{name}"
-                    items.append((item_id, vid_path, wav_path))
+            for st in self.fs.recording_status(self.fs.list_videos(), stat=False):
+                if st.exists:
+                    items.append((f"vid_{os.path.basename(st.media)}", st.media, st.wav))
         
         return items
     
@@ -1618,6 +1632,11 @@ class ReviewTab(QWidget):
             self._stop_audio()
         except Exception:
             pass
+        try:
+            # Cancel queued thumbnail decodes
+            self.grid.cancel_thumbnails()
+        except Exception:
+            pass
         try:
             # Ensure persistent audio thread is quit and waited
             if self.audio_thread and self.audio_thread.isRunning():
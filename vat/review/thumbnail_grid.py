@@ -1,19 +1,19 @@
 """Thumbnail grid widget for Review Tab."""
 
-import os
 import sys
 from typing import Optional, List, Tuple
 from PySide6.QtWidgets import (
-    QWidget, QListWidget, QListWidgetItem, QListView,
-    QVBoxLayout, QSizePolicy, QStyle, QStyledItemDelegate,
+    QWidget, QListView, QAbstractItemView,
+    QVBoxLayout, QSizePolicy, QStyle,
     QApplication
 )
-from PySide6.QtCore import Qt, Signal, QSize, QRect, QPoint
-from PySide6.QtGui import QIcon, QPixmap, QPen, QColor, QImageReader, QImage
-import cv2
-import numpy as np
+from PySide6.QtCore import Qt, Signal, QSize, QRect, QPoint, QModelIndex
+from PySide6.QtGui import QPen, QColor
 
 from vat.utils.fs_access import FolderAccessManager
+from vat.utils.media_naming import media_type
+from vat.utils.media_model import MediaListModel, MediaRow, KeyRole, KindRole
+from vat.utils.viewport_thumbs import ViewportThumbnails, UniformCellDelegate
 
 
 class ThumbnailGridWidget(QWidget):
@@ -41,7 +41,6 @@ class ThumbnailGridWidget(QWidget):
         self.fs = fs_manager
         self._items: List[Tuple[str, str, str]] = []  # (item_id, media_path, wav_path)
         self._feedback_state: dict = {}  # item_id -> "correct" | "wrong"
-        self._pixmap_cache: dict = {}
         
         self._scale: float = 1.0
         self._init_ui()
@@ -51,7 +50,9 @@ class ThumbnailGridWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        self.list_widget = QListWidget()
+        self.model = MediaListModel(tooltips=True, parent=self)
+        self.list_widget = QListView()
+        self.list_widget.setModel(self.model)
         self.list_widget.setViewMode(QListView.IconMode)
         self.list_widget.setResizeMode(QListView.Adjust)
         self.list_widget.setFlow(QListView.LeftToRight)
@@ -61,22 +62,26 @@ class ThumbnailGridWidget(QWidget):
         self.list_widget.setSpacing(5)
         self.list_widget.setMovement(QListView.Static)
         self.list_widget.setWrapping(True)
-        self.list_widget.setUniformItemSizes(False)
+        # One size for every cell keeps layout O(1) per row for large kits
+        self.list_widget.setUniformItemSizes(True)
         self.list_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.list_widget.setSelectionMode(QListWidget.SingleSelection)
-        self.list_widget.setSelectionBehavior(QListWidget.SelectItems)
+        self.list_widget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.list_widget.setSelectionBehavior(QAbstractItemView.SelectItems)
         
-        # Install custom delegate for feedback overlays
-        self.list_widget.setItemDelegate(ReviewThumbnailDelegate(self))
+        # Install custom delegate for feedback overlays (parented to the view,
+        # which does not take ownership of its delegate)
+        self.list_widget.setItemDelegate(ReviewThumbnailDelegate(self, self.list_widget))
         
         # Connect signals (do not use itemActivated to avoid double-click -> confirm)
-        self.list_widget.currentItemChanged.connect(self._on_selection_changed)
-        self.list_widget.itemDoubleClicked.connect(self._on_double_click)
+        self.list_widget.selectionModel().currentChanged.connect(self._on_selection_changed)
+        self.list_widget.doubleClicked.connect(self._on_double_click)
         
         # Install event filter for right-click and modifier+click
         self.list_widget.viewport().installEventFilter(self)
         # Recompute layout on resize for auto-adjust columns
         self.list_widget.installEventFilter(self)
+        # Thumbnails are decoded only for rows in or near the viewport
+        self._thumbs = ViewportThumbnails(self.list_widget, self.model, parent=self)
         
         layout.addWidget(self.list_widget)
 
@@ -107,108 +112,54 @@ class ThumbnailGridWidget(QWidget):
             pass
     
     def populate(self, items: List[Tuple[str, str, str]]) -> None:
-        """Populate grid with recorded items.
-        
+        """Show the recorded items, patching the rows already on screen.
+
+        Items that stayed keep their row and thumbnail; only removed and new
+        items change. New rows start with empty icons; thumbnails are decoded
+        in the background for rows in or near the viewport, visible rows
+        first. A listing with nothing in common with the current one (another
+        folder or scope) resets the grid.
+
         Args:
             items: List of (item_id, media_path, wav_path) tuples
         """
         self._items = list(items)
-        self.list_widget.clear()
         self._feedback_state = {}
-        
-        icon_size = self.list_widget.iconSize()
-        
-        for item_id, media_path, wav_path in items:
-            name = os.path.basename(media_path)
-            # Do not show filename labels below thumbnails in Review tab
-            item = QListWidgetItem("")
-            item.setData(Qt.UserRole, item_id)
-            item.setData(Qt.UserRole + 1, media_path)
-            item.setData(Qt.UserRole + 2, wav_path)
-            # Mark kind for visual distinction (video vs image)
-            try:
-                lower = (media_path or "").lower()
-                is_video = any(lower.endswith(ext) for ext in getattr(self.fs, 'VIDEO_EXTS', ()))
-                item.setData(Qt.UserRole + 3, 'video' if is_video else 'image')
-            except Exception:
-                item.setData(Qt.UserRole + 3, 'image')
-            # Keep the name for accessibility via tooltip
-            try:
-                item.setToolTip(name)
-            except Exception:
-                pass
-            
-            # Load and cache thumbnail
-            try:
-                pix = self._load_pixmap(media_path)
-                if pix and not pix.isNull():
-                    thumb = pix.scaled(icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    item.setIcon(QIcon(thumb))
-            except Exception:
-                pass
-            
-            self.list_widget.addItem(item)
-        
-        if items:
-            self.list_widget.setCurrentRow(0)
-    
-    def _load_pixmap(self, path: str) -> Optional[QPixmap]:
-        """Load or retrieve cached pixmap for images or videos.
+        kind_of = self.fs.media_type_of if self.fs is not None else media_type
+        rows = [
+            MediaRow(item_id, media_path, wav_path or "",
+                     'video' if kind_of(media_path or "") == 'video' else 'image')
+            for item_id, media_path, wav_path in items
+        ]
+        current = self.list_widget.currentIndex()
+        current_id = current.data(KeyRole) if current.isValid() else None
+        if not self.model.sync_rows(rows):
+            # Drop any thumbnails still being decoded for the previous listing.
+            self._thumbs.reset()
+        row = self.model.row_of(current_id) if current_id else -1
+        if row < 0 and items:
+            row = 0
+        if row >= 0 and self.list_widget.currentIndex().row() != row:
+            self.list_widget.setCurrentIndex(self.model.index(row))
+        self._thumbs.update()
+        # Rows have no geometry until the first layout pass; look at the
+        # real viewport once it has run.
+        self._thumbs.schedule()
 
-        - Images: load via QPixmap/QImageReader
-        - Videos: generate thumbnail from first frame via OpenCV
-        """
-        if path in self._pixmap_cache:
-            return self._pixmap_cache[path]
+    def cancel_thumbnails(self) -> None:
+        """Drop queued thumbnail decodes and wait briefly for running ones."""
+        self._thumbs.cancel()
 
-        try:
-            lower = (path or "").lower()
-            is_video = any(lower.endswith(ext) for ext in getattr(self.fs, 'VIDEO_EXTS', ()))
-            if is_video:
-                # Generate video thumbnail from first frame
-                try:
-                    cap = cv2.VideoCapture(path)
-                    ret, frame = cap.read()
-                    cap.release()
-                    if ret and frame is not None:
-                        # BGR -> RGB
-                        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        h, w, _ = rgb.shape
-                        bytes_per_line = 3 * w
-                        qimg = QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-                        pix = QPixmap.fromImage(qimg)
-                        if pix and not pix.isNull():
-                            self._pixmap_cache[path] = pix
-                            return pix
-                except Exception:
-                    pass
-
-            # Fallback: treat as image
-            pix = QPixmap(path)
-            if pix.isNull():
-                reader = QImageReader(path)
-                img = reader.read()
-                if img and not img.isNull():
-                    pix = QPixmap.fromImage(img)
-
-            if pix and not pix.isNull():
-                self._pixmap_cache[path] = pix
-                return pix
-        except Exception:
-            pass
-
-        return None
-    
-    def _on_selection_changed(self, current, previous) -> None:
+    def _on_selection_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
         """Handle selection change."""
-        if current:
-            item_id = current.data(Qt.UserRole)
+        if current.isValid():
+            item_id = current.data(KeyRole)
             if item_id:
                 self.selectionChanged.emit(item_id)
     
-    def _on_double_click(self, item: QListWidgetItem) -> None:
+    def _on_double_click(self, index: QModelIndex) -> None:
         """Handle double-click for preview."""
-        item_id = item.data(Qt.UserRole)
+        item_id = index.data(KeyRole)
         if item_id:
             self.doubleClicked.emit(item_id)
     
@@ -235,13 +186,13 @@ class ThumbnailGridWidget(QWidget):
                      ((is_mac and event.modifiers() & Qt.MetaModifier) or
                       (not is_mac and event.modifiers() & Qt.ControlModifier)))):
                     
-                    item = self.list_widget.itemAt(event.pos())
-                    if item:
-                        item_id = item.data(Qt.UserRole)
+                    index = self.list_widget.indexAt(event.pos())
+                    if index.isValid():
+                        item_id = index.data(KeyRole)
                         if item_id:
                             # Select the item before confirming (instant select+confirm)
                             try:
-                                self.list_widget.setCurrentItem(item)
+                                self.list_widget.setCurrentIndex(index)
                             except Exception:
                                 pass
                             self.activatedConfirm.emit(item_id, "mouse")
@@ -255,9 +206,9 @@ class ThumbnailGridWidget(QWidget):
         if obj == self.list_widget.viewport() or obj == self.list_widget:
             if event.type() == event.Type.KeyPress:
                 if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-                    item = self.list_widget.currentItem()
-                    if item:
-                        item_id = item.data(Qt.UserRole)
+                    index = self.list_widget.currentIndex()
+                    if index.isValid():
+                        item_id = index.data(KeyRole)
                         if item_id:
                             self.activatedConfirm.emit(item_id, "keyboard")
                             return True
@@ -296,16 +247,13 @@ class ThumbnailGridWidget(QWidget):
             # Fallback: if anything goes wrong, clear all feedback
             self.clear_feedback()
     
-    def get_item_by_id(self, item_id: str) -> Optional[QListWidgetItem]:
-        """Get list item by item_id."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.UserRole) == item_id:
-                return item
-        return None
+    def get_item_by_id(self, item_id: str) -> Optional[QModelIndex]:
+        """Get the model index for item_id (None if not shown)."""
+        index = self.model.index_of(item_id)
+        return index if index.isValid() else None
 
 
-class ReviewThumbnailDelegate(QStyledItemDelegate):
+class ReviewThumbnailDelegate(UniformCellDelegate):
     """Custom delegate to draw feedback overlays on thumbnails."""
     
     def __init__(self, grid_widget: ThumbnailGridWidget, parent=None):
@@ -328,7 +276,7 @@ class ReviewThumbnailDelegate(QStyledItemDelegate):
 
         # Draw media type badge only for videos
         try:
-            kind = index.data(Qt.UserRole + 3) or 'image'
+            kind = index.data(KindRole) or 'image'
             if kind == 'video':
                 painter.save()
                 style = QApplication.style()
@@ -348,7 +296,7 @@ class ReviewThumbnailDelegate(QStyledItemDelegate):
             pass
 
         # Draw feedback overlay if present
-        item_id = index.data(Qt.UserRole)
+        item_id = index.data(KeyRole)
         if not item_id:
             return
 
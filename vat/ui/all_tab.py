@@ -15,24 +15,32 @@ used only for shared services (_launch_ocenaudio, status bar). In the default
 external_list mode this tab has NO file column of its own — the shared drawer
 list (the same one the Videos tab uses) drives it, listing videos AND images
 with recording check marks. The host keeps the two in sync via the
-queueChanged / selectionChanged / recordingChanged signals.
+queueChanged / selectionChanged / recordingChanged signals, and patches single
+drawer rows on rowInserted / rowRemoved when the folder watcher reports files
+appearing or disappearing (apply_media_changes).
 """
 
 from __future__ import annotations
 
 import os
 import math
+import bisect
 import logging
 from typing import List, Optional
 
 from PySide6.QtCore import Qt, QThread, QTimer, QEvent, Signal
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QToolButton,
     QListWidget, QListWidgetItem, QMessageBox, QStyle, QSizePolicy,
 )
 
 from vat.ui.fullscreen import FullscreenVideoViewer, FullscreenImageViewer
+from vat.ui.level_meter import LevelMeterWidget
+from vat.video.poster import poster_frame
+from vat.video.captures import shared_capture_manager
+from vat.video.clock import PlaybackClock, read_due
+from vat.video.frames import FrameBufferPool, frame_to_pixmap
 
 try:
     import cv2  # type: ignore
@@ -56,6 +64,8 @@ class AllMediaTab(QWidget):
     queueChanged = Signal()          # queue reloaded -> repopulate drawer list
     selectionChanged = Signal(int)   # current index changed -> sync drawer row
     recordingChanged = Signal()      # a recording was added/removed -> refresh check marks
+    rowInserted = Signal(int, str)   # one file appeared -> insert drawer row
+    rowRemoved = Signal(int)         # one file disappeared -> remove drawer row
 
     def __init__(self, fs, labels: Optional[dict] = None, host=None, parent=None,
                  external_list: bool = True):
@@ -73,10 +83,17 @@ class AllMediaTab(QWidget):
         self.queue: List[str] = []
         self.index: int = -1
         self.current: Optional[str] = None
+        # Folder the queue was listed from; same folder -> patch, not rebuild
+        self._queue_folder: Optional[str] = None
 
         # Video playback state
         self.cap = None
         self.playing_video = False
+        self._clock: Optional[PlaybackClock] = None
+        self._next_frame = 0
+        # Decoded frames and their label-size copies
+        self._frame_pool = FrameBufferPool(2)
+        self._scaled_pool = FrameBufferPool(2)
         self.video_timer = QTimer(self)
         self.video_timer.timeout.connect(self._update_video_frame)
 
@@ -190,6 +207,9 @@ class AllMediaTab(QWidget):
         self.status_label = QLabel("")
         self.status_label.setStyleSheet("color: red; font-weight: bold;")
         audio.addWidget(self.status_label)
+        self.level_meter = LevelMeterWidget(labels=self.labels)
+        self.level_meter.setVisible(False)
+        audio.addWidget(self.level_meter)
         audio.addStretch(1)
         right.addLayout(audio)
         right.addStretch()
@@ -198,13 +218,33 @@ class AllMediaTab(QWidget):
 
     # ---- queue / selection --------------------------------------------
     def refresh_queue(self, select_name: Optional[str] = None) -> None:
-        """Reload the merged media queue, preserving selection when possible."""
+        """Reload the merged media queue, preserving selection when possible.
+
+        For the folder already shown, only the files that came or went are
+        patched in (see apply_media_changes); the current item keeps playing.
+        """
         prev = select_name or self.current
         try:
-            self.queue = list(self.fs.list_all_media())
+            queue = list(self.fs.list_all_media())
         except Exception as e:
             logging.error(f"AllMediaTab.refresh_queue failed: {e}")
-            self.queue = []
+            queue = []
+        folder = self.fs.current_folder
+        if folder and folder == self._queue_folder and self.queue and queue:
+            listed = set(queue)
+            shown = set(self.queue)
+            removed = [p for p in self.queue if p not in listed]
+            added = [p for p in queue if p not in shown]
+            if removed or added:
+                self.apply_media_changes(added, removed)
+            if select_name and os.path.basename(self.current or "") != os.path.basename(select_name):
+                for i, p in enumerate(self.queue):
+                    if os.path.basename(p) == os.path.basename(select_name):
+                        self.select_index(i)
+                        break
+            return
+        self._queue_folder = folder
+        self.queue = queue
         if self.list_widget is not None:
             self.list_widget.blockSignals(True)
             self.list_widget.clear()
@@ -220,11 +260,7 @@ class AllMediaTab(QWidget):
             pass
 
         if not self.queue:
-            self.index = -1
-            self.current = None
-            self.preview_label.setText(self._L("video_listbox_no_video", "No media selected"))
-            self.preview_label.setStyleSheet(_NORMAL_BORDER)
-            self._update_controls()
+            self._show_empty()
             return
         target = 0
         if prev:
@@ -234,6 +270,70 @@ class AllMediaTab(QWidget):
                     break
         self.select_index(target)
 
+    def _show_empty(self) -> None:
+        self.index = -1
+        self.current = None
+        self.preview_label.setText(self._L("video_listbox_no_video", "No media selected"))
+        self.preview_label.setStyleSheet(_NORMAL_BORDER)
+        self._update_controls()
+
+    def apply_media_changes(self, added: List[str], removed: List[str]) -> None:
+        """Patch the queue for files that appeared or disappeared.
+
+        Unlike refresh_queue() this keeps the current item (and its playback)
+        untouched unless that item itself was removed.
+        """
+        current = self.current
+        current_row = None
+        for path in removed:
+            try:
+                row = self.queue.index(path)
+            except ValueError:
+                continue
+            del self.queue[row]
+            if self.list_widget is not None:
+                self.list_widget.blockSignals(True)
+                self.list_widget.takeItem(row)
+                self.list_widget.blockSignals(False)
+            self.rowRemoved.emit(row)
+            if path == current:
+                current_row = row
+        for path in added:
+            if path in self.queue or self.fs.media_type_of(path) is None:
+                continue
+            keys = [os.path.basename(p).lower() for p in self.queue]
+            row = bisect.bisect_right(keys, os.path.basename(path).lower())
+            self.queue.insert(row, path)
+            if self.list_widget is not None:
+                item = QListWidgetItem(os.path.basename(path))
+                item.setData(Qt.UserRole, path)
+                self.list_widget.blockSignals(True)
+                self.list_widget.insertItem(row, item)
+                self.list_widget.blockSignals(False)
+            self.rowInserted.emit(row, path)
+        if not self.queue:
+            if current is not None:
+                self._stop_all_for_switch()
+            self._show_empty()
+        elif current_row is not None or current is None:
+            # The item on screen is gone (or nothing was shown): take its neighbour.
+            self.select_index(min(current_row or 0, len(self.queue) - 1))
+        else:
+            self.index = self.queue.index(current)
+            if self.list_widget is not None and self.list_widget.currentRow() != self.index:
+                self.list_widget.blockSignals(True)
+                self.list_widget.setCurrentRow(self.index)
+                self.list_widget.blockSignals(False)
+            try:
+                self.selectionChanged.emit(self.index)
+            except Exception:
+                pass
+
+    def on_recordings_changed(self, wav_paths: List[str]) -> None:
+        """Refresh controls if the current item's recording came or went."""
+        if self.current and self.fs.recording_path_for(self.current) in wav_paths:
+            self._update_controls(refresh=False)
+
     def select_index(self, i: int) -> None:
         if i is None or i < 0 or i >= len(self.queue):
             return
@@ -300,32 +400,27 @@ class AllMediaTab(QWidget):
             self.preview_label.setText("Loading preview…")
 
     def _show_video_first_frame(self) -> None:
-        if not CV2_AVAILABLE:
-            self.preview_label.setText("Loading preview…")
-            return
-        cap = None
         try:
-            cap = cv2.VideoCapture(self.current)
-            if not cap.isOpened():
-                self.preview_label.setText("Loading preview…")
-                return
-            ret, frame = cap.read()
-            if not ret:
+            # Same cached poster frame as the Videos tab and Review grid
+            qt_image = poster_frame(self.current)
+            if qt_image is None or qt_image.isNull():
                 self.preview_label.setText("Loading preview…")
                 return
-            self.preview_label.setPixmap(self._frame_to_pixmap(frame))
+            self.preview_label.setPixmap(self._scaled(QPixmap.fromImage(qt_image)))
         except Exception as e:
             logging.error(f"AllMediaTab video first-frame failed: {e}")
             self.preview_label.setText("Loading preview…")
-        finally:
-            if cap is not None:
-                cap.release()
 
-    def _frame_to_pixmap(self, frame) -> QPixmap:
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame.shape
-        qt_image = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888).copy()
-        return self._scaled(QPixmap.fromImage(qt_image))
+    def _playback_pixmap(self, frame) -> QPixmap:
+        """Moving frames: fast cv2 resize to the label; smooth scaling is
+        kept for still (paused) frames."""
+        try:
+            target = self.preview_label.contentsRect().size()
+            if target.width() > 0 and target.height() > 0:
+                frame = self._scaled_pool.resize_to_fit(frame, target.width(), target.height())
+        except Exception:
+            pass
+        return frame_to_pixmap(frame)
 
     def _scaled(self, pixmap: QPixmap) -> QPixmap:
         try:
@@ -360,13 +455,17 @@ class AllMediaTab(QWidget):
                         return
                 except Exception:
                     pass
-            # Release our own playback handle so the viewer owns the file.
+            # Hand our playback handle, still at the current frame, to the
+            # viewer so it carries on from there without reopening the file.
+            capture, start_frame = None, 0
             if self.playing_video:
-                self.stop_video()
+                capture, start_frame = self._hand_off_capture()
             if self._current_kind() == "image":
+                if capture is not None:
+                    capture.release()
                 viewer = FullscreenImageViewer(self.current)
             else:
-                viewer = FullscreenVideoViewer(self.current)
+                viewer = FullscreenVideoViewer(self.current, capture=capture, start_frame=start_frame)
             self._fullscreen_viewer = viewer
             viewer.showFullScreen()
             try:
@@ -392,8 +491,8 @@ class AllMediaTab(QWidget):
         self.stop_video()
         if not CV2_AVAILABLE:
             return
-        self.cap = cv2.VideoCapture(self.current)
-        if not self.cap.isOpened():
+        self.cap = shared_capture_manager().acquire(self.current)
+        if self.cap is None or not self.cap.isOpened():
             try:
                 self.cap.release()
             except Exception:
@@ -408,7 +507,11 @@ class AllMediaTab(QWidget):
         fps_valid = fps_val > 0.0 and not math.isnan(fps_val) and not math.isinf(fps_val)
         interval_ms = int(round(1000.0 / fps_val)) if fps_valid else 33
         interval_ms = max(5, min(1000, interval_ms))
-        self.video_timer.start(interval_ms)
+        # The timer only polls; the wall clock decides which frame is shown.
+        self._clock = PlaybackClock(fps_val if fps_valid else 1000.0 / interval_ms)
+        self._next_frame = 0
+        self._clock.start()
+        self.video_timer.start(max(5, interval_ms // 2))
 
     def _update_video_frame(self) -> None:
         try:
@@ -416,21 +519,37 @@ class AllMediaTab(QWidget):
                 if not self.cap.isOpened():
                     self.stop_video()
                     return
-                ret, frame = self.cap.read()
+                clock = self._clock
+                due = clock.due_frame()
+                if due < self._next_frame:
+                    return  # current frame is still the right one
+                ret, frame, index = read_due(self.cap, self._next_frame, due, clock, self._frame_pool)
                 if not ret:
                     self.stop_video()
                     return
-                self.preview_label.setPixmap(self._frame_to_pixmap(frame))
+                self._next_frame = index + 1
+                clock.presented(index)
+                self.preview_label.setPixmap(self._playback_pixmap(frame))
         except Exception as e:
             logging.error(f"AllMediaTab frame update failed: {e}")
             self.stop_video()
 
+    def _hand_off_capture(self):
+        """Stop playback but keep the capture open; returns ``(cap, next_frame)``."""
+        cap, next_frame = self.cap, self._next_frame
+        self.cap = None
+        self.stop_video()
+        return cap, next_frame
+
     def stop_video(self) -> None:
         self.playing_video = False
         try:
             self.video_timer.stop()
         except Exception:
             pass
+        if self._clock is not None:
+            self._clock.log_summary(os.path.basename(self.current or ""))
+            self._clock = None
         if self.cap:
             try:
                 self.cap.release()
@@ -516,7 +635,8 @@ class AllMediaTab(QWidget):
         self.record_button.setText(self._L("stop_recording", "Stop Recording"))
         self._update_recording_indicator()
         self.recording_thread = QThread()
-        self.recording_worker = AudioRecordingWorker(wav_path)
+        self.recording_worker = AudioRecordingWorker(
+            wav_path, armed_input=getattr(self.host, 'armed_input', None))
         self.recording_worker.moveToThread(self.recording_thread)
         self.recording_thread.started.connect(self.recording_worker.run)
         self.recording_worker.finished.connect(self.recording_thread.quit)
@@ -524,6 +644,9 @@ class AllMediaTab(QWidget):
         self.recording_thread.finished.connect(self.recording_thread.deleteLater)
         self.recording_thread.finished.connect(self._on_recording_finished)
         self.recording_worker.error.connect(self._on_worker_error)
+        self.level_meter.reset()
+        self.level_meter.setVisible(True)
+        self.recording_worker.levels.connect(self.level_meter.set_levels)
         self.recording_thread.start()
 
     def _stop_recording(self) -> None:
@@ -551,8 +674,10 @@ class AllMediaTab(QWidget):
         self.recording_thread = None
         self.recording_worker = None
         self.is_recording = False
+        self.fs.refresh_recordings()
         self._update_recording_indicator()
-        self._update_controls()
+        self._show_clip_warning()
+        self._update_controls(refresh=False)
         self._emit_recording_changed()
 
     def _emit_recording_changed(self) -> None:
@@ -569,6 +694,18 @@ class AllMediaTab(QWidget):
         except Exception:
             pass
 
+    def _show_clip_warning(self) -> None:
+        """Hide the level meter; if the take clipped, say so in its place."""
+        try:
+            self.level_meter.setVisible(False)
+            if self.level_meter.clipped:
+                self.status_label.setText(self._L(
+                    "recording_clipped",
+                    "The recording clipped ({count} samples at full scale); consider lowering the input level.",
+                ).format(count=self.level_meter.levels.clipped_total))
+        except Exception:
+            pass
+
     # ---- recording management -----------------------------------------
     def delete_recording(self) -> None:
         if not self.current:
@@ -593,6 +730,7 @@ class AllMediaTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, self._L("error_title", "Error"), str(e))
             return
+        self.fs.note_recording(wav_path, False)
         self._update_controls()
         self._emit_recording_changed()
 
@@ -627,7 +765,8 @@ class AllMediaTab(QWidget):
         except Exception:
             pass
 
-    def _update_controls(self) -> None:
+    def _update_controls(self, refresh: bool = True) -> None:
+        # ``refresh=False`` when the recording set was just revalidated.
         has_current = bool(self.current)
         kind = self._current_kind()
         is_video = kind == "video"
@@ -640,7 +779,7 @@ class AllMediaTab(QWidget):
             self._L("stop_recording", "Stop Recording") if self.is_recording
             else self._L("record_audio", "Record Audio")
         )
-        wav_exists = bool(has_current) and self.fs.has_recording(self.current)
+        wav_exists = bool(has_current) and self.fs.has_recording(self.current, refresh=refresh)
         self.play_audio_button.setEnabled(wav_exists and not self.is_playing_audio and not self.is_recording)
         self.stop_audio_button.setEnabled(wav_exists)
         self.delete_recording_button.setEnabled(wav_exists and not self.is_recording)
@@ -1,5 +1,6 @@
 import sys
 import os
+import bisect
 import cv2
 import numpy as np
 import shutil
@@ -14,8 +15,8 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QListWidget, QListWidgetItem, QLabel, QTextEdit, QMessageBox,
     QFileDialog, QComboBox, QTabWidget, QSplitter, QToolButton, QStyle, QSizePolicy,
-    QListView, QStyledItemDelegate, QApplication, QCheckBox, QGraphicsDropShadowEffect,
-    QMenu, QProgressDialog
+    QListView, QApplication, QCheckBox, QGraphicsDropShadowEffect,
+    QMenu, QProgressDialog, QAbstractItemView, QDoubleSpinBox
 )
 from PySide6.QtCore import Qt, QTimer, Signal, QThread, QEvent, QSize, QRect, QPoint, QLocale, QMetaObject, QUrl, QMimeData
 import time
@@ -28,9 +29,24 @@ import zipfile
 from vat.audio import PYAUDIO_AVAILABLE
 from vat.audio.playback import AudioPlaybackWorker
 from vat.audio.recording import AudioRecordingWorker
+from vat.audio.engine import shared_audio_engine
+from vat.audio.preroll import ArmedInput, MAX_PREROLL_SECONDS, PREROLL_SECONDS
+from vat.audio.wav_writer import recover_interrupted_recordings
 from vat.audio.joiner import JoinWavsWorker
 from vat.utils.resources import resource_path
 from vat.utils.video_convert import VideoConvertWorker, ConvertSpec, needs_reencode_to_mp4
+from vat.utils.media_decode import read_image
+from vat.utils.folder_manifest import default_manifest_dir
+from vat.utils.media_model import MediaListModel, MediaRow, PathRole, RecordedRole
+from vat.utils.viewport_thumbs import ViewportThumbnails, UniformCellDelegate
+from vat.video import poster as video_poster
+from vat.video.captures import shared_capture_manager
+from vat.video.decoder import VideoDecodeThread
+from vat.utils.pixmap_cache import (
+    shared_pixmap_cache,
+    TIER_FULL,
+    DEFAULT_MAX_BYTES as DEFAULT_PIXMAP_CACHE_BYTES,
+)
 from vat.ui.fullscreen import FullscreenVideoViewer, FullscreenImageViewer
 from vat.utils.fs_access import (
     FolderAccessManager,
@@ -40,6 +56,7 @@ from vat.utils.fs_access import (
 )
 from vat.review import ReviewTab
 from vat.ui.all_tab import AllMediaTab
+from vat.ui.level_meter import LevelMeterWidget
 
 # Labels are loaded from the builtin module (vat.i18n.builtin_labels)
 # with an optional external YAML/JSON overlay. A minimal English
@@ -200,20 +217,29 @@ class VideoAnnotationApp(QMainWindow):
     ui_info = Signal(str, str)
     ui_warning = Signal(str, str)
     ui_error = Signal(str, str)
+    # Drawer rows remember their check state so refreshes only touch rows
+    # whose recording came or went.
+    _DRAWER_RECORDED_ROLE = Qt.UserRole + 1
     def __init__(self):
         super().__init__()
         # Default language; may be overridden by settings or system locale
         self.language = "English"
         self.LABELS = LABELS_ALL[self.language]
-        # Unified file-system access
-        self.fs = FolderAccessManager()
+        # Unified file-system access; kit listings are saved as manifests so
+        # the last kit reopens without waiting for a scan
+        self.fs = FolderAccessManager(manifest_dir=default_manifest_dir())
         self.video_files = []
         self.current_video = None
         self.last_video_name = None
         self.ocenaudio_path = None
         self.settings_file = os.path.expanduser("~/.videooralannotation/settings.json")
+        # Root of the multi-kit library (Library dialog); catalogue opened lazily
+        self.library_root = None
+        self._library_catalog = None
         self.playing_video = False
         self.cap = None
+        # Background decoder feeding the Videos pane during playback
+        self._video_decoder = None
         self.video_timer = QTimer()
         self.video_timer.timeout.connect(self.update_video_frame)
         # Persistent audio thread used for all playback
@@ -228,13 +254,18 @@ class VideoAnnotationApp(QMainWindow):
         self.is_recording = False
         self.recording_thread = None
         self.recording_worker = None
+        # Optional always-open microphone with a pre-roll (settings:
+        # armed_input, preroll_seconds); armed while a kit is loaded.
+        self.armed_input_enabled = False
+        self.armed_input = ArmedInput()
         self.join_thread = None
         self.join_worker = None
         self._suppress_item_changed = False
         # Pending selection target (used to auto-select a file after folder refresh)
         self._pending_select_video_name = None
-        # Cache for full-resolution image pixmaps (used by thumbnails and fullscreen)
-        self._image_pixmap_cache = {}
+        # Byte-budgeted pixmap cache: grid thumbnails and full-size previews
+        # for the banner and fullscreen (ceiling set from settings)
+        self._pixmap_cache = shared_pixmap_cache()
         # Track whether a video conversion is currently running; used to gate selection retry prompts
         self._video_conversion_in_progress = False
         # Fullscreen viewer state
@@ -246,8 +277,24 @@ class VideoAnnotationApp(QMainWindow):
             self.fs.folderChanged.connect(self._on_folder_changed)
             self.fs.videosUpdated.connect(self._on_videos_updated)
             self.fs.imagesUpdated.connect(self._on_images_updated)
+            # Watcher-driven: patch single rows instead of rebuilding
+            self.fs.mediaAdded.connect(self._on_media_added)
+            self.fs.mediaRemoved.connect(self._on_media_removed)
+            self.fs.recordingsChanged.connect(self._on_recordings_changed)
+            # Async folder open (select_folder / Library)
+            self.fs.folderChanged.connect(self._on_folder_opened)
+            self.fs.scanProgress.connect(self._on_folder_scan_progress)
+            self.fs.scanFinished.connect(self._on_folder_scan_finished)
+            self.fs.scanFailed.connect(self._on_folder_scan_failed)
         except Exception:
             pass
+        # Folder being opened by open_folder(); set up once it shows
+        self._opening_folder = None
+        # Finish takes a crash left half-written before the last kit is listed
+        try:
+            self._recovered_recordings = recover_interrupted_recordings()
+        except Exception:
+            self._recovered_recordings = []
         self.load_settings()
         self.init_ui()
         self.setWindowTitle(self.LABELS["app_title"])
@@ -498,6 +545,19 @@ class VideoAnnotationApp(QMainWindow):
     def _on_join_error(self, msg: str):
         self.ui_error.emit(self.LABELS["error_title"], f"An error occurred while joining files:\n{msg}")
     def _on_folder_changed(self, path: str):
+        # Full-size previews belong to the previous kit; thumbnails are kept
+        # (bounded by their own budget) so switching back is instant.
+        try:
+            self._pixmap_cache.log_stats("on folder change")
+            self._pixmap_cache.clear(TIER_FULL)
+        except Exception:
+            pass
+        try:
+            # Idle pooled captures hold files of the previous kit open.
+            shared_capture_manager().close_all()
+        except Exception:
+            pass
+        self._update_armed_input()
         try:
             if getattr(self, '_ui_ready', False):
                 logging.info(f"UI._on_folder_changed: path={path}")
@@ -522,13 +582,8 @@ class VideoAnnotationApp(QMainWindow):
             self.video_files = list(files)
             if not getattr(self, '_ui_ready', False) or getattr(self, 'video_listbox', None) is None:
                 return
-            self.video_listbox.clear()
+            self._sync_drawer_rows(self._video_drawer_rows())
             basenames = [os.path.basename(vp) for vp in self.video_files]
-            for name in basenames:
-                item = QListWidgetItem(name)
-                wav_exists = os.path.exists(self.fs.wav_path_for(name))
-                item.setIcon(self._check_icon if wav_exists else self._empty_icon)
-                self.video_listbox.addItem(item)
             # If there's a pending selection target, prefer that
             if self._pending_select_video_name and self._pending_select_video_name in basenames:
                 try:
@@ -536,7 +591,7 @@ class VideoAnnotationApp(QMainWindow):
                 except Exception:
                     pass
                 idx = basenames.index(self._pending_select_video_name)
-                self.video_listbox.setCurrentRow(idx)
+                self._select_drawer_row(idx)
                 try:
                     self.current_video = self._pending_select_video_name
                     self.last_video_name = self._pending_select_video_name
@@ -549,14 +604,14 @@ class VideoAnnotationApp(QMainWindow):
                 except Exception:
                     pass
                 idx = basenames.index(self.last_video_name)
-                self.video_listbox.setCurrentRow(idx)
+                self._select_drawer_row(idx)
             elif basenames:
                 try:
                     logging.info("UI._on_videos_updated: selecting first item by default")
                 except Exception:
                     pass
                 # Auto-select the first video on folder change
-                self.video_listbox.setCurrentRow(0)
+                self._select_drawer_row(0)
             if not self.video_files:
                 QMessageBox.information(self, self.LABELS["no_videos_found"], f"{self.LABELS['no_videos_found']} {self.fs.current_folder}")
         except Exception as e:
@@ -568,52 +623,125 @@ class VideoAnnotationApp(QMainWindow):
             self._refresh_drawer_list()
         except Exception:
             pass
+    def _on_media_added(self, paths: list):
+        """Insert rows for files that appeared in the folder (no full rebuild)."""
+        try:
+            lb = getattr(self, 'video_listbox', None)
+            drawer_shows_videos = lb is not None and self._active_tab_key() != "all"
+            for full in paths:
+                kind = self.fs.media_type_of(full)
+                if kind == "video" and os.path.dirname(full) == (self.fs.current_folder or ""):
+                    if full in self.video_files:
+                        continue
+                    row = bisect.bisect_left(self.video_files, full)
+                    self.video_files.insert(row, full)
+                    if drawer_shows_videos:
+                        wav_exists = self.fs.recording_exists(self.fs.wav_path_for(os.path.basename(full)))
+                        lb.blockSignals(True)
+                        lb.insertItem(row, self._drawer_item(full, wav_exists))
+                        lb.blockSignals(False)
+                elif kind == "image":
+                    self._insert_image_item(full)
+            # A converted/imported video we were waiting for has arrived.
+            pending = self._pending_select_video_name
+            names = [os.path.basename(vp) for vp in self.video_files]
+            if pending and pending in names:
+                self._pending_select_video_name = None
+                self._select_video_by_name(pending)
+            elif not self.current_video and names and drawer_shows_videos and lb.currentRow() < 0:
+                lb.setCurrentRow(0)
+        except Exception as e:
+            logging.warning(f"UI._on_media_added failed: {e}")
+
+    def _on_media_removed(self, paths: list):
+        """Remove rows for files that disappeared from the folder."""
+        try:
+            lb = getattr(self, 'video_listbox', None)
+            drawer_shows_videos = lb is not None and self._active_tab_key() != "all"
+            for full in paths:
+                if full in self.video_files:
+                    row = self.video_files.index(full)
+                    del self.video_files[row]
+                    was_current = os.path.basename(full) == self.current_video
+                    if was_current:
+                        self._release_video_handle()
+                        self.current_video = None
+                    if drawer_shows_videos and row < lb.count():
+                        # Removing the current row moves selection to a
+                        # neighbour, which loads it through on_video_select;
+                        # any other row only shifts indices silently.
+                        lb.blockSignals(not was_current)
+                        try:
+                            lb.takeItem(row)
+                        finally:
+                            lb.blockSignals(False)
+                else:
+                    self._remove_image_item(full)
+            if not self.video_files:
+                self.update_media_controls()
+        except Exception as e:
+            logging.warning(f"UI._on_media_removed failed: {e}")
+
+    def _on_recordings_changed(self, wav_paths: list):
+        """A recording appeared or vanished: refresh check marks and controls
+        (all answered from the in-memory recording set)."""
+        try:
+            self.update_video_file_checks()
+            self.update_media_controls()
+            self._update_image_record_controls()
+        except Exception:
+            pass
+
+    def _select_video_by_name(self, name: str) -> None:
+        basenames = [os.path.basename(vp) for vp in self.video_files]
+        if name not in basenames:
+            return
+        idx = basenames.index(name)
+        if getattr(self, 'video_listbox', None) and self._active_tab_key() != "all":
+            self.video_listbox.setCurrentRow(idx)
+        self.current_video = name
+        self.last_video_name = name
+        self.show_first_frame()
+        self.update_media_controls()
+
     def _reload_folder_and_select(self, target_name: str, retries: int = 6, delay_ms: int = 250):
-        """Force a folder reload and try to select target_name after refresh. Retries with a short delay if needed."""
+        """Pick up a newly written video and select it.
+
+        Rescans the folder incrementally (mediaAdded inserts the row and
+        _on_media_added selects the pending target). If the file is still
+        being written the folder watcher reports it when it lands; after
+        ``retries * delay_ms`` without it, the old failure handling applies.
+        """
         try:
             try:
-                logging.info(f"UI._reload_folder_and_select: target={target_name}, retries={retries}, delay={delay_ms}ms")
+                logging.info(f"UI._reload_folder_and_select: target={target_name}, wait={retries * delay_ms}ms")
             except Exception:
                 pass
             if not target_name:
                 return
             self._pending_select_video_name = target_name
-            cur = self.fs.current_folder
-            if cur:
-                try:
-                    logging.info(f"UI._reload_folder_and_select: calling fs.set_folder({cur})")
-                except Exception:
-                    pass
-                self.fs.set_folder(cur)
-            # After a short delay, verify selection; retry if not applied yet
-            def _verify_or_retry():
+            self.fs.rescan_changes()
+            basenames = [os.path.basename(vp) for vp in self.video_files]
+            if target_name in basenames and self._pending_select_video_name == target_name:
+                # Already listed before the rescan (e.g. overwritten in place)
+                self._pending_select_video_name = None
+                self._select_video_by_name(target_name)
+            def _verify():
                 try:
-                    basenames = [os.path.basename(vp) for vp in self.video_files]
-                    logging.info(f"UI._reload_folder_and_select.verify: have {len(basenames)} items; looking for {target_name}")
-                    if target_name in basenames:
-                        idx = basenames.index(target_name)
-                        if getattr(self, 'video_listbox', None):
-                            self.video_listbox.setCurrentRow(idx)
-                        self.current_video = target_name
-                        self.last_video_name = target_name
-                        self.show_first_frame()
-                        self.update_media_controls()
-                        try:
-                            self.statusBar().showMessage(self.LABELS.get("selected_converted", "Converted video selected"), 2000)
-                        except Exception:
-                            pass
+                    if self._pending_select_video_name != target_name:
+                        if self.current_video == target_name:
+                            try:
+                                self.statusBar().showMessage(self.LABELS.get("selected_converted", "Converted video selected"), 2000)
+                            except Exception:
+                                pass
                         return
-                except Exception:
-                    pass
-                if retries > 0:
-                    try:
-                        logging.info(f"UI._reload_folder_and_select.verify: target not found yet; retrying ({retries-1} left)")
-                    except Exception:
-                        pass
-                    QTimer.singleShot(delay_ms, lambda: self._reload_folder_and_select(target_name, retries - 1, delay_ms))
-                else:
+                    # One last explicit rescan in case no watcher event arrived
+                    self.fs.rescan_changes()
+                    if self._pending_select_video_name != target_name:
+                        return
+                    self._pending_select_video_name = None
                     try:
-                        logging.warning("UI._reload_folder_and_select.verify: selection failed after retries")
+                        logging.warning("UI._reload_folder_and_select.verify: target did not appear")
                     except Exception:
                         pass
                     # Only prompt if a video conversion is actively in progress; otherwise fail quietly
@@ -627,7 +755,7 @@ class VideoAnnotationApp(QMainWindow):
                                 QMessageBox.Retry,
                             )
                             if resp == QMessageBox.Retry:
-                                self._reload_folder_and_select(target_name, retries=6, delay_ms=250)
+                                self._reload_folder_and_select(target_name, retries=retries, delay_ms=delay_ms)
                         except Exception:
                             pass
                     else:
@@ -635,7 +763,9 @@ class VideoAnnotationApp(QMainWindow):
                             self.statusBar().showMessage(self.LABELS.get("selection_failed_title", "Selection failed"), 2000)
                         except Exception:
                             pass
-            QTimer.singleShot(delay_ms, _verify_or_retry)
+                except Exception:
+                    pass
+            QTimer.singleShot(max(1, retries) * delay_ms, _verify)
         except Exception:
             pass
     def init_ui(self):
@@ -745,6 +875,14 @@ class VideoAnnotationApp(QMainWindow):
         except Exception:
             pass
         left_layout.addWidget(self.select_button)
+        self.library_button = QPushButton(self.LABELS.get("library_button", "Kit Library…"))
+        self.library_button.clicked.connect(self.open_library)
+        try:
+            self.library_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+            self.library_button.setMinimumHeight(30)
+        except Exception:
+            pass
+        left_layout.addWidget(self.library_button)
         self.open_ocenaudio_button = QPushButton(self.LABELS["open_ocenaudio"])
         self.open_ocenaudio_button.clicked.connect(self.open_in_ocenaudio)
         self.open_ocenaudio_button.setEnabled(False)
@@ -815,6 +953,24 @@ class VideoAnnotationApp(QMainWindow):
         except Exception:
             pass
         left_layout.addWidget(self.edit_metadata_btn)
+        # Armed input: keep the microphone open with a pre-roll between takes
+        self.armed_input_cb = QCheckBox(self.LABELS.get("armed_input_toggle", "Keep microphone armed (pre-roll)"))
+        self.armed_input_cb.setChecked(self.armed_input_enabled)
+        self.armed_input_cb.toggled.connect(self._on_armed_input_toggled)
+        left_layout.addWidget(self.armed_input_cb)
+        preroll_row = QHBoxLayout()
+        self.preroll_label = QLabel(self.LABELS.get("preroll_seconds_label", "Pre-roll:"))
+        preroll_row.addWidget(self.preroll_label)
+        self.preroll_spin = QDoubleSpinBox()
+        self.preroll_spin.setRange(0.0, MAX_PREROLL_SECONDS)
+        self.preroll_spin.setSingleStep(0.5)
+        self.preroll_spin.setDecimals(1)
+        self.preroll_spin.setSuffix(" s")
+        self.preroll_spin.setValue(self.armed_input.preroll_seconds)
+        self.preroll_spin.valueChanged.connect(self._on_preroll_changed)
+        preroll_row.addWidget(self.preroll_spin)
+        preroll_row.addStretch(1)
+        left_layout.addLayout(preroll_row)
         # Drawer overlay (appears over UI instead of resizing splitter)
         try:
             self.drawer_layer = QWidget(central_widget)
@@ -832,6 +988,7 @@ class VideoAnnotationApp(QMainWindow):
             try:
                 for btn in (
                     self.select_button,
+                    self.library_button,
                     self.open_ocenaudio_button,
                     self.export_wavs_button,
                     self.clear_wavs_button,
@@ -992,6 +1149,9 @@ class VideoAnnotationApp(QMainWindow):
         self.recording_status_label = QLabel("")
         self.recording_status_label.setStyleSheet("color: red; font-weight: bold;")
         audio_controls_layout.addWidget(self.recording_status_label)
+        self.record_meter = LevelMeterWidget(labels=self.LABELS)
+        self.record_meter.setVisible(False)
+        audio_controls_layout.addWidget(self.record_meter)
         audio_controls_layout.addStretch(1)
         videos_layout.addLayout(audio_controls_layout)
         videos_layout.addStretch()
@@ -1055,6 +1215,9 @@ class VideoAnnotationApp(QMainWindow):
         self.stop_image_record_button.clicked.connect(self._handle_stop_image_record)
         self.stop_image_record_button.setEnabled(False)
         controls_row.addWidget(self.stop_image_record_button)
+        self.image_record_meter = LevelMeterWidget(labels=self.LABELS)
+        self.image_record_meter.setVisible(False)
+        controls_row.addWidget(self.image_record_meter)
         # Add audio dropdown (From file / Paste from clipboard)
         self.add_image_audio_button = QToolButton()
         self.add_image_audio_button.setText(self.LABELS.get("add_existing_audio", "Add audio…"))
@@ -1121,7 +1284,9 @@ class VideoAnnotationApp(QMainWindow):
         except Exception:
             self.images_thumb_scale = 1.0
         # Grid of thumbnails
-        self.images_list = QListWidget()
+        self.images_model = MediaListModel(placeholder=self._empty_icon, parent=self)
+        self.images_list = QListView()
+        self.images_list.setModel(self.images_model)
         try:
             self.images_list.setViewMode(QListView.IconMode)
             # Ensure Adjust mode is set from QListView enum
@@ -1134,11 +1299,12 @@ class VideoAnnotationApp(QMainWindow):
             self.images_list.setSpacing(6)
             self.images_list.setMovement(QListView.Static)
             self.images_list.setWrapping(True)
-            # Let items compute size per grid cell for better wrapping
-            self.images_list.setUniformItemSizes(False)
+            # Every cell is one grid cell: size it once, not per row, so
+            # layout stays cheap for kits with thousands of images
+            self.images_list.setUniformItemSizes(True)
             self.images_list.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            self.images_list.setSelectionMode(QListWidget.SingleSelection)
-            self.images_list.setSelectionBehavior(QListWidget.SelectItems)
+            self.images_list.setSelectionMode(QAbstractItemView.SingleSelection)
+            self.images_list.setSelectionBehavior(QAbstractItemView.SelectItems)
             logging.info("UI.init_ui: images_list ready (IconMode)")
         except Exception:
             pass
@@ -1152,24 +1318,18 @@ class VideoAnnotationApp(QMainWindow):
             pass
         # Install custom delegate to draw green border and check overlay for recorded images
         try:
-            self.images_list.setItemDelegate(ImageGridDelegate(self.fs))
+            self.images_list.setItemDelegate(ImageGridDelegate(self.fs, self.images_list))
         except Exception:
             pass
         # Selection syncing: rely on current-item changes to avoid duplicate triggers
         try:
-            self.images_list.currentItemChanged.connect(lambda *args: self._handle_image_selection())
-        except Exception:
-            pass
-        self.images_list.itemDoubleClicked.connect(self._handle_open_fullscreen_image)
-        # Warm the image cache for items that become visible as the user
-        # scrolls the grid, so fullscreen opens don't pay a cold-start
-        # decoding cost.
-        try:
-            vsb = self.images_list.verticalScrollBar()
-            if vsb is not None:
-                vsb.valueChanged.connect(lambda *_: self._preload_visible_images())
+            self.images_list.selectionModel().currentChanged.connect(lambda *args: self._handle_image_selection())
         except Exception:
             pass
+        self.images_list.doubleClicked.connect(self._handle_open_fullscreen_image)
+        # Background thumbnail decoding, only for rows in or near the viewport
+        self._images_thumbs = ViewportThumbnails(self.images_list, self.images_model, parent=self)
+        self._images_thumb_loader = self._images_thumbs.loader
         images_layout.addWidget(self.images_list)
         right_panel.addTab(images_tab, self.LABELS.get("images_tab_title", "Images"))
         
@@ -1193,7 +1353,12 @@ class VideoAnnotationApp(QMainWindow):
             self.fs.folderChanged.connect(lambda *_: self.all_tab.refresh_queue())
             self.fs.videosUpdated.connect(lambda *_: self.all_tab.refresh_queue())
             self.fs.imagesUpdated.connect(lambda *_: self.all_tab.refresh_queue())
+            self.fs.mediaAdded.connect(lambda paths: self.all_tab.apply_media_changes(paths, []))
+            self.fs.mediaRemoved.connect(lambda paths: self.all_tab.apply_media_changes([], paths))
+            self.fs.recordingsChanged.connect(self.all_tab.on_recordings_changed)
             self.all_tab.queueChanged.connect(self._populate_drawer_for_all_tab)
+            self.all_tab.rowInserted.connect(self._on_all_queue_row_inserted)
+            self.all_tab.rowRemoved.connect(self._on_all_queue_row_removed)
             self.all_tab.selectionChanged.connect(self._sync_drawer_row)
             self.all_tab.recordingChanged.connect(self.update_video_file_checks)
         except Exception:
@@ -1256,12 +1421,8 @@ class VideoAnnotationApp(QMainWindow):
         # Show a short welcome/best-practices message once on startup
         try:
             QTimer.singleShot(0, self._show_welcome_dialog)
-        except Exception:
-            pass
-        # After the first population/layout pass, warm the cache for the
-        # thumbnails that are actually visible.
-        try:
-            QTimer.singleShot(0, self._preload_visible_images)
+            if self._recovered_recordings:
+                QTimer.singleShot(0, self._show_recovered_recordings)
         except Exception:
             pass
 
@@ -1477,6 +1638,7 @@ class VideoAnnotationApp(QMainWindow):
             return False
     def refresh_ui_texts(self):
         self.select_button.setText(self.LABELS["select_folder"])
+        self.library_button.setText(self.LABELS.get("library_button", "Kit Library…"))
         self.open_ocenaudio_button.setText(self.LABELS["open_ocenaudio"])
         self.export_wavs_button.setText(self.LABELS["export_wavs"])
         self.clear_wavs_button.setText(self.LABELS["clear_wavs"])
@@ -1515,6 +1677,10 @@ class VideoAnnotationApp(QMainWindow):
             self.convert_image_to_jpg_cb.setText(self.LABELS.get("convert_to_jpg", "Convert to JPG"))
         if getattr(self, 'edit_metadata_btn', None):
             self.edit_metadata_btn.setText(self.LABELS["edit_metadata"])
+        if getattr(self, 'armed_input_cb', None):
+            self.armed_input_cb.setText(self.LABELS.get("armed_input_toggle", "Keep microphone armed (pre-roll)"))
+        if getattr(self, 'preroll_label', None):
+            self.preroll_label.setText(self.LABELS.get("preroll_seconds_label", "Pre-roll:"))
         if not self.current_video:
             self.video_label.setText(self.LABELS["video_listbox_no_video"])
         # Localized tips and checkbox labels
@@ -1576,12 +1742,50 @@ class VideoAnnotationApp(QMainWindow):
                 last_folder = settings.get('last_folder')
                 if last_folder and os.path.isdir(last_folder):
                     try:
-                        self.fs.set_folder(last_folder)
+                        self.fs.reopen_folder(last_folder)
                     except Exception:
                         pass
                 last_video = settings.get('last_video')
                 if last_video:
                     self.last_video_name = last_video
+                library_root = settings.get('library_root')
+                if isinstance(library_root, str) and library_root:
+                    self.library_root = library_root
+                # Memory ceiling for cached pixmaps (thumbnails + previews)
+                try:
+                    cache_mb = settings.get('pixmap_cache_mb')
+                    if isinstance(cache_mb, (int, float)) and cache_mb > 0:
+                        self.pixmap_cache_mb = int(cache_mb)
+                        self._pixmap_cache.set_max_bytes(self.pixmap_cache_mb * 1024 * 1024)
+                except Exception:
+                    pass
+                # How video poster frames are chosen
+                try:
+                    offset = settings.get('video_poster_offset_s')
+                    skip_black = settings.get('video_poster_skip_black')
+                    video_poster.configure(
+                        offset if isinstance(offset, (int, float)) else None,
+                        skip_black if isinstance(skip_black, bool) else None,
+                    )
+                except Exception:
+                    pass
+                # Keep the microphone open with a pre-roll while a kit is loaded
+                try:
+                    preroll = settings.get('preroll_seconds')
+                    if isinstance(preroll, (int, float)) and not isinstance(preroll, bool):
+                        self.armed_input.set_preroll(preroll)
+                    self.armed_input_enabled = settings.get('armed_input') is True
+                    if getattr(self, 'armed_input_cb', None) is not None:
+                        self.armed_input_cb.blockSignals(True)
+                        self.armed_input_cb.setChecked(self.armed_input_enabled)
+                        self.armed_input_cb.blockSignals(False)
+                    if getattr(self, 'preroll_spin', None) is not None:
+                        self.preroll_spin.blockSignals(True)
+                        self.preroll_spin.setValue(self.armed_input.preroll_seconds)
+                        self.preroll_spin.blockSignals(False)
+                    self._update_armed_input()
+                except Exception:
+                    pass
                 # Persistent fullscreen zoom
                 zoom = settings.get('fullscreen_zoom')
                 if isinstance(zoom, (int, float)) and zoom > 0:
@@ -1658,10 +1862,16 @@ class VideoAnnotationApp(QMainWindow):
                 'ocenaudio_path': self.ocenaudio_path,
                 'language': self.language,
                 'last_folder': self.fs.current_folder,
+                'library_root': self.library_root,
                 'last_video': self.current_video,
                 # Persist the last used fullscreen zoom if set
                 'fullscreen_zoom': self.fullscreen_zoom if isinstance(self.fullscreen_zoom, (int, float)) else None,
                 'images_thumb_scale': getattr(self, 'images_thumb_scale', 1.0),
+                'pixmap_cache_mb': getattr(self, 'pixmap_cache_mb', DEFAULT_PIXMAP_CACHE_BYTES // (1024 * 1024)),
+                'video_poster_offset_s': video_poster.current_settings()[0],
+                'video_poster_skip_black': video_poster.current_settings()[1],
+                'armed_input': bool(getattr(self, 'armed_input_enabled', False)),
+                'preroll_seconds': getattr(getattr(self, 'armed_input', None), 'preroll_seconds', PREROLL_SECONDS),
             }
             
             # Save review settings if review tab exists
@@ -1680,56 +1890,111 @@ class VideoAnnotationApp(QMainWindow):
         initial_dir = self.fs.current_folder or os.path.expanduser("~")
         folder = QFileDialog.getExistingDirectory(self, self.LABELS["select_folder_dialog"], initial_dir)
         if folder:
-            # Set via FS manager for unified state and signal refresh
-            if not self.fs.set_folder(folder):
-                QMessageBox.critical(self, self.LABELS["error_title"], self.LABELS["permission_denied_title"])
-                return
-            try:
-                errors = self.fs.cleanup_hidden_files()
-                if errors:
-                    QMessageBox.warning(self, self.LABELS["cleanup_errors_title"], "Some hidden files could not be deleted:\n" + "\n".join(errors))
-            except Exception:
-                pass
-            self.export_wavs_button.setEnabled(True)
-            self.clear_wavs_button.setEnabled(True)
-            self.import_wavs_button.setEnabled(True)
-            self.join_wavs_button.setEnabled(True)
-            self.open_ocenaudio_button.setEnabled(True)
-            if getattr(self, 'edit_metadata_btn', None):
-                self.edit_metadata_btn.setEnabled(True)
+            self.open_folder(folder)
+
+    def open_folder(self, folder: str) -> bool:
+        """Make ``folder`` the current kit (Select Folder, Library dialog).
+
+        The folder is checked and scanned in the background; views fill from
+        the first page of the scan (folderChanged) and the rest is patched
+        in as it is read. Choosing another folder cancels the scan.
+        """
+        if not folder:
+            return False
+        self._opening_folder = folder
+        try:
+            logging.info(f"UI.open_folder: path={folder}")
+        except Exception:
+            pass
+        # Hidden-file cleanup lists the folder too, so it runs on the worker
+        return self.fs.open_folder_async(folder, cleanup_hidden=True)
+
+    def _on_folder_opened(self, path: str):
+        """First results of an open_folder(): enable the kit actions."""
+        if not path or path != self._opening_folder:
+            return
+        self.export_wavs_button.setEnabled(True)
+        self.clear_wavs_button.setEnabled(True)
+        self.import_wavs_button.setEnabled(True)
+        self.join_wavs_button.setEnabled(True)
+        self.open_ocenaudio_button.setEnabled(True)
+        if getattr(self, 'edit_metadata_btn', None):
+            self.edit_metadata_btn.setEnabled(True)
+        self.save_settings()
+
+    def _on_folder_scan_progress(self, path: str, seen: int):
+        if path != self._opening_folder or getattr(self, 'folder_display_label', None) is None:
+            return
+        base = os.path.basename(path.rstrip(os.sep)) or path
+        self.folder_display_label.setText(
+            self.LABELS.get("folder_scanning", "{folder} — reading folder… ({count})").format(folder=base, count=seen))
+        self.folder_display_label.setToolTip(path)
+
+    def _on_folder_scan_finished(self, path: str, errors: list):
+        if path != self._opening_folder:
+            return
+        self._opening_folder = None
+        self.update_folder_display()
+        if errors:
+            QMessageBox.warning(self, self.LABELS["cleanup_errors_title"], "Some hidden files could not be deleted:\n" + "\n".join(errors))
+
+    def _on_folder_scan_failed(self, path: str, kind: str, message: str):
+        if path != self._opening_folder:
+            return
+        self._opening_folder = None
+        self.update_folder_display()
+        if kind == "FolderNotFoundError":
+            QMessageBox.critical(self, self.LABELS["folder_not_found_title"], f"The selected folder no longer exists: {path}")
+        else:
+            QMessageBox.critical(self, self.LABELS["error_title"], self.LABELS["permission_denied_title"])
+
+    def _library(self):
+        if self._library_catalog is None:
+            from vat.utils.library_catalog import LibraryCatalog
+            self._library_catalog = LibraryCatalog()
+        return self._library_catalog
+
+    def open_library(self):
+        """Show the kit library; open the kit the user picks."""
+        try:
+            catalog = self._library()
+        except Exception as e:
+            logging.info(f"UI.open_library: catalogue unavailable: {e}")
+            QMessageBox.critical(self, self.LABELS["error_title"], str(e))
+            return
+        from vat.ui.library_dialog import LibraryDialog
+        root = self.library_root or os.path.dirname(self.fs.current_folder or "") or ""
+        dlg = LibraryDialog(catalog, root, parent=self, labels=self.LABELS)
+        if root and not catalog.kits(root):
+            dlg.start_scan()
+        accepted = dlg.exec() == LibraryDialog.Accepted
+        dlg.stop_scan()
+        chosen_root, kit = dlg.root(), dlg.selected_kit
+        dlg.deleteLater()
+        if chosen_root and chosen_root != self.library_root:
+            self.library_root = chosen_root
             self.save_settings()
-            # Rely on FS signals (_on_folder_changed -> list_images -> imagesUpdated)
-            try:
-                logging.info(f"UI.select_folder: path={folder}")
-            except Exception:
-                pass
-            # Populate immediately to prevent transient empty state
-            try:
-                self._on_folder_changed(folder)
-            except Exception:
-                pass
+        if accepted and kit:
+            logging.info(f"UI.open_library: kit={kit}")
+            self.open_folder(kit)
     def load_video_files(self):
         # Manual refresh using FS manager (in case signals are not available)
-        self.video_listbox.clear()
         self.video_files = []
         if not self.fs.current_folder:
+            self.video_listbox.clear()
             QMessageBox.information(self, self.LABELS["no_folder_selected"], self.LABELS["no_folder_selected"])
             return
         try:
             self.video_files = self.fs.list_videos()
             self.video_files.sort()
+            self._sync_drawer_rows(self._video_drawer_rows())
             basenames = [os.path.basename(vp) for vp in self.video_files]
-            for name in basenames:
-                item = QListWidgetItem(name)
-                wav_exists = os.path.exists(self.fs.wav_path_for(name))
-                item.setIcon(self._check_icon if wav_exists else self._empty_icon)
-                self.video_listbox.addItem(item)
             if self.last_video_name and self.last_video_name in basenames:
                 idx = basenames.index(self.last_video_name)
-                self.video_listbox.setCurrentRow(idx)
+                self._select_drawer_row(idx)
             elif basenames:
                 # Auto-select first video to ensure player loads
-                self.video_listbox.setCurrentRow(0)
+                self._select_drawer_row(0)
             if not self.video_files:
                 QMessageBox.information(self, self.LABELS["no_videos_found"], f"{self.LABELS['no_videos_found']} {self.fs.current_folder}")
         except FolderPermissionError:
@@ -1823,52 +2088,121 @@ class VideoAnnotationApp(QMainWindow):
         at = getattr(self, 'all_tab', None)
         if lb is None or at is None or self._active_tab_key() != "all":
             return
-        check = getattr(self, '_check_icon', None)
-        empty = getattr(self, '_empty_icon', None)
-        lb.blockSignals(True)
-        try:
-            lb.clear()
-            for path in at.queue:
-                item = QListWidgetItem(os.path.basename(path))
-                item.setData(Qt.UserRole, path)
-                try:
-                    if check is not None and empty is not None:
-                        item.setIcon(check if self.fs.has_recording(path) else empty)
-                except Exception:
-                    pass
-                lb.addItem(item)
-            if 0 <= at.index < lb.count():
+        self.fs.refresh_recordings()
+        self._sync_drawer_rows([(path, self.fs.has_recording(path, refresh=False)) for path in at.queue])
+        if 0 <= at.index < lb.count():
+            lb.blockSignals(True)
+            try:
                 lb.setCurrentRow(at.index)
-        finally:
-            lb.blockSignals(False)
+            finally:
+                lb.blockSignals(False)
 
     def _populate_drawer_for_videos(self) -> None:
         """Drawer list shows videos only (Videos tab), preserving selection."""
         lb = getattr(self, 'video_listbox', None)
         if lb is None or self._active_tab_key() != "videos":
             return
-        check = getattr(self, '_check_icon', None)
-        empty = getattr(self, '_empty_icon', None)
         names = [os.path.basename(vp) for vp in (getattr(self, 'video_files', None) or [])]
-        lb.blockSignals(True)
-        try:
-            lb.clear()
-            for name in names:
-                item = QListWidgetItem(name)
-                try:
-                    if check is not None and empty is not None:
-                        item.setIcon(check if os.path.exists(self.fs.wav_path_for(name)) else empty)
-                except Exception:
-                    pass
-                lb.addItem(item)
-            if self.current_video and self.current_video in names:
+        self._sync_drawer_rows(self._video_drawer_rows())
+        if self.current_video and self.current_video in names:
+            lb.blockSignals(True)
+            try:
                 lb.setCurrentRow(names.index(self.current_video))
-        finally:
-            lb.blockSignals(False)
+            finally:
+                lb.blockSignals(False)
         # If nothing is selected yet, select the first item for real (signals on).
         if not self.current_video and lb.count():
             lb.setCurrentRow(0)
 
+    def _video_drawer_rows(self) -> list:
+        """(path, recorded) for every video, for _sync_drawer_rows."""
+        self.fs.refresh_recordings()
+        return [
+            (vp, self.fs.recording_exists(self.fs.wav_path_for(os.path.basename(vp))))
+            for vp in (getattr(self, 'video_files', None) or [])
+        ]
+
+    def _drawer_item(self, path: str, recorded: bool) -> QListWidgetItem:
+        item = QListWidgetItem(os.path.basename(path))
+        item.setData(Qt.UserRole, path)
+        self._set_drawer_check(item, recorded)
+        return item
+
+    def _set_drawer_check(self, item: QListWidgetItem, recorded: bool) -> None:
+        recorded = bool(recorded)
+        shown = item.data(self._DRAWER_RECORDED_ROLE)
+        if shown is not None and bool(shown) == recorded:
+            return
+        item.setData(self._DRAWER_RECORDED_ROLE, recorded)
+        item.setIcon(self._check_icon if recorded else self._empty_icon)
+
+    def _sync_drawer_rows(self, rows: list) -> None:
+        """Make the drawer show ``rows`` ([(path, recorded)]) in place.
+
+        Rows already shown are kept (only a changed check mark is updated);
+        missing ones are removed and new ones inserted. A listing that shares
+        nothing with the current one, or reorders it, is rebuilt. Signals are
+        blocked throughout; callers restore the selection.
+        """
+        lb = self.video_listbox
+        paths = [p for p, _ in rows]
+        shown = [lb.item(i).data(Qt.UserRole) for i in range(lb.count())]
+        wanted = set(paths)
+        kept = [p for p in shown if p in wanted]
+        kept_set = set(kept)
+        lb.blockSignals(True)
+        try:
+            if not kept or kept != [p for p in paths if p in kept_set]:
+                lb.clear()
+                shown = []
+            else:
+                for i in range(len(shown) - 1, -1, -1):
+                    if shown[i] not in wanted:
+                        lb.takeItem(i)
+                        del shown[i]
+            for pos, (path, recorded) in enumerate(rows):
+                if pos < len(shown) and shown[pos] == path:
+                    self._set_drawer_check(lb.item(pos), recorded)
+                else:
+                    lb.insertItem(pos, self._drawer_item(path, recorded))
+                    shown.insert(pos, path)
+        finally:
+            lb.blockSignals(False)
+
+    def _select_drawer_row(self, row: int) -> None:
+        """setCurrentRow that notifies when the video under ``row`` is not the
+        loaded one, even if the row number itself did not change."""
+        lb = self.video_listbox
+        item = lb.item(row)
+        if lb.currentRow() == row and item is not None and item.text() != self.current_video:
+            lb.blockSignals(True)
+            try:
+                lb.setCurrentRow(-1)
+            finally:
+                lb.blockSignals(False)
+        lb.setCurrentRow(row)
+
+    def _on_all_queue_row_inserted(self, row: int, path: str) -> None:
+        lb = getattr(self, 'video_listbox', None)
+        if lb is None or self._active_tab_key() != "all":
+            return
+        item = self._drawer_item(path, self.fs.has_recording(path, refresh=False))
+        lb.blockSignals(True)
+        try:
+            lb.insertItem(row, item)
+        finally:
+            lb.blockSignals(False)
+
+    def _on_all_queue_row_removed(self, row: int) -> None:
+        lb = getattr(self, 'video_listbox', None)
+        if lb is None or self._active_tab_key() != "all" or not (0 <= row < lb.count()):
+            return
+        lb.blockSignals(True)
+        try:
+            lb.takeItem(row)
+        finally:
+            lb.blockSignals(False)
+
     def _sync_drawer_row(self, i: int) -> None:
         """Keep the drawer list row in sync with All-tab prev/next navigation."""
         if self._active_tab_key() != "all":
@@ -1960,22 +2294,13 @@ class VideoAnnotationApp(QMainWindow):
             logging.warning(f"Cannot open video (path missing or inaccessible): {video_path}")
             self.video_label.setText("Loading preview…")
             return
-        cap = None
         try:
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                logging.warning(f"Cannot open video (cv2 open failed): {video_path}")
+            # Poster frame (offset / first non-black), cached on disk per video
+            qt_image = video_poster.poster_frame(video_path)
+            if qt_image is None or qt_image.isNull():
+                logging.warning(f"Cannot open video (poster frame read failed): {video_path}")
                 self.video_label.setText("Loading preview…")
                 return
-            ret, frame = cap.read()
-            if not ret:
-                logging.warning(f"Cannot open video (first frame read failed): {video_path}")
-                self.video_label.setText("Loading preview…")
-                return
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
             pixmap = QPixmap.fromImage(qt_image)
             # Scale pixmap to fit the label while preserving aspect ratio
             try:
@@ -1995,10 +2320,8 @@ class VideoAnnotationApp(QMainWindow):
             logging.error(f"Failed to load first frame for {video_path}: {e}")
             # Silent UI update; avoid popup on auto-selection
             self.video_label.setText("Loading preview…")
-        finally:
-            if cap is not None:
-                cap.release()
     def update_media_controls(self):
+        self.fs.refresh_recordings()
         if self.current_video:
             self.play_video_button.setEnabled(True)
             self.stop_video_button.setEnabled(True)
@@ -2014,7 +2337,7 @@ class VideoAnnotationApp(QMainWindow):
             if getattr(self, 'add_audio_button', None):
                 self.add_audio_button.setEnabled(not self.is_recording)
             wav_path = self.fs.wav_path_for(self.current_video)
-            wav_exists = os.path.exists(wav_path)
+            wav_exists = self.fs.recording_exists(wav_path)
             if wav_exists:
                 # Disable Play while audio is actively playing
                 self.play_audio_button.setEnabled(not self.is_playing_audio)
@@ -2071,8 +2394,8 @@ class VideoAnnotationApp(QMainWindow):
             return
         self.stop_video()
         video_path = self._resolve_current_video_path()
-        self.cap = cv2.VideoCapture(video_path)
-        if not self.cap.isOpened():
+        self.cap = shared_capture_manager().acquire(video_path)
+        if self.cap is None or not self.cap.isOpened():
             try:
                 self.cap.release()
             except Exception:
@@ -2119,32 +2442,64 @@ class VideoAnnotationApp(QMainWindow):
                 )
         except Exception:
             pass
-        self.video_timer.start(interval_ms)
+        # Hand the capture to the decode thread; from here on only that
+        # thread reads from or releases it.
+        cap, self.cap = self.cap, None
+        try:
+            target = self.video_label.contentsRect().size()
+        except Exception:
+            target = QSize()
+        self._video_decoder = VideoDecodeThread(
+            cap,
+            fps_val if fps_valid else 1000.0 / interval_ms,
+            target_size=target,
+            name=os.path.basename(video_path),
+            parent=self,
+        )
+        self._video_decoder.start()
+        # Poll at twice the frame rate; the decoder's clock decides what is due.
+        self.video_timer.start(max(5, interval_ms // 2))
+    def _hand_off_video_capture(self):
+        """Stop pane playback but keep its capture open for the fullscreen
+        viewer; returns ``(cap, next_frame)`` or ``(None, 0)``."""
+        decoder = getattr(self, '_video_decoder', None)
+        self._video_decoder = None
+        cap, next_frame = None, 0
+        if decoder is not None:
+            try:
+                cap, next_frame = decoder.detach()
+                decoder.log_stats()
+            except Exception:
+                pass
+        self.stop_video()
+        return cap, next_frame
+    def _stop_video_decoder(self):
+        """Stop the playback decode thread (it releases its capture) and log stats."""
+        decoder = getattr(self, '_video_decoder', None)
+        self._video_decoder = None
+        if decoder is None:
+            return
+        try:
+            decoder.stop()
+            decoder.log_stats()
+        except Exception:
+            pass
     def update_video_frame(self):
         try:
-            if self.playing_video and self.cap:
-                if not self.cap.isOpened():
-                    self.stop_video()
-                    self.video_label.setText(self.LABELS.get("cannot_open_video", "Cannot open video file."))
-                    return
-                ret, frame = self.cap.read()
-                if not ret:
-                    self.stop_video()
-                    self.video_label.setText(self.LABELS.get("cannot_open_video", "Cannot open video file."))
+            decoder = self._video_decoder
+            if self.playing_video and decoder:
+                qt_image = decoder.take_latest()
+                if qt_image is None:
+                    if decoder.at_end():
+                        self.stop_video()
+                        self.video_label.setText(self.LABELS.get("cannot_open_video", "Cannot open video file."))
                     return
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-                pixmap = QPixmap.fromImage(qt_image)
-                # Scale pixmap to fit the label while preserving aspect ratio
+                # Keep the decoder scaling to the current label size
                 try:
-                    target = self.video_label.contentsRect().size()
-                    if target.width() > 0 and target.height() > 0:
-                        pixmap = pixmap.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    decoder.set_target_size(self.video_label.contentsRect().size())
                 except Exception:
                     pass
-                self.video_label.setPixmap(pixmap)
+                self.video_label.setPixmap(QPixmap.fromImage(qt_image))
         except Exception as e:
             logging.error(f"Video frame update failed: {e}")
             self.stop_video()
@@ -2153,6 +2508,7 @@ class VideoAnnotationApp(QMainWindow):
     def stop_video(self):
         self.playing_video = False
         self.video_timer.stop()
+        self._stop_video_decoder()
         if self.cap:
             self.cap.release()
             self.cap = None
@@ -2171,12 +2527,18 @@ class VideoAnnotationApp(QMainWindow):
             self.video_timer.stop()
         except Exception:
             pass
+        self._stop_video_decoder()
         if getattr(self, 'cap', None):
             try:
                 self.cap.release()
             except Exception:
                 pass
             self.cap = None
+        try:
+            # Also close idle pooled captures so the file can be replaced.
+            shared_capture_manager().close_all()
+        except Exception:
+            pass
     def play_audio(self):
         if not self.current_video:
             return
@@ -2276,9 +2638,9 @@ class VideoAnnotationApp(QMainWindow):
     def _on_images_context_menu(self, pos: QPoint):
         try:
             # Select the item under the cursor if present
-            item = self.images_list.itemAt(pos)
-            if item is not None:
-                self.images_list.setCurrentItem(item)
+            index = self.images_list.indexAt(pos)
+            if index.isValid():
+                self.images_list.setCurrentIndex(index)
             menu = QMenu(self)
             copy_act = QAction(self.LABELS.get("copy_image", "Copy Image"), self)
             copy_act.triggered.connect(self._copy_current_image_to_clipboard)
@@ -2304,20 +2666,16 @@ class VideoAnnotationApp(QMainWindow):
                 menu.exec(QCursor.pos())
         except Exception:
             pass
+    def _selected_image_path(self) -> str:
+        """Full path of the selected image thumbnail, or "" if none."""
+        if getattr(self, 'images_list', None) is None:
+            return ""
+        index = self.images_list.currentIndex()
+        return (index.data(PathRole) or "") if index.isValid() else ""
     def _current_image_path(self) -> str:
         """Resolve full path of the currently selected image thumbnail."""
         try:
-            sel = getattr(self, 'images_list', None).currentItem() if getattr(self, 'images_list', None) else None
-            if sel is None:
-                return ""
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
-            if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
+            path = self._selected_image_path()
             if path and os.path.exists(path):
                 return path
         except Exception:
@@ -2325,18 +2683,10 @@ class VideoAnnotationApp(QMainWindow):
         return ""
     def _copy_current_image_to_clipboard(self):
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
-                return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
+            path = self._selected_image_path()
             if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
-            if not path or not os.path.exists(path):
+                return
+            if not os.path.exists(path):
                 return
             reader = QImageReader(path)
             img = reader.read()
@@ -2786,18 +3136,10 @@ class VideoAnnotationApp(QMainWindow):
             pass
     def _save_current_image_as(self):
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
-                return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
+            path = self._selected_image_path()
             if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
-            if not path or not os.path.exists(path):
+                return
+            if not os.path.exists(path):
                 return
             name = os.path.basename(path)
             dst, _ = QFileDialog.getSaveFileName(
@@ -2846,6 +3188,7 @@ class VideoAnnotationApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, self.LABELS.get("error_title", "Error"), f"Failed to import audio: {e}")
                 return
+            self.fs.note_recording(target_wav, True)
             try:
                 self.statusBar().showMessage(self.LABELS.get("metadata_saved", "Metadata saved!"))
             except Exception:
@@ -2858,6 +3201,7 @@ class VideoAnnotationApp(QMainWindow):
         seg = AudioSegment.from_file(src_path)
         seg = seg.set_channels(1).set_frame_rate(48000).set_sample_width(2)
         seg.export(target_wav, format="wav")
+        self.fs.note_recording(target_wav, True)
     def _clipboard_audio_to_tempfile(self, mime) -> str | None:
         try:
             # Prefer file URLs on the clipboard
@@ -3149,12 +3493,7 @@ class VideoAnnotationApp(QMainWindow):
                             # Refresh images and select the new file
                             imgs = self.fs.list_images()
                             self._on_images_updated(self.fs.current_folder, imgs)
-                            basename = os.path.basename(out_path)
-                            for i in range(self.images_list.count()):
-                                it = self.images_list.item(i)
-                                if it and (it.text() == basename or it.data(Qt.UserRole) == out_path):
-                                    self.images_list.setCurrentRow(i)
-                                    break
+                            self._select_image_path(out_path)
                             self.statusBar().showMessage(self.LABELS.get("image_imported", "Image imported"), 2000)
                         except Exception:
                             pass
@@ -3197,12 +3536,7 @@ class VideoAnnotationApp(QMainWindow):
             if not to_jpg:
                 imgs = self.fs.list_images()
                 self._on_images_updated(self.fs.current_folder, imgs)
-                basename = os.path.basename(dst_path)
-                for i in range(self.images_list.count()):
-                    it = self.images_list.item(i)
-                    if it and it.text() == basename:
-                        self.images_list.setCurrentRow(i)
-                        break
+                self._select_image_path(dst_path)
                 self.statusBar().showMessage(self.LABELS.get("image_imported", "Image imported"), 2000)
         except Exception:
             pass
@@ -3467,17 +3801,7 @@ class VideoAnnotationApp(QMainWindow):
             pass
     def _handle_paste_audio_image(self):
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
-                return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
-            if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
+            path = self._selected_image_path()
             if not path:
                 return
             existing = self.fs.find_existing_image_audio(path)
@@ -3515,17 +3839,7 @@ class VideoAnnotationApp(QMainWindow):
     def _handle_add_existing_audio_image(self):
         """Import an existing audio file for the selected image and convert to 16-bit 48 kHz WAV."""
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
-                return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
-            if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
+            path = self._selected_image_path()
             if not path:
                 return
             existing = self.fs.find_existing_image_audio(path)
@@ -3555,6 +3869,7 @@ class VideoAnnotationApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, self.LABELS.get("error_title", "Error"), f"Failed to import audio: {e}")
                 return
+            self.fs.note_recording(target_wav, True)
             try:
                 self.statusBar().showMessage(self.LABELS.get("metadata_saved", "Metadata saved!"))
             except Exception:
@@ -3583,9 +3898,9 @@ class VideoAnnotationApp(QMainWindow):
             return self.on_image_select()
         except Exception:
             pass
-    def _handle_open_fullscreen_image(self, item):
+    def _handle_open_fullscreen_image(self, index):
         try:
-            return self._open_fullscreen_image(item)
+            return self._open_fullscreen_image(index)
         except Exception:
             pass
     def toggle_recording(self):
@@ -3633,7 +3948,7 @@ class VideoAnnotationApp(QMainWindow):
             except Exception:
                 pass
             self.recording_thread = QThread()
-            self.recording_worker = AudioRecordingWorker(wav_path)
+            self.recording_worker = AudioRecordingWorker(wav_path, armed_input=self.armed_input)
             self.recording_worker.moveToThread(self.recording_thread)
             self.recording_thread.started.connect(self.recording_worker.run)
             self.recording_worker.finished.connect(self.recording_thread.quit)
@@ -3642,10 +3957,58 @@ class VideoAnnotationApp(QMainWindow):
             self.recording_worker.finished.connect(self.update_media_controls)
             self.recording_thread.finished.connect(self._on_recording_thread_finished)
             self.recording_worker.error.connect(self._show_worker_error)
+            self._attach_level_meter(self.recording_worker, getattr(self, 'record_meter', None))
             self.recording_thread.start()
+    def _update_armed_input(self):
+        """Arm the microphone while a kit is loaded and the mode is on."""
+        try:
+            if self.armed_input_enabled and self.fs.current_folder:
+                self.armed_input.arm()
+            elif self.armed_input.is_armed and not self.is_recording:
+                self.armed_input.disarm()
+        except Exception as e:
+            logging.info(f"Armed input unavailable: {e}")
+    def _on_armed_input_toggled(self, checked: bool):
+        self.armed_input_enabled = bool(checked)
+        self._update_armed_input()
+        self.save_settings()
+    def _on_preroll_changed(self, seconds: float):
+        self.armed_input.set_preroll(seconds)
+        self._update_armed_input()
+        self.save_settings()
+    def _attach_level_meter(self, worker, meter):
+        """Show ``meter`` for the take ``worker`` records."""
+        self._active_level_meter = meter
+        if meter is None:
+            return
+        try:
+            meter.reset()
+            meter.setVisible(True)
+            worker.levels.connect(meter.set_levels)
+        except Exception as e:
+            logging.info(f"Level meter unavailable: {e}")
+    def _detach_level_meter(self):
+        """Hide the take's meter and say so if the take clipped."""
+        meter = getattr(self, '_active_level_meter', None)
+        self._active_level_meter = None
+        if meter is None:
+            return
+        try:
+            meter.setVisible(False)
+            if meter.clipped:
+                self.statusBar().showMessage(
+                    self.LABELS.get("recording_clipped",
+                                    "The recording clipped ({count} samples at full scale); consider lowering the input level.")
+                    .format(count=meter.levels.clipped_total), 8000)
+        except Exception:
+            pass
     def _on_recording_thread_finished(self):
         self.recording_thread = None
         self.recording_worker = None
+        self._detach_level_meter()
+        # The new WAV changed the folder; rescan so list icons and grid
+        # badges (answered from memory) include it.
+        self.fs.refresh_recordings()
         # Ensure recording state resets on thread finish (videos and images)
         try:
             self.is_recording = False
@@ -3662,7 +4025,7 @@ class VideoAnnotationApp(QMainWindow):
             pass
         try:
             # Ensure grid overlays update when recording stops
-            self.images_list.viewport().update()
+            self._refresh_image_checks()
         except Exception:
             pass
     def closeEvent(self, event):
@@ -3680,6 +4043,18 @@ class VideoAnnotationApp(QMainWindow):
                     all_tab.cleanup()
             except Exception:
                 pass
+            try:
+                # Drop queued thumbnail decodes and let running ones finish
+                self._images_thumbs.cancel()
+            except Exception:
+                pass
+            try:
+                # A folder still being opened: stop its scan thread
+                self.fs.cancel_scan(wait=True)
+                # Keep recordings made this session in the kit's manifest
+                self.fs.save_manifest()
+            except Exception:
+                pass
             try:
                 self.stop_audio()
             except Exception:
@@ -3689,6 +4064,10 @@ class VideoAnnotationApp(QMainWindow):
                     self.stop_video()
             except Exception:
                 pass
+            try:
+                shared_capture_manager().close_all()
+            except Exception:
+                pass
             try:
                 if self.is_recording:
                     self.is_recording = False
@@ -3710,6 +4089,10 @@ class VideoAnnotationApp(QMainWindow):
                     self.update_recording_indicator()
             except Exception:
                 pass
+            try:
+                self.armed_input.disarm()
+            except Exception:
+                pass
             # Ensure persistent audio thread stops on app close
             try:
                 if self.audio_thread and self.audio_thread.isRunning():
@@ -3723,6 +4106,11 @@ class VideoAnnotationApp(QMainWindow):
                     self.join_thread.wait()
             except Exception:
                 pass
+            try:
+                # Every audio user is stopped: release PortAudio
+                shared_audio_engine().shutdown()
+            except Exception:
+                pass
         finally:
             super().closeEvent(event)
     def _launch_ocenaudio(self, file_paths: list) -> None:
@@ -3831,23 +4219,22 @@ class VideoAnnotationApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, self.LABELS["error_title"], str(e))
                 return
+            self.fs.note_recording(wav_path, False)
             self.update_media_controls()
 
     def _handle_edit_recording_ocenaudio_image(self):
-        sel = self.images_list.currentItem()
-        if sel is None:
+        path = self._selected_image_path()
+        if not path:
             return
-        path = sel.data(Qt.UserRole) or os.path.join(self.fs.current_folder or "", sel.text())
         wav_path = self.fs.find_existing_image_audio(path)
         if not wav_path:
             return
         self._launch_ocenaudio([wav_path])
 
     def _handle_delete_recording_image(self):
-        sel = self.images_list.currentItem()
-        if sel is None:
+        path = self._selected_image_path()
+        if not path:
             return
-        path = sel.data(Qt.UserRole) or os.path.join(self.fs.current_folder or "", sel.text())
         wav_path = self.fs.find_existing_image_audio(path)
         if not wav_path:
             return
@@ -3869,6 +4256,7 @@ class VideoAnnotationApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, self.LABELS["error_title"], str(e))
                 return
+            self.fs.note_recording(wav_path, False)
             self._update_image_record_controls(path)
 
     def export_wavs(self):
@@ -4119,21 +4507,20 @@ class VideoAnnotationApp(QMainWindow):
     def update_video_file_checks(self):
         if not self.fs.current_folder:
             return
+        # Pick up outside changes once; the per-item checks are in memory.
+        self.fs.refresh_recordings()
         all_mode = self._active_tab_key() == "all"
         for i in range(self.video_listbox.count()):
             item = self.video_listbox.item(i)
             if all_mode:
                 target = item.data(Qt.UserRole) or item.text()
-                wav_exists = self.fs.has_recording(target)
+                wav_exists = self.fs.has_recording(target, refresh=False)
             else:
-                wav_exists = os.path.exists(self.fs.wav_path_for(item.text()))
-            desired_icon = self._check_icon if wav_exists else self._empty_icon
-            item.setIcon(desired_icon)
-        # Update image badges
+                wav_exists = self.fs.recording_exists(self.fs.wav_path_for(item.text()))
+            self._set_drawer_check(item, wav_exists)
+        # Update image badges; only cells whose recording changed repaint
         try:
-            # Just trigger repaint; delegate will render overlays based on wav existence
-            if getattr(self, 'images_list', None):
-                self.images_list.viewport().update()
+            self._refresh_image_checks()
         except Exception:
             pass
     def go_prev(self):
@@ -4394,6 +4781,19 @@ class VideoAnnotationApp(QMainWindow):
         except Exception:
             pass
 
+    def _show_recovered_recordings(self):
+        """Tell the user which interrupted takes were saved at startup."""
+        try:
+            files = "\n".join(os.path.basename(p) for p in self._recovered_recordings)
+            QMessageBox.information(
+                self,
+                self.LABELS.get("recovered_recordings_title", "Recordings Recovered"),
+                self.LABELS.get("recovered_recordings_body",
+                                "These recordings were interrupted when the app last closed and have been saved:\n{files}").format(files=files),
+            )
+        except Exception as e:
+            logging.info(f"UI.recovered_recordings: {e}")
+
     def _show_welcome_dialog(self):
         """Display a brief purpose + best-practices message on startup."""
         try:
@@ -4498,7 +4898,11 @@ class VideoAnnotationApp(QMainWindow):
                 except Exception:
                     pass
             video_path = self._resolve_current_video_path()
-            viewer = FullscreenVideoViewer(video_path)
+            # Continue from the pane's current frame on its open capture.
+            capture, start_frame = None, 0
+            if self.playing_video:
+                capture, start_frame = self._hand_off_video_capture()
+            viewer = FullscreenVideoViewer(video_path, capture=capture, start_frame=start_frame)
             self._fullscreen_viewer = viewer
             viewer.showFullScreen()
             try:
@@ -4515,7 +4919,7 @@ class VideoAnnotationApp(QMainWindow):
         except Exception as e:
             logging.error(f"Failed to open fullscreen viewer: {e}")
 
-    def _open_fullscreen_image(self, item=None):
+    def _open_fullscreen_image(self, index=None):
         try:
             if getattr(self, 'images_list', None) is None:
                 return
@@ -4528,30 +4932,18 @@ class VideoAnnotationApp(QMainWindow):
                     return
             except Exception:
                 pass
-            if item is None:
-                sel = self.images_list.currentItem()
-                if sel is None:
-                    return
+            if index is None:
+                path = self._selected_image_path()
             else:
-                sel = item
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
+                path = index.data(PathRole) if index.isValid() else None
             if not path:
-                name = sel.text()
-                if not (self.fs.current_folder and name):
-                    return
-                path = os.path.join(self.fs.current_folder, name)
+                return
 
             # Use any cached pixmap if available so the fullscreen viewer
             # can display immediately on first open.
             cached_pix = None
             try:
-                cache = getattr(self, "_image_pixmap_cache", None)
-                if cache:
-                    cached_pix = cache.get(path)
+                cached_pix = self._pixmap_cache.get(path, TIER_FULL)
             except Exception:
                 cached_pix = None
 
@@ -4577,15 +4969,7 @@ class VideoAnnotationApp(QMainWindow):
     def _toggle_image_labels(self, checked: bool):
         try:
             self.show_image_labels = bool(checked)
-            files = []
-            for i in range(self.images_list.count()):
-                it = self.images_list.item(i)
-                fp = it.data(Qt.UserRole)
-                if fp:
-                    files.append(fp)
-            if not files:
-                files = self.fs.list_images()
-            self._populate_images_list(files)
+            self.images_model.set_labels(self.show_image_labels)
             try:
                 self._recompute_image_grid_sizes()
             except Exception:
@@ -4596,140 +4980,92 @@ class VideoAnnotationApp(QMainWindow):
     def _load_image_pixmap(self, path: str | None):
         """Load or retrieve a cached full-resolution pixmap for an image.
 
-        Uses QImageReader first for robustness, then falls back to
-        QPixmap. Successful loads are stored in self._image_pixmap_cache
-        so later fullscreen opens do not pay a first-decode penalty.
+        Decoding goes through vat.utils.media_decode.read_image (QImageReader,
+        then Pillow/pillow-heif). Successful loads are stored in the full tier
+        of the shared pixmap cache so later fullscreen opens do not pay a
+        first-decode penalty while memory stays within the configured ceiling.
         """
         if not path:
             return None
-        try:
-            cache = getattr(self, "_image_pixmap_cache", None)
-            if cache is None:
-                self._image_pixmap_cache = {}
-                cache = self._image_pixmap_cache
-        except Exception:
-            return None
-        pix = cache.get(path)
+        cache = self._pixmap_cache
+        pix = cache.get(path, TIER_FULL)
         if pix is not None and not pix.isNull():
             return pix
         try:
-            pix = QPixmap(path)
+            img = read_image(path)
+            if img is None or img.isNull():
+                return None
+            pix = QPixmap.fromImage(img)
             if pix.isNull():
-                # Try robust QImageReader first
-                try:
-                    reader = QImageReader(path)
-                    try:
-                        reader.setAutoTransform(True)
-                    except Exception:
-                        pass
-                    img = reader.read()
-                    if img and not img.isNull():
-                        pix = QPixmap.fromImage(img)
-                except Exception:
-                    img = None
-                # Fallback via Pillow (supports HEIC/HEIF with pillow-heif)
-                if (pix is None or pix.isNull()):
-                    try:
-                        from PIL import Image
-                        try:
-                            import pillow_heif
-                            try:
-                                pillow_heif.register_heif_opener()
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-                        im = Image.open(path)
-                        if im.mode not in ("RGB", "RGBA"):
-                            im = im.convert("RGB")
-                        from PIL.ImageQt import ImageQt
-                        qim = ImageQt(im)
-                        pix = QPixmap.fromImage(qim)
-                    except Exception:
-                        pass
-            if pix is None or pix.isNull():
                 return None
-            cache[path] = pix
+            cache.put(path, pix, TIER_FULL)
             return pix
         except Exception:
             return None
 
-    def _preload_visible_images(self):
-        """Warm the pixmap cache for all items currently visible in the grid."""
-        try:
-            if getattr(self, 'images_list', None) is None:
-                return
-            viewport = self.images_list.viewport()
-            if viewport is None:
-                return
-            vp_rect = viewport.rect()
-            for i in range(self.images_list.count()):
-                item = self.images_list.item(i)
-                if item is None:
-                    continue
-                rect = self.images_list.visualItemRect(item)
-                if (not rect.isValid()) or (not rect.intersects(vp_rect)):
-                    continue
-                path = None
-                try:
-                    path = item.data(Qt.UserRole)
-                except Exception:
-                    path = None
-                if not path:
-                    name = item.text()
-                    if self.fs.current_folder and name:
-                        path = os.path.join(self.fs.current_folder, name)
-                if path:
-                    self._load_image_pixmap(path)
-        except Exception:
-            pass
+    def _image_recorded(self, row: MediaRow) -> bool:
+        # In-memory lookup; refresh_recordings() picks up outside changes.
+        return self.fs.recording_exists(self.fs.wav_path_for_image(row.path))
+
+    def _refresh_image_checks(self) -> None:
+        """Repaint the grid cells whose recording came or went (only those)."""
+        if getattr(self, 'images_model', None) is not None:
+            self.images_model.refresh_recorded(self._image_recorded)
+
+    def _image_row(self, full: str) -> MediaRow:
+        row = MediaRow(full, full)
+        row.recorded = self._image_recorded(row)
+        return row
+
+    def _select_image_path(self, full: str) -> None:
+        index = self.images_model.index_of(full)
+        if index.isValid():
+            self.images_list.setCurrentIndex(index)
+
+    def _insert_image_item(self, full: str) -> None:
+        """Add one image to the grid at its sorted position."""
+        if getattr(self, 'images_list', None) is None or self.images_model.row_of(full) >= 0:
+            return
+        row = bisect.bisect_left(self.images_model.keys(), full)
+        self.images_model.insert_row(row, self._image_row(full))
+        if self.images_list.currentIndex().row() < 0:
+            self.images_list.setCurrentIndex(self.images_model.index(0))
+
+    def _remove_image_item(self, full: str) -> None:
+        if getattr(self, 'images_list', None) is None or self.images_model.remove_key(full) is None:
+            return
+        self._pixmap_cache.discard(full, TIER_FULL)
 
     def _populate_images_list(self, files: list):
+        """Show ``files`` in the grid, patching rows that are already there.
+
+        Images that stayed keep their row and thumbnail. A different folder
+        resets the model and cancels thumbnails still decoding for the old one.
+        Thumbnails are then requested only for rows in or near the viewport
+        (ViewportThumbnails), so a 10,000-image kit lists as fast as a small one.
+        """
         try:
             if getattr(self, 'images_list', None) is None:
                 return
-            self.images_list.clear()
             try:
                 self._recompute_image_grid_sizes()
             except Exception:
                 pass
-            icon_size = self.images_list.iconSize()
-            count = 0
-            for full in files:
-                name = os.path.basename(full)
-                item_text = name if getattr(self, 'show_image_labels', False) else ""
-                item = QListWidgetItem(item_text)
-                try:
-                    item.setData(Qt.UserRole, full)
-                except Exception:
-                    pass
-                try:
-                    pix = self._load_image_pixmap(full)
-                    if pix is not None and not pix.isNull():
-                        thumb = pix.scaled(icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        item.setIcon(QIcon(thumb))
-                    else:
-                        item.setIcon(self._empty_icon)
-                except Exception:
-                    item.setIcon(self._empty_icon)
-                self.images_list.addItem(item)
-                count += 1
-            if count > 0:
-                self.images_list.setCurrentRow(0)
-            # Delegate repaint checks; selection change will trigger banner update
-            self.update_video_file_checks()
+            self.fs.refresh_recordings()
+            if not self.images_model.sync_rows([self._image_row(full) for full in files]):
+                # Cancel thumbnails still decoding for the previous folder.
+                self._images_thumbs.reset()
+            count = self.images_model.rowCount()
+            if count > 0 and self.images_list.currentIndex().row() < 0:
+                self.images_list.setCurrentIndex(self.images_model.index(0))
+            self._images_thumbs.update()
             try:
                 logging.info(f"Images tab populated: count={count}; sample={[os.path.basename(f) for f in files[:3]]}")
             except Exception:
                 pass
-            # Avoid manual select handlers here; currentItemChanged will fire
+            # Avoid manual select handlers here; currentChanged will fire
         except Exception as e:
             logging.warning(f"Failed to refresh images from FS manager: {e}")
-        # Warm the cache for the thumbnails that are currently visible.
-        try:
-            self._preload_visible_images()
-        except Exception:
-            pass
 
     def _recompute_image_grid_sizes(self):
         if getattr(self, 'images_list', None) is None:
@@ -4796,8 +5132,8 @@ class VideoAnnotationApp(QMainWindow):
 
     def on_image_select(self):
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
+            path = self._selected_image_path()
+            if not path:
                 try:
                     self.image_thumb.clear()
                 except Exception:
@@ -4806,14 +5142,6 @@ class VideoAnnotationApp(QMainWindow):
                 self.stop_image_audio_button.setEnabled(False)
                 self.record_image_button.setEnabled(False)
                 return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
-            if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
             try:
                 logging.debug(f"UI.on_image_select: path={path}")
             except Exception:
@@ -4840,16 +5168,12 @@ class VideoAnnotationApp(QMainWindow):
 
     def _update_image_record_controls(self, path: str | None = None):
         try:
+            self.fs.refresh_recordings()
             # Resolve current selection path if not provided
             if not path:
-                sel = self.images_list.currentItem()
-                if sel is not None:
-                    try:
-                        path = sel.data(Qt.UserRole) or os.path.join(self.fs.current_folder or "", sel.text())
-                    except Exception:
-                        path = None
+                path = self._selected_image_path()
             # Resolve existing audio with compatibility (legacy basename.wav, root folder)
-            resolved = self.fs.find_existing_image_audio(path or "")
+            resolved = self.fs.find_existing_image_audio(path or "", refresh=False)
             wav_path = resolved or self.fs.wav_path_for_image(path or "")
             exists = bool(resolved)
             # Play/Stop audio reflect wav existence, but disable Play while actively playing
@@ -4879,9 +5203,9 @@ class VideoAnnotationApp(QMainWindow):
                 logging.debug(f"UI._update_image_record_controls: wav_path={wav_path}, exists={exists}, is_recording={self.is_recording}")
             except Exception:
                 pass
-            # Trigger repaint so delegate overlays reflect current state
+            # Repaint the cells whose overlay no longer matches
             try:
-                self.images_list.viewport().update()
+                self._refresh_image_checks()
             except Exception:
                 pass
         except Exception:
@@ -4889,17 +5213,9 @@ class VideoAnnotationApp(QMainWindow):
 
     def play_image_audio(self):
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
-                return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
+            path = self._selected_image_path()
             if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
+                return
             # Resolve existing audio; play if found
             wav_path = self.fs.find_existing_image_audio(path) or self.fs.wav_path_for_image(path)
             if not (wav_path and os.path.exists(wav_path)):
@@ -4975,17 +5291,9 @@ class VideoAnnotationApp(QMainWindow):
 
     def toggle_image_recording(self):
         try:
-            sel = self.images_list.currentItem()
-            if sel is None:
-                return
-            path = None
-            try:
-                path = sel.data(Qt.UserRole)
-            except Exception:
-                path = None
+            path = self._selected_image_path()
             if not path:
-                name = sel.text()
-                path = os.path.join(self.fs.current_folder or "", name)
+                return
             # If any existing audio (including legacy paths) exists, confirm overwrite
             existing = self.fs.find_existing_image_audio(path)
             wav_path = self.fs.wav_path_for_image(path)
@@ -5009,7 +5317,7 @@ class VideoAnnotationApp(QMainWindow):
             except Exception:
                 pass
             self.recording_thread = QThread()
-            self.recording_worker = AudioRecordingWorker(wav_path)
+            self.recording_worker = AudioRecordingWorker(wav_path, armed_input=self.armed_input)
             self.recording_worker.moveToThread(self.recording_thread)
             self.recording_thread.started.connect(self.recording_worker.run)
             self.recording_worker.finished.connect(self.recording_thread.quit)
@@ -5018,6 +5326,7 @@ class VideoAnnotationApp(QMainWindow):
             self.recording_worker.finished.connect(self.update_video_file_checks)
             self.recording_thread.finished.connect(self._on_recording_thread_finished)
             self.recording_worker.error.connect(self._show_worker_error)
+            self._attach_level_meter(self.recording_worker, getattr(self, 'image_record_meter', None))
             self.recording_thread.start()
         except Exception:
             pass
@@ -5054,11 +5363,6 @@ class VideoAnnotationApp(QMainWindow):
             except Exception:
                 pass
             self.update_video_file_checks()
-            try:
-                # Update the images grid visuals
-                self.images_list.viewport().update()
-            except Exception:
-                pass
         except Exception:
             pass
 
@@ -5098,7 +5402,7 @@ class VideoAnnotationApp(QMainWindow):
     # _position_format_badge removed with format badge
 
 
-class ImageGridDelegate(QStyledItemDelegate):
+class ImageGridDelegate(UniformCellDelegate):
     def __init__(self, fs_manager: FolderAccessManager, parent=None):
         super().__init__(parent)
         self.fs = fs_manager
@@ -5106,18 +5410,8 @@ class ImageGridDelegate(QStyledItemDelegate):
     def paint(self, painter, option, index):
         # Default painting first (thumbnail + optional text)
         super().paint(painter, option, index)
-        try:
-            path = index.data(Qt.UserRole)
-            if not path:
-                name = index.data(Qt.DisplayRole) or ""
-                parent_folder = getattr(getattr(self.parent(), 'fs', None), 'current_folder', None)
-                if parent_folder and name:
-                    path = os.path.join(parent_folder, name)
-            wav_path = self.fs.wav_path_for_image(path or "")
-            has_wav = bool(wav_path and os.path.exists(wav_path))
-        except Exception:
-            has_wav = False
-        if not has_wav:
+        # Kept current by MediaListModel.refresh_recorded (no lookup per paint).
+        if not index.data(RecordedRole):
             return
         try:
             painter.save()
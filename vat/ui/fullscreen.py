@@ -1,23 +1,34 @@
 import os
-import math
 import cv2
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QImage, QPixmap, QPainter, QColor, QFont, QGuiApplication, QImageReader
+from PySide6.QtGui import QPixmap, QPainter, QColor, QFont, QGuiApplication, QImageReader
+
+from vat.video.captures import shared_capture_manager
+from vat.video.clock import PlaybackClock, read_due
+from vat.video.frames import FrameBufferPool, frame_to_pixmap
 
 class FullscreenVideoViewer(QWidget):
     # Emitted when the zoom scale changes
     scale_changed = Signal(float)
 
-    def __init__(self, video_path: str, initial_scale: float | None = None, parent=None):
+    def __init__(self, video_path: str, initial_scale: float | None = None, parent=None,
+                 capture=None, start_frame: int = 0):
         super().__init__(parent)
         self.setAttribute(Qt.WA_DeleteOnClose, True)
         self.setFocusPolicy(Qt.StrongFocus)
         self.video_path = video_path
-        self.cap = None
+        # A pane that was already playing may hand over its open capture,
+        # positioned at ``start_frame``, so playback continues without a
+        # reopen or seek. Otherwise one is taken from the shared pool.
+        self.cap = capture
+        self._start_frame = max(0, int(start_frame)) if capture is not None else 0
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update_frame)
         self.playing = False
+        self._clock = None
+        self._next_frame = 0
+        self._frame_pool = FrameBufferPool(2)
         # Zoom scale; will be auto-fitted on first paint
         self.scale = 1.0
         self.offset_x = 0
@@ -32,32 +43,37 @@ class FullscreenVideoViewer(QWidget):
         self._start_video()
 
     def _start_video(self):
-        self.cap = cv2.VideoCapture(self.video_path)
-        if not self.cap.isOpened():
+        if self.cap is None:
+            self.cap = shared_capture_manager().acquire(self.video_path)
+        if self.cap is None or not self.cap.isOpened():
             self.close()
             return
         fps = float(self.cap.get(cv2.CAP_PROP_FPS) or 0.0)
-        if fps <= 0.0 or math.isnan(fps) or math.isinf(fps):
-            interval_ms = 33
-        else:
-            interval_ms = int(round(1000.0 / fps))
-            interval_ms = max(5, min(1000, interval_ms))
+        self._clock = PlaybackClock(fps, self._start_frame)
+        self._next_frame = self._start_frame
+        self._clock.start()
         self.playing = True
-        self.timer.start(interval_ms)
+        self.timer.start(self._poll_interval_ms())
+
+    def _poll_interval_ms(self) -> int:
+        # Poll at twice the frame rate; the clock decides which frame is shown.
+        return max(5, min(1000, int(round(500.0 / self._clock.fps))))
 
     def _update_frame(self):
         if not self.playing or not self.cap:
             return
-        ret, frame = self.cap.read()
+        due = self._clock.due_frame()
+        if due < self._next_frame:
+            return
+        ret, frame, index = read_due(self.cap, self._next_frame, due, self._clock, self._frame_pool)
         if not ret:
             self.playing = False
             self.timer.stop()
+            self._clock.log_summary(os.path.basename(self.video_path))
             return
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-        self._current_pixmap = QPixmap.fromImage(qt_image)
+        self._next_frame = index + 1
+        self._clock.presented(index)
+        self._current_pixmap = frame_to_pixmap(frame)
         self.update()
 
     def paintEvent(self, event):
@@ -117,15 +133,13 @@ class FullscreenVideoViewer(QWidget):
         if key == Qt.Key_Space:
             self.playing = not self.playing
             if self.playing and not self.timer.isActive():
-                fps = float(self.cap.get(cv2.CAP_PROP_FPS) or 0.0)
-                if fps <= 0.0 or math.isnan(fps) or math.isinf(fps):
-                    interval_ms = 33
-                else:
-                    interval_ms = int(round(1000.0 / fps))
-                    interval_ms = max(5, min(1000, interval_ms))
-                self.timer.start(interval_ms)
+                if self._clock is not None:
+                    self._clock.resume()
+                    self.timer.start(self._poll_interval_ms())
             elif not self.playing and self.timer.isActive():
                 self.timer.stop()
+                if self._clock is not None:
+                    self._clock.pause()
             event.accept()
             return
         if key in (Qt.Key_Plus, Qt.Key_Equal):
@@ -185,6 +199,8 @@ class FullscreenVideoViewer(QWidget):
         try:
             if self.timer.isActive():
                 self.timer.stop()
+                if self._clock is not None:
+                    self._clock.log_summary(os.path.basename(self.video_path))
         except Exception:
             pass
         try:
@@ -0,0 +1,74 @@
+from PySide6.QtCore import Qt, QRectF, QSize
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QPainter, QColor
+
+from vat.audio.metering import FLOOR_DB, Levels
+
+
+class LevelMeterWidget(QWidget):
+    """Horizontal input meter shown next to Record while a take runs.
+
+    The bar is the RMS level on a dBFS scale from FLOOR_DB to 0, with a tick
+    at the peak. The clip light at the right turns red at the first clipped
+    sample and stays red until reset(), so a single overload is not missed.
+    Updates arrive already throttled (AudioRecordingWorker.levels), so each
+    one just repaints.
+    """
+
+    CLIP_WIDTH = 10
+
+    def __init__(self, parent=None, labels=None):
+        super().__init__(parent)
+        self.LABELS = labels or {}
+        self.setMinimumSize(120, 12)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.levels = Levels()
+        self.clipped = False
+
+    def sizeHint(self):
+        return QSize(160, 14)
+
+    def reset(self):
+        self.levels = Levels()
+        self.clipped = False
+        self.setToolTip("")
+        self.update()
+
+    def set_levels(self, levels: Levels):
+        self.levels = levels
+        if levels.clipped_total:
+            self.clipped = True
+        try:
+            tip = self.LABELS.get("level_meter_tooltip", "Peak {peak:.1f} dBFS, RMS {rms:.1f} dBFS").format(
+                peak=levels.peak_db, rms=levels.rms_db)
+            if self.clipped:
+                tip += "\n" + self.LABELS.get("level_meter_clipped", "Clipped samples: {count}").format(
+                    count=levels.clipped_total)
+            self.setToolTip(tip)
+        except Exception:
+            pass
+        self.update()
+
+    @staticmethod
+    def _fraction(db: float) -> float:
+        return min(1.0, max(0.0, (db - FLOOR_DB) / -FLOOR_DB))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#202020"))
+        bar = QRectF(self.rect()).adjusted(1, 1, -(self.CLIP_WIDTH + 3), -1)
+        rms_db = self.levels.rms_db
+        if rms_db > -6.0:
+            color = QColor("#d03030")
+        elif rms_db > -18.0:
+            color = QColor("#e0c020")
+        else:
+            color = QColor("#30b030")
+        filled = QRectF(bar)
+        filled.setWidth(bar.width() * self._fraction(rms_db))
+        painter.fillRect(filled, color)
+        peak_x = bar.left() + bar.width() * self._fraction(self.levels.peak_db)
+        painter.fillRect(QRectF(peak_x - 1, bar.top(), 2, bar.height()), QColor("#f0f0f0"))
+        light = QRectF(bar.right() + 2, bar.top(), self.CLIP_WIDTH, bar.height())
+        painter.fillRect(light, QColor("#ff2020") if self.clipped else QColor("#402020"))
+        painter.end()
@@ -0,0 +1,222 @@
+"""Library dialog: browse the kit catalogue (vat/utils/library_catalog.py).
+
+Shows every kit under a root folder with how many of its items are recorded,
+can rescan the root in the background, and opens the chosen kit in the main
+window.
+"""
+
+import os
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, Qt, QThread, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView, QCheckBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView,
+    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout
+)
+
+from vat.utils.library_catalog import LibraryCatalog, KitSummary, ScanStats, format_duration
+
+
+class LibraryScanWorker(QObject):
+    """Runs ``LibraryCatalog.scan`` off the UI thread."""
+
+    progress = Signal(str)
+    finished = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, catalog: LibraryCatalog, root: str, full: bool = False):
+        super().__init__()
+        self.catalog = catalog
+        self.root = root
+        self.full = full
+        self._stop = False
+
+    def stop(self) -> None:
+        self._stop = True
+
+    def run(self) -> None:
+        try:
+            stats = self.catalog.scan(self.root, full=self.full, progress=self.progress.emit,
+                                      cancelled=lambda: self._stop)
+        except Exception as e:
+            self.error.emit(str(e))
+            self.finished.emit(None)
+            return
+        self.finished.emit(stats)
+
+
+class LibraryDialog(QDialog):
+    """Table of catalogued kits under a root folder."""
+
+    COLUMNS = ("kit", "recorded", "completion", "audio")
+
+    def __init__(self, catalog: LibraryCatalog, root: str = "", parent=None, labels: dict = None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.LABELS = labels or {}
+        self.selected_kit: Optional[str] = None
+        self._kits: List[KitSummary] = []
+        self._scan_thread: Optional[QThread] = None
+        self._scan_worker: Optional[LibraryScanWorker] = None
+        self.setWindowTitle(self.LABELS.get("library_title", "Kit Library"))
+        self.setMinimumSize(640, 420)
+        self._init_ui()
+        self.root_edit.setText(root or "")
+        self.refresh()
+
+    def _init_ui(self) -> None:
+        layout = QVBoxLayout(self)
+
+        root_row = QHBoxLayout()
+        root_row.addWidget(QLabel(self.LABELS.get("library_root", "Library folder:")))
+        self.root_edit = QLineEdit()
+        self.root_edit.editingFinished.connect(self.refresh)
+        root_row.addWidget(self.root_edit, 1)
+        browse_btn = QPushButton(self.LABELS.get("library_browse", "Browse…"))
+        browse_btn.clicked.connect(self._browse)
+        root_row.addWidget(browse_btn)
+        self.scan_button = QPushButton(self.LABELS.get("library_rescan", "Rescan"))
+        self.scan_button.clicked.connect(lambda: self.start_scan())
+        root_row.addWidget(self.scan_button)
+        layout.addLayout(root_row)
+
+        self.incomplete_check = QCheckBox(self.LABELS.get("library_incomplete_only", "Only kits missing recordings"))
+        self.incomplete_check.toggled.connect(self.refresh)
+        layout.addWidget(self.incomplete_check)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([
+            self.LABELS.get("library_col_kit", "Kit"),
+            self.LABELS.get("library_col_recorded", "Recorded"),
+            self.LABELS.get("library_col_completion", "Complete"),
+            self.LABELS.get("library_col_audio", "Audio"),
+        ])
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        try:
+            header = self.table.horizontalHeader()
+            header.setSectionResizeMode(0, QHeaderView.Stretch)
+            for col in range(1, len(self.COLUMNS)):
+                header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        except Exception:
+            pass
+        self.table.doubleClicked.connect(lambda _idx: self.open_selected())
+        layout.addWidget(self.table, 1)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.status_label)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.open_button = QPushButton(self.LABELS.get("library_open_kit", "Open Kit"))
+        self.open_button.clicked.connect(self.open_selected)
+        buttons.addWidget(self.open_button)
+        close_btn = QPushButton(self.LABELS.get("library_close", "Close"))
+        close_btn.clicked.connect(self.reject)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def root(self) -> str:
+        text = self.root_edit.text().strip()
+        return os.path.abspath(text) if text else ""
+
+    def _browse(self) -> None:
+        folder = QFileDialog.getExistingDirectory(
+            self, self.LABELS.get("library_root_dialog", "Select Library Folder"), self.root() or os.path.expanduser("~"))
+        if folder:
+            self.root_edit.setText(folder)
+            self.start_scan()
+
+    def refresh(self) -> None:
+        """Reload the table from the catalogue (no disk scan)."""
+        root = self.root()
+        self._kits = self.catalog.kits(root, incomplete_only=self.incomplete_check.isChecked()) if root else []
+        self.table.setRowCount(len(self._kits))
+        for row, kit in enumerate(self._kits):
+            try:
+                name = os.path.relpath(kit.path, root)
+            except ValueError:
+                name = kit.path
+            cells = (
+                name if name != "." else os.path.basename(kit.path),
+                f"{kit.recorded_count}/{kit.media_count}",
+                f"{kit.completion * 100:.0f}%",
+                format_duration(kit.recorded_seconds),
+            )
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if col == 0:
+                    item.setToolTip(kit.path)
+                    item.setData(Qt.UserRole, kit.path)
+                else:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+        done = sum(1 for k in self._kits if k.complete)
+        self.status_label.setText(
+            self.LABELS.get("library_summary", "{count} kit(s), {done} complete").format(count=len(self._kits), done=done))
+        self.open_button.setEnabled(bool(self._kits))
+
+    def start_scan(self, full: bool = False) -> bool:
+        """Rescan the root in a worker thread; the table refreshes when done."""
+        root = self.root()
+        if not root or self._scan_thread is not None:
+            return False
+        self.scan_button.setEnabled(False)
+        self.status_label.setText(self.LABELS.get("library_scanning", "Scanning…"))
+        self._scan_thread = QThread(self)
+        self._scan_worker = LibraryScanWorker(self.catalog, root, full)
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.progress.connect(self._on_scan_progress)
+        self._scan_worker.error.connect(self._on_scan_error)
+        self._scan_worker.finished.connect(self._on_scan_finished)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_worker.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.start()
+        return True
+
+    def _on_scan_progress(self, kit: str) -> None:
+        self.status_label.setText(self.LABELS.get("library_scanning_kit", "Scanning {kit}…").format(kit=kit))
+
+    def _on_scan_error(self, message: str) -> None:
+        self.status_label.setText(message)
+
+    def _on_scan_finished(self, stats: Optional[ScanStats]) -> None:
+        thread = self._scan_thread
+        self._scan_thread = None
+        self._scan_worker = None
+        if thread is not None:
+            thread.wait(2000)
+            thread.deleteLater()
+        self.scan_button.setEnabled(True)
+        if stats is not None:
+            self.refresh()
+
+    def is_scanning(self) -> bool:
+        return self._scan_thread is not None
+
+    def open_selected(self) -> None:
+        row = self.table.currentRow()
+        if not (0 <= row < len(self._kits)):
+            return
+        self.selected_kit = self._kits[row].path
+        self.accept()
+
+    def stop_scan(self) -> None:
+        """Cancel a running scan and wait for the worker to finish its directory."""
+        thread = self._scan_thread
+        if thread is None:
+            return
+        try:
+            self._scan_worker.stop()
+        except RuntimeError:
+            pass
+        thread.quit()
+        thread.wait()
+
+    def done(self, result: int) -> None:
+        self.stop_scan()
+        super().done(result)
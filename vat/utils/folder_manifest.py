@@ -0,0 +1,138 @@
+"""Saved listing of a kit folder, so the last kit reopens without a rescan.
+
+At startup the window used to ``set_folder`` the last kit, which listed the
+whole folder (and its ``images/`` subfolder) before the window could show.
+On a NAS kit of a few thousand items that took seconds.
+
+A manifest is a small JSON file per folder under
+``~/.videooralannotation/manifests``. It holds what a ``MediaIndex`` holds:
+the media lists, the WAVs, the recording set, the kinds of files classified
+by content and the modification time of every scanned directory. Paths are
+stored relative to the folder. Files are named after a hash of the folder's
+absolute path, and only the ``MAX_MANIFESTS`` most recently written are
+kept.
+
+``load_manifest`` turns a manifest back into a ``MediaIndex``. Its
+``is_current()`` check is the same one a live index uses (one stat per
+directory), so callers can tell whether the saved listing can be trusted
+as it is or only shown until a rescan catches up.
+
+Thumbnails and video posters need nothing from the manifest: their cache
+entries are addressed by (path, size, mtime, box), so a reopened grid finds
+them on its own.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from vat.utils.media_index import MediaIndex, recording_key
+
+MANIFEST_VERSION = 1
+MAX_MANIFESTS = 32
+
+
+def default_manifest_dir() -> str:
+    return os.path.join(os.path.expanduser("~/.videooralannotation"), "manifests")
+
+
+def manifest_path(folder: str, root: Optional[str] = None) -> str:
+    """File the manifest of ``folder`` is stored in."""
+    key = hashlib.sha1(os.path.abspath(folder).encode("utf-8", "surrogatepass")).hexdigest()
+    return os.path.join(root or default_manifest_dir(), f"{key}.json")
+
+
+def _rel(path: str, base: str) -> str:
+    rel = os.path.relpath(path, base)
+    return "" if rel == os.curdir else rel
+
+
+def _join(base: str, rel: str) -> str:
+    return os.path.join(base, rel) if rel else base
+
+
+def save_manifest(index: MediaIndex, root: Optional[str] = None) -> bool:
+    """Write the manifest for ``index.folder``; False if it could not be written."""
+    folder = index.folder
+    folder_key = recording_key(folder)
+    data = {
+        "version": MANIFEST_VERSION,
+        "folder": os.path.abspath(folder),
+        "scanned_at": index.scanned_at,
+        "dirs": {_rel(d, folder): mtime for d, mtime in index.dir_mtimes.items()},
+        "videos": [_rel(p, folder) for p in index.videos],
+        "images": [_rel(p, folder) for p in index.images],
+        "wavs": [_rel(p, folder) for p in index.wavs],
+        "subfolder_wavs": [_rel(p, folder) for p in index.subfolder_wavs],
+        "metadata": _rel(index.metadata, folder) if index.metadata else None,
+        "recordings": sorted(_rel(k, folder_key) for k in index.recordings),
+        "kinds": {_rel(p, folder): kind for p, kind in index.kinds.items()},
+    }
+    path = manifest_path(folder, root)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except (OSError, ValueError) as e:
+        logging.debug(f"save_manifest failed for {folder}: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+    _prune(os.path.dirname(path))
+    return True
+
+
+def load_manifest(folder: str, root: Optional[str] = None) -> Optional[MediaIndex]:
+    """The saved index of ``folder``, or None if there is no usable manifest.
+
+    The index is returned as saved; check ``is_current()`` before trusting it.
+    """
+    try:
+        with open(manifest_path(folder, root), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION or data.get("folder") != os.path.abspath(folder):
+            return None
+        dirs: Dict[str, int] = {_join(folder, rel): int(mtime) for rel, mtime in data["dirs"].items()}
+
+        def paths(name: str) -> List[str]:
+            return [_join(folder, rel) for rel in data[name]]
+
+        folder_key = recording_key(folder)
+        metadata = data.get("metadata")
+        return MediaIndex(
+            folder=folder,
+            videos=paths("videos"),
+            images=paths("images"),
+            wavs=paths("wavs"),
+            subfolder_wavs=paths("subfolder_wavs"),
+            metadata=_join(folder, metadata) if metadata else None,
+            recordings={recording_key(_join(folder_key, rel)) for rel in data["recordings"]},
+            dir_mtimes=dirs,
+            dir_keys={recording_key(d) for d in dirs},
+            scanned_at=float(data["scanned_at"]),
+            kinds={_join(folder, rel): kind for rel, kind in data.get("kinds", {}).items()},
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logging.debug(f"load_manifest: ignoring manifest for {folder}: {e}")
+        return None
+
+
+def _prune(root: str) -> None:
+    """Keep only the MAX_MANIFESTS most recently written manifests."""
+    try:
+        entries: List[os.DirEntry] = [e for e in os.scandir(root) if e.name.endswith(".json")]
+        if len(entries) <= MAX_MANIFESTS:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+        for entry in entries[MAX_MANIFESTS:]:
+            os.remove(entry.path)
+    except OSError as e:
+        logging.debug(f"manifest prune failed in {root}: {e}")
@@ -0,0 +1,92 @@
+"""Debounced change notifications for the current kit folder.
+
+``FolderWatcher`` watches a set of directories (the kit folder and its
+``images/`` subfolder) with ``QFileSystemWatcher``. On network shares, where
+native notifications are often missing, a slow poll compares directory
+mtimes instead (one stat per directory). Bursts of events, such as a
+recording being written, ffmpeg writing a converted file or a copy of many
+files, are collapsed into a single ``changed`` signal after ``debounce_ms``
+of quiet.
+
+The watcher only says "something changed". ``FolderAccessManager`` rescans
+and works out what was added or removed.
+"""
+
+import logging
+import os
+from typing import Dict, Iterable
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+DEFAULT_DEBOUNCE_MS = 300
+DEFAULT_POLL_MS = 5000
+
+
+class FolderWatcher(QObject):
+    """Signals:
+        changed(): one of the watched directories changed (debounced).
+    """
+
+    changed = Signal()
+
+    def __init__(self, debounce_ms: int = DEFAULT_DEBOUNCE_MS, poll_ms: int = DEFAULT_POLL_MS, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_event)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(max(0, int(debounce_ms)))
+        self._debounce.timeout.connect(self.changed)
+        self._poll = QTimer(self)
+        self._poll.setInterval(max(100, int(poll_ms)))
+        self._poll.timeout.connect(self._check_mtimes)
+        self._mtimes: Dict[str, int] = {}
+
+    def watch(self, dirs: Iterable[str]) -> None:
+        """Watch exactly ``dirs`` (replacing any previous set)."""
+        dirs = [d for d in dirs if d]
+        current = set(self._watcher.directories())
+        stale = [d for d in current if d not in dirs]
+        if stale:
+            self._watcher.removePaths(stale)
+        new = [d for d in dirs if d not in current]
+        if new:
+            failed = self._watcher.addPaths(new)
+            if failed:
+                try:
+                    logging.info(f"FolderWatcher: native watch unavailable for {failed}; polling only")
+                except Exception:
+                    pass
+        self._mtimes = {d: self._mtime(d) for d in dirs}
+        if dirs:
+            self._poll.start()
+        else:
+            self._poll.stop()
+
+    def stop(self) -> None:
+        self.watch([])
+        self._debounce.stop()
+
+    def directories(self):
+        return list(self._mtimes)
+
+    @staticmethod
+    def _mtime(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return -1
+
+    def _on_event(self, _path: str = "") -> None:
+        # Restart the quiet period on every event of a burst.
+        self._debounce.start()
+
+    def _check_mtimes(self) -> None:
+        changed = False
+        for d, old in list(self._mtimes.items()):
+            now = self._mtime(d)
+            if now != old:
+                self._mtimes[d] = now
+                changed = True
+        if changed:
+            self._on_event()
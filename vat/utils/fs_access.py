@@ -1,8 +1,14 @@
 import os
 import logging
-from typing import List, Optional, Dict
-from PySide6.QtCore import QObject, Signal
-from vat.utils.media_naming import media_type as _media_type, recording_name_for as _recording_name_for
+from typing import Iterable, List, Optional, Dict, Tuple
+from PySide6.QtCore import QObject, Qt, QThread, Signal
+from vat.utils.media_naming import (
+    IMAGE_EXTS as _IMAGE_EXTS, VIDEO_EXTS as _VIDEO_EXTS, media_type as _media_type,
+    recording_name_for as _recording_name_for
+)
+from vat.utils.media_index import MediaIndex, RecordingStatus, ScanCancelled, recording_status as _recording_status, scan_folder
+from vat.utils.folder_watcher import FolderWatcher
+from vat.utils.folder_manifest import load_manifest, save_manifest
 
 
 class FolderAccessError(Exception):
@@ -17,6 +23,67 @@ class FolderNotFoundError(FolderAccessError):
     pass
 
 
+class FolderScanWorker(QObject):
+    """Checks and scans one folder off the UI thread (see open_folder_async).
+
+    ``page`` carries a sorted snapshot of the index after the first
+    ``page_size`` entries; ``progress`` the number of entries read so far.
+    ``finished`` carries the complete index (None on failure or cancel) and
+    the errors from the hidden-file cleanup.
+    """
+
+    page = Signal(int, object)
+    progress = Signal(int, int)
+    finished = Signal(int, object, list)
+    failed = Signal(int, str, str)
+
+    def __init__(self, manager: "FolderAccessManager", generation: int, folder: str,
+                 page_size: int, cleanup_hidden: bool):
+        super().__init__()
+        self.manager = manager
+        self.generation = generation
+        self.folder = folder
+        self.page_size = page_size
+        self.cleanup_hidden = cleanup_hidden
+        self._cancelled = False
+        self._paged = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def _on_page(self, index: MediaIndex, seen: int) -> None:
+        if not self._paged:
+            self._paged = True
+            self.page.emit(self.generation, index.snapshot())
+        self.progress.emit(self.generation, seen)
+
+    def run(self) -> None:
+        folder = self.folder
+        index = None
+        errors: List[str] = []
+        try:
+            if not os.path.isdir(folder):
+                raise FolderNotFoundError(folder)
+            if not FolderAccessManager.is_accessible(folder):
+                raise FolderPermissionError(folder)
+            if self.cleanup_hidden:
+                errors = self.manager.cleanup_hidden_files(folder)
+            index = scan_folder(folder, self.manager.VIDEO_EXTS, self.manager.IMAGE_EXTS,
+                                on_page=self._on_page, page_size=self.page_size,
+                                cancelled=lambda: self._cancelled, sniff=self.manager.SNIFF_UNKNOWN)
+        except ScanCancelled:
+            index = None
+        except FolderAccessError as e:
+            self.failed.emit(self.generation, type(e).__name__, str(e))
+        except PermissionError:
+            self.failed.emit(self.generation, FolderPermissionError.__name__, folder)
+        except FileNotFoundError:
+            self.failed.emit(self.generation, FolderNotFoundError.__name__, folder)
+        except Exception as e:
+            self.failed.emit(self.generation, FolderAccessError.__name__, str(e))
+        self.finished.emit(self.generation, index, errors)
+
+
 class FolderAccessManager(QObject):
     """Centralized folder access checks and helpers to keep UI in sync.
 
@@ -24,20 +91,69 @@ class FolderAccessManager(QObject):
     - folderChanged(str): emitted with the new folder path (or empty string when cleared)
     - videosUpdated(list): emitted with the latest list of video file paths
     - metadataChanged(str): emitted with the latest metadata text after writes
+    - mediaAdded(list) / mediaRemoved(list): video and image paths that appeared
+      in or disappeared from the current folder since the last full update
+    - recordingsChanged(list): WAV paths that were created or deleted
+
+    The fine-grained signals come from a FolderWatcher on the current folder
+    (or an explicit rescan_changes()), so views can patch single rows instead
+    of rebuilding on every change.
+
+    ``open_folder_async`` opens a folder without blocking the UI: the checks
+    and the scan run in a FolderScanWorker. folderChanged, videosUpdated and
+    imagesUpdated fire once the first page of entries is read (list calls
+    meanwhile answer from that partial index). Items and recordings found
+    later arrive as mediaAdded/recordingsChanged, as if the watcher had seen
+    them. Also:
+    - scanProgress(str, int): folder and number of entries read so far
+    - scanFinished(str, list): folder and hidden-file cleanup errors
+    - scanFailed(str, str, str): folder, error type name and message
+
+    With a ``manifest_dir`` the listing of every fully scanned folder is saved
+    there (vat/utils/folder_manifest.py) and ``reopen_folder`` shows a kit from
+    it without waiting for a scan.
     """
 
     folderChanged = Signal(str)
     videosUpdated = Signal(list)
     metadataChanged = Signal(str)
     imagesUpdated = Signal(str, list)
-
-    VIDEO_EXTS = (".mpg", ".mpeg", ".mp4", ".avi", ".mkv", ".mov")
-
-    def __init__(self):
+    mediaAdded = Signal(list)
+    mediaRemoved = Signal(list)
+    recordingsChanged = Signal(list)
+    scanProgress = Signal(str, int)
+    scanFinished = Signal(str, list)
+    scanFailed = Signal(str, str, str)
+
+    # Extension tables live in vat/utils/media_naming.py
+    VIDEO_EXTS = _VIDEO_EXTS
+    IMAGE_EXTS = _IMAGE_EXTS
+    # Classify files with no known suffix by their content when scanning
+    SNIFF_UNKNOWN = True
+    # Folders whose media index is kept (the current kit plus recent ones).
+    MAX_INDEXES = 4
+    # Directory entries read before an async open publishes its first page.
+    SCAN_PAGE_SIZE = 500
+
+    def __init__(self, manifest_dir: Optional[str] = None):
         super().__init__()
         self.current_folder: Optional[str] = None
+        # Where folder manifests are kept (None: not saved or used)
+        self.manifest_dir = manifest_dir
         self._videos_cache: List[str] = []
         self._images_cache: List[str] = []
+        self._indexes: Dict[str, MediaIndex] = {}
+        # The index views were last built from; watcher diffs are taken
+        # against it so a change is reported exactly once.
+        self._published: Optional[MediaIndex] = None
+        self._watcher: Optional[FolderWatcher] = None
+        # Async open: the running worker, its generation (results of older
+        # generations are dropped) and the partial index views were built from.
+        self._scan_generation = 0
+        self._scan: Optional[Tuple[QThread, FolderScanWorker]] = None
+        # Every started (thread, worker), kept referenced until it finishes
+        self._scan_threads: List[Tuple[QThread, FolderScanWorker]] = []
+        self._pending: Optional[MediaIndex] = None
 
     @staticmethod
     def is_accessible(path: str) -> bool:
@@ -54,51 +170,366 @@ class FolderAccessManager(QObject):
             return False
 
     def set_folder(self, path: str) -> bool:
+        """Open ``path`` synchronously (startup restore, scripts, tests).
+
+        Cancels an async open in progress.
+        """
+        self.cancel_scan()
         if path and os.path.isdir(path) and self.is_accessible(path):
             try:
                 logging.info(f"FS.set_folder: path={path}")
             except Exception:
                 pass
             self.current_folder = path
+            # Opening a folder always rescans it; the list helpers below and
+            # the folderChanged handlers then share that one index.
+            self.invalidate_index(path)
             try:
                 self.folderChanged.emit(path)
             except Exception:
                 pass
             self._refresh_videos()
             self._refresh_images()
+            self._publish(self._indexes.get(path))
+            self.save_manifest()
             return True
         return False
 
+    def reopen_folder(self, path: str) -> bool:
+        """Reopen a kit from its manifest (startup restore of the last folder).
+
+        Views build from the saved listing at once. If none of the folder's
+        directories changed since it was saved, that listing is used as the
+        index. Otherwise open_folder_async() rescans in the background and the
+        differences arrive as mediaAdded/mediaRemoved/recordingsChanged.
+        Without a usable manifest this is set_folder().
+        """
+        manifest = load_manifest(path, self.manifest_dir) if (path and self.manifest_dir) else None
+        if manifest is None or not os.path.isdir(path):
+            return self.set_folder(path)
+        current = manifest.is_current()
+        try:
+            logging.info(f"FS.reopen_folder: path={path}, manifest {'current' if current else 'stale, rescanning'}")
+        except Exception:
+            pass
+        if current:
+            self.cancel_scan()
+            self._store_index(path, manifest)
+        else:
+            self.open_folder_async(path)
+            self._pending = manifest
+        self._show_folder(path)
+        return True
+
+    def open_folder_async(self, path: str, cleanup_hidden: bool = False) -> bool:
+        """Open ``path`` with the checks and scan on a worker thread.
+
+        Cancels any open still in progress (its results are dropped). With
+        ``cleanup_hidden`` the worker runs cleanup_hidden_files() first.
+        Returns False only when no path is given; failures arrive as
+        scanFailed.
+        """
+        if not path:
+            return False
+        self.cancel_scan()
+        self._scan_generation += 1
+        try:
+            logging.info(f"FS.open_folder_async: path={path}")
+        except Exception:
+            pass
+        thread = QThread()
+        worker = FolderScanWorker(self, self._scan_generation, path, self.SCAN_PAGE_SIZE, cleanup_hidden)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.page.connect(self._on_scan_page)
+        worker.progress.connect(self._on_scan_progress)
+        worker.failed.connect(self._on_scan_failed)
+        worker.finished.connect(self._on_scan_finished)
+        # Direct: cancel_scan(wait=True) blocks the loop a queued quit needs
+        worker.finished.connect(thread.quit, Qt.DirectConnection)
+        self._scan = (thread, worker)
+        # Cancelled scans finish their current entry in the background.
+        self._scan_threads = [(t, w) for t, w in self._scan_threads if not t.isFinished()]
+        self._scan_threads.append(self._scan)
+        thread.start()
+        return True
+
+    def is_scanning(self) -> bool:
+        return self._scan is not None
+
+    def cancel_scan(self, wait: bool = False) -> None:
+        """Stop an async open in progress; ``wait`` blocks until its thread ends."""
+        scan, self._scan = self._scan, None
+        self._scan_generation += 1
+        if self._pending is not None:
+            # Views were built from a partial index; the next list call rescans.
+            self._pending = None
+            if self.current_folder:
+                self.invalidate_index(self.current_folder)
+        if scan is not None:
+            try:
+                scan[1].cancel()
+            except RuntimeError:
+                pass
+        if wait:
+            for thread, _worker in self._scan_threads:
+                thread.wait()
+            self._scan_threads = []
+
+    def _scan_folder(self, generation: int) -> Optional[str]:
+        """Folder of the running scan if ``generation`` is still current."""
+        if generation != self._scan_generation or self._scan is None:
+            return None
+        return self._scan[1].folder
+
+    def _on_scan_page(self, generation: int, index: MediaIndex) -> None:
+        folder = self._scan_folder(generation)
+        if folder is None or self._pending is not None:
+            # Stale, or views already show the folder's manifest.
+            return
+        try:
+            logging.info(f"FS.open_folder_async: first page path={folder}, videos={len(index.videos)}, images={len(index.images)}")
+        except Exception:
+            pass
+        self._pending = index
+        self._show_folder(folder)
+
+    def _on_scan_progress(self, generation: int, seen: int) -> None:
+        folder = self._scan_folder(generation)
+        if folder is not None:
+            try:
+                self.scanProgress.emit(folder, int(seen))
+            except Exception:
+                pass
+
+    def _on_scan_failed(self, generation: int, kind: str, message: str) -> None:
+        folder = self._scan_folder(generation)
+        if folder is None:
+            return
+        try:
+            logging.info(f"FS.open_folder_async: failed path={folder}: {kind}: {message}")
+        except Exception:
+            pass
+        try:
+            self.scanFailed.emit(folder, kind, message)
+        except Exception:
+            pass
+
+    def _on_scan_finished(self, generation: int, index: Optional[MediaIndex], errors: list) -> None:
+        folder = self._scan_folder(generation)
+        if folder is None:
+            return
+        self._scan = None
+        if index is None:
+            self.cancel_scan()
+            return
+        self._store_index(folder, index)
+        if self._pending is None:
+            # Small folder: the whole scan fit in the first page.
+            self._show_folder(folder)
+        else:
+            self._pending = None
+            self._apply_index(index)
+        self.save_manifest()
+        try:
+            self.scanFinished.emit(folder, list(errors))
+        except Exception:
+            pass
+
+    def _show_folder(self, folder: str) -> None:
+        """Make ``folder`` current and let views build from its index."""
+        self.current_folder = folder
+        try:
+            self.folderChanged.emit(folder)
+        except Exception:
+            pass
+        self._refresh_videos()
+        self._refresh_images()
+        self._publish(self._pending or self._indexes.get(folder))
+
     def clear_folder(self) -> None:
+        self.cancel_scan()
         self.current_folder = None
+        self._publish(None)
         try:
             self.folderChanged.emit("")
         except Exception:
             pass
         self._videos_cache = []
 
-    def list_videos(self, path: Optional[str] = None) -> List[str]:
+    def _publish(self, index: Optional[MediaIndex]) -> None:
+        """Remember what the views now show and watch its directories."""
+        self._published = index
+        if index is None:
+            if self._watcher is not None:
+                self._watcher.stop()
+            return
+        if self._watcher is None:
+            self._watcher = FolderWatcher(parent=self)
+            self._watcher.changed.connect(self.rescan_changes)
+        self._watcher.watch(list(index.dir_mtimes))
+
+    def rescan_changes(self) -> None:
+        """Rescan the current folder and emit what changed since the last
+        full or incremental update (mediaRemoved, mediaAdded,
+        recordingsChanged; only non-empty ones)."""
+        folder = self.current_folder
+        if not folder or self._published is None or self._scan is not None:
+            return
+        self.invalidate_index(folder)
+        try:
+            new = self.media_index(folder)
+        except FolderAccessError as e:
+            try:
+                logging.info(f"FS.rescan_changes: folder unavailable: {e}")
+            except Exception:
+                pass
+            return
+        self._apply_index(new)
+        self.save_manifest()
+
+    def _apply_index(self, new: MediaIndex) -> None:
+        """Publish ``new`` and emit what changed since the published index."""
+        old = self._published
+        self._publish(new)
+        if old is None:
+            return
+        old_media = set(old.videos) | set(old.images)
+        new_media = set(new.videos) | set(new.images)
+        added = sorted(new_media - old_media)
+        removed = sorted(old_media - new_media)
+        recordings = sorted(set(old.wavs + old.subfolder_wavs) ^ set(new.wavs + new.subfolder_wavs))
+        self._videos_cache = list(new.videos)
+        self._images_cache = list(new.images)
+        if added or removed or recordings:
+            try:
+                logging.info(f"FS.rescan_changes: added={len(added)} removed={len(removed)} recordings={len(recordings)}")
+            except Exception:
+                pass
+        try:
+            if removed:
+                self.mediaRemoved.emit(removed)
+            if added:
+                self.mediaAdded.emit(added)
+            if recordings:
+                self.recordingsChanged.emit(recordings)
+        except Exception:
+            pass
+
+    def media_index(self, path: Optional[str] = None) -> Optional[MediaIndex]:
+        """One-pass index of videos, images, WAVs and metadata in a folder.
+
+        Reused while the folder (and its images/ subfolder) is unchanged;
+        rescanned otherwise. Returns None when no folder is given or set.
+        """
         folder = path or self.current_folder
         if not folder:
-            return []
+            return None
+        if self._pending is not None and folder == self.current_folder:
+            # Async open still running: answer from its first page.
+            return self._pending
+        previous = self._indexes.get(folder)
+        if previous is not None and previous.is_current():
+            return previous
         if not os.path.isdir(folder):
             raise FolderNotFoundError(folder)
-        if not self.is_accessible(folder):
+        if not os.access(folder, os.R_OK | os.X_OK):
             raise FolderPermissionError(folder)
         try:
-            files = []
-            for name in os.listdir(folder):
-                full = os.path.join(folder, name)
-                if os.path.isfile(full) and name.lower().endswith(self.VIDEO_EXTS):
-                    files.append(full)
-            files.sort()
-            return files
+            index = scan_folder(folder, self.VIDEO_EXTS, self.IMAGE_EXTS, sniff=self.SNIFF_UNKNOWN)
         except PermissionError:
             raise FolderPermissionError(folder)
         except FileNotFoundError:
             raise FolderNotFoundError(folder)
         except Exception as e:
             raise FolderAccessError(str(e))
+        if previous is not None and index.dir_mtimes == previous.dir_mtimes:
+            # Nothing changed between two scans: stop rescanning this one
+            index.settled = True
+        self._store_index(folder, index)
+        return index
+
+    def save_manifest(self) -> bool:
+        """Save the current folder's index as its manifest (no-op without a
+        ``manifest_dir``, during an async open or before a full scan)."""
+        folder = self.current_folder
+        if not (self.manifest_dir and folder) or self._pending is not None:
+            return False
+        index = self._indexes.get(folder)
+        if index is None:
+            return False
+        return save_manifest(index, self.manifest_dir)
+
+    def _store_index(self, folder: str, index: MediaIndex) -> None:
+        self._indexes.pop(folder, None)
+        self._indexes[folder] = index
+        while len(self._indexes) > self.MAX_INDEXES:
+            self._indexes.pop(next(iter(self._indexes)))
+
+    def recording_status(self, media_paths: Iterable[str], stat: bool = True,
+                         image_fallbacks: bool = False) -> List[RecordingStatus]:
+        """Batched recording lookup: one ``RecordingStatus`` per media file.
+
+        Gives the canonical recording path (or, with ``image_fallbacks``, the
+        legacy image name that exists), whether it exists and, with ``stat``,
+        its size and mtime. Each parent directory is listed once for the whole
+        batch. Without ``stat``, directories covered by the current folder's
+        index are answered from memory with no I/O. Bare names resolve against
+        the current folder.
+        """
+        return _recording_status(media_paths, self.current_folder or "", self._current_index(),
+                                 image_fallbacks, stat)
+
+    def _current_index(self) -> Optional[MediaIndex]:
+        """Index of the current folder (the partial one while an async open runs)."""
+        if self._pending is not None:
+            return self._pending
+        folder = self.current_folder
+        return self._indexes.get(folder) if folder else None
+
+    def recording_exists(self, wav_path: str) -> bool:
+        """In-memory existence check for a WAV in the current kit.
+
+        Answered from the current folder's index (no I/O) when ``wav_path``
+        lies in a scanned directory; anything else falls back to a stat.
+        During an async open this is the partial index, and recordings read
+        later are announced with recordingsChanged. Call
+        ``refresh_recordings()`` before a list refresh to pick up changes
+        made outside the app.
+        """
+        if not wav_path:
+            return False
+        index = self._current_index()
+        if index is not None:
+            known = index.has_wav(wav_path)
+            if known is not None:
+                return known
+        return os.path.exists(wav_path)
+
+    def note_recording(self, wav_path: str, present: bool = True) -> None:
+        """Update the in-memory set after the app writes, imports or deletes a WAV."""
+        index = self._current_index()
+        if index is not None and wav_path:
+            index.note_wav(wav_path, present)
+
+    def refresh_recordings(self) -> None:
+        """Revalidate the current index (one stat per directory, a rescan
+        only if something changed). Errors leave the existing set alone."""
+        try:
+            self.media_index()
+        except FolderAccessError:
+            pass
+
+    def invalidate_index(self, path: Optional[str] = None) -> None:
+        """Force the next list call to rescan ``path`` (all folders if None)."""
+        if path is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(path, None)
+
+    def list_videos(self, path: Optional[str] = None) -> List[str]:
+        index = self.media_index(path)
+        return list(index.videos) if index is not None else []
 
     def _refresh_videos(self) -> None:
         try:
@@ -179,7 +610,7 @@ class FolderAccessManager(QObject):
         filename = os.path.basename(image_or_name)
         return os.path.join(folder, filename + ".wav")
 
-    def find_existing_image_audio(self, image_or_name: str) -> Optional[str]:
+    def find_existing_image_audio(self, image_or_name: str, refresh: bool = True) -> Optional[str]:
         """Try to find a recorded WAV for the given image using multiple patterns.
 
         Compatibility strategy:
@@ -189,33 +620,19 @@ class FolderAccessManager(QObject):
         - Fallback to extension-preserving naming in current folder root: "name.ext.wav"
 
         Returns the first existing path found, or None if none exist.
+        Candidates are checked against the in-memory recording set; pass
+        ``refresh=False`` from loops that already revalidated it.
         """
+        if refresh:
+            self.refresh_recordings()
         try:
-            img_dir = os.path.dirname(image_or_name)
-            folder = img_dir if img_dir else (self.current_folder or "")
-            filename = os.path.basename(image_or_name)
-            basename = os.path.splitext(filename)[0]
-
-            candidates = [
-                os.path.join(folder, filename + ".wav"),
-                os.path.join(folder, basename + ".wav"),
-            ]
-            root = self.current_folder or ""
-            if root:
-                candidates.extend([
-                    os.path.join(root, basename + ".wav"),
-                    os.path.join(root, filename + ".wav"),
-                ])
-
-            for p in candidates:
-                if p and os.path.exists(p):
-                    return p
+            status = self.recording_status([image_or_name], stat=False, image_fallbacks=True)[0]
+            return status.wav if status.exists else None
         except Exception:
-            pass
-        return None
+            return None
 
     def has_image_audio(self, image_or_name: str) -> bool:
-        return os.path.exists(self.wav_path_for_image(image_or_name))
+        return self.recording_exists(self.wav_path_for_image(image_or_name))
 
     # ---- Unified media helpers (for the "All" tab: one queue of videos + images) ----
 
@@ -225,19 +642,14 @@ class FolderAccessManager(QObject):
         Ordered by basename (case-insensitive) so both media types interleave
         the way a stimulus set expects. Used by the "All" tab.
         """
-        folder = path or self.current_folder
-        if not folder:
-            return []
-        vids = self.list_videos(folder)
-        imgs = self.list_images(folder)
-        combined = list(vids) + list(imgs)
-        combined.sort(key=lambda p: os.path.basename(p).lower())
-        return combined
+        index = self.media_index(path)
+        return index.all_media() if index is not None else []
 
-    @staticmethod
-    def media_type_of(name: str) -> Optional[str]:
-        """'video', 'image', or None, from the file extension."""
-        return _media_type(name)
+    def media_type_of(self, name: str) -> Optional[str]:
+        """'video', 'image', or None: as classified by the current index
+        (which knows files sniffed by content), else from the extension."""
+        index = self._current_index()
+        return index.kind_of(name) if index is not None else _media_type(name)
 
     def recording_path_for(self, media_or_name: str) -> str:
         """Canonical WAV path for a media file (video OR image), same-stem-safe.
@@ -250,10 +662,15 @@ class FolderAccessManager(QObject):
         This is canonical-only by design — it does NOT use the loose
         find_existing_image_audio() basename fallback, which can otherwise return
         a same-stem video's WAV under an image.
+
+        The naming rule follows ``media_type_of``, so a file the index
+        classified by content (an image with an unknown extension) gets the
+        image name like everywhere else.
         """
         d = os.path.dirname(media_or_name)
         folder = d if d else (self.current_folder or "")
-        return os.path.join(folder, _recording_name_for(media_or_name))
+        kind = self.media_type_of(os.path.join(folder, os.path.basename(media_or_name)))
+        return os.path.join(folder, _recording_name_for(media_or_name, kind))
 
     def all_recordings_in(self, folder: Optional[str] = None) -> List[str]:
         """Recordings for EVERY item in the merged video+image queue.
@@ -262,18 +679,20 @@ class FolderAccessManager(QObject):
         All tab exactly and — unlike recordings_in(), which only scans the top
         level — it also finds recordings for images kept in an images/ subfolder.
         """
-        out = []
-        for media in self.list_all_media(folder):
-            wav = self.recording_path_for(media)
-            if wav and os.path.exists(wav):
-                out.append(wav)
+        out = [st.wav for st in self.recording_status(self.list_all_media(folder), stat=False) if st.exists]
         out.sort(key=lambda p: os.path.basename(p).lower())
         return out
 
-    def has_recording(self, media_or_name: str) -> bool:
-        """True iff the canonical recording for this media file exists."""
+    def has_recording(self, media_or_name: str, refresh: bool = True) -> bool:
+        """True iff the canonical recording for this media file exists.
+
+        Pass ``refresh=False`` from loops and paint code that already called
+        ``refresh_recordings()``; the lookup is then in memory only.
+        """
+        if refresh:
+            self.refresh_recordings()
         p = self.recording_path_for(media_or_name)
-        return bool(p) and os.path.exists(p)
+        return bool(p) and self.recording_exists(p)
 
     def image_recordings_in(self, folder: Optional[str] = None) -> List[str]:
         fold = folder or self.current_folder
@@ -281,11 +700,7 @@ class FolderAccessManager(QObject):
             return []
         try:
             images = self.list_images(fold)
-            files = []
-            for img in images:
-                wp = self.wav_path_for_image(img)
-                if os.path.exists(wp):
-                    files.append(wp)
+            files = [st.wav for st in self.recording_status(images, stat=False) if st.exists]
             files.sort()
             return files
         except FolderAccessError:
@@ -297,35 +712,15 @@ class FolderAccessManager(QObject):
             return []
         try:
             videos = self.list_videos(fold)
-            files = []
-            for vp in videos:
-                name = os.path.basename(vp)
-                wp = self.wav_path_for(name)
-                if os.path.exists(wp):
-                    files.append(wp)
+            files = [st.wav for st in self.recording_status(videos, stat=False) if st.exists]
             files.sort()
             return files
         except FolderAccessError:
             return []
 
     def recordings_in(self, folder: Optional[str] = None) -> List[str]:
-        fold = folder or self.current_folder
-        if not fold:
-            return []
-        if not os.path.isdir(fold):
-            raise FolderNotFoundError(fold)
-        if not self.is_accessible(fold):
-            raise FolderPermissionError(fold)
-        try:
-            files = [os.path.join(fold, f) for f in os.listdir(fold) if f.lower().endswith('.wav') and not f.startswith('.')]
-            files.sort()
-            return files
-        except PermissionError:
-            raise FolderPermissionError(fold)
-        except FileNotFoundError:
-            raise FolderNotFoundError(fold)
-        except Exception as e:
-            raise FolderAccessError(str(e))
+        index = self.media_index(folder)
+        return list(index.wavs) if index is not None else []
 
     def cleanup_hidden_files(self, folder: Optional[str] = None) -> List[str]:
         """Delete common hidden/junk files in the given folder.
@@ -367,48 +762,22 @@ class FolderAccessManager(QObject):
             errors.append(str(e))
         return errors
 
-    # Include common image extensions, notably both TIFF variants, plus HEIC/HEIF/WebP
-    IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif", ".heic", ".heif", ".webp")
-
     def list_images(self, path: Optional[str] = None) -> List[str]:
         folder = path or self.current_folder
         try:
             logging.debug(f"FS.list_images: folder={folder}")
         except Exception:
             pass
-        if not folder:
+        index = self.media_index(folder)
+        if index is None:
             return []
-        if not os.path.isdir(folder):
-            raise FolderNotFoundError(folder)
-        if not self.is_accessible(folder):
-            raise FolderPermissionError(folder)
+        # Top-level images plus the images/ subfolder (non-recursive)
+        files = list(index.images)
         try:
-            files = []
-            # Top-level images
-            for name in os.listdir(folder):
-                full = os.path.join(folder, name)
-                if os.path.isfile(full) and name.lower().endswith(self.IMAGE_EXTS):
-                    files.append(full)
-            # Common subfolders that may contain images (non-recursive)
-            for sub in ("images", "Images"):
-                subpath = os.path.join(folder, sub)
-                if os.path.isdir(subpath) and self.is_accessible(subpath):
-                    for name in os.listdir(subpath):
-                        full = os.path.join(subpath, name)
-                        if os.path.isfile(full) and name.lower().endswith(self.IMAGE_EXTS):
-                            files.append(full)
-            files.sort()
-            try:
-                logging.info(f"FS.list_images: found={len(files)}; sample={[os.path.basename(f) for f in files[:3]]}")
-            except Exception:
-                pass
-            return files
-        except PermissionError:
-            raise FolderPermissionError(folder)
-        except FileNotFoundError:
-            raise FolderNotFoundError(folder)
-        except Exception as e:
-            raise FolderAccessError(str(e))
+            logging.info(f"FS.list_images: found={len(files)}; sample={[os.path.basename(f) for f in files[:3]]}")
+        except Exception:
+            pass
+        return files
 
     @staticmethod
     def image_basename(image_path: str) -> str:
@@ -0,0 +1,489 @@
+"""Library mode: a persistent SQLite catalogue of every kit under a root folder.
+
+``FolderAccessManager`` works on one kit at a time: a flat folder plus its
+``images/`` subfolder. Teams that keep hundreds of kits on a shared drive had
+to open each one to see which still lacked recordings.
+
+``LibraryCatalog.scan(root)`` walks ``root`` recursively. A directory whose
+own listing (or ``images/`` subfolder) holds videos or images is a kit, the
+same definition ``scan_folder`` uses for a single kit. The catalogue stores:
+
+* every media file with its size, mtime and duration;
+* its canonical recording (``recording_name_for``), if one exists, with the
+  recording's size, mtime and duration;
+* per-kit counts of media and recorded items, so completion is one query.
+
+Rescans are incremental. The catalogue keeps the ``st_mtime_ns`` of every
+directory it listed. A directory whose mtime did not change is not listed
+again: its subdirectories come from the catalogue and its kit rows are kept.
+Inside a kit that did change, files whose size and mtime match the stored row
+keep their stored duration, so each video is probed once. As with
+``MediaIndex.is_current``, a directory changed within ``_RACY_SECONDS`` of the
+previous scan is always listed again.
+
+Directory mtimes only move when entries are added, removed or renamed. A
+recording overwritten in place keeps its stored size and duration until its
+kit changes or ``scan(root, full=True)`` runs.
+
+The catalogue is read by the Library dialog (vat/ui/library_dialog.py) and
+from the command line::
+
+    python -m vat.utils.library_catalog scan /mnt/kits
+    python -m vat.utils.library_catalog kits /mnt/kits --incomplete
+    python -m vat.utils.library_catalog missing /mnt/kits/kit042
+
+Pure stdlib (plus optional cv2 for video durations); no Qt imports.
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import time
+import wave
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from vat.utils.media_index import IMAGE_SUBFOLDERS, _RACY_SECONDS, recording_status, scan_folder
+from vat.utils.media_naming import IMAGE_EXTS, VIDEO_EXTS
+
+try:
+    import cv2  # type: ignore
+    CV2_AVAILABLE = True
+except Exception:  # pragma: no cover - cv2 optional at import time
+    cv2 = None  # type: ignore
+    CV2_AVAILABLE = False
+
+# Bump when the schema changes; older catalogues are rebuilt (they are caches).
+SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS dirs (
+        path TEXT PRIMARY KEY,
+        parent TEXT,
+        mtime_ns INTEGER NOT NULL,
+        scanned_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent)",
+    """CREATE TABLE IF NOT EXISTS kits (
+        path TEXT PRIMARY KEY,
+        media_count INTEGER NOT NULL,
+        recorded_count INTEGER NOT NULL,
+        video_count INTEGER NOT NULL,
+        image_count INTEGER NOT NULL,
+        media_bytes INTEGER NOT NULL,
+        recording_bytes INTEGER NOT NULL,
+        media_seconds REAL NOT NULL,
+        recorded_seconds REAL NOT NULL,
+        scanned_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS media (
+        path TEXT PRIMARY KEY,
+        kit TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        size INTEGER,
+        mtime_ns INTEGER,
+        duration REAL,
+        recording TEXT,
+        recording_size INTEGER,
+        recording_mtime_ns INTEGER,
+        recording_duration REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS media_kit ON media(kit)",
+)
+
+
+def default_catalog_path() -> str:
+    return os.path.join(os.path.expanduser("~/.videooralannotation"), "library.sqlite3")
+
+
+@dataclass
+class KitSummary:
+    path: str
+    media_count: int = 0
+    recorded_count: int = 0
+    video_count: int = 0
+    image_count: int = 0
+    media_bytes: int = 0
+    recording_bytes: int = 0
+    media_seconds: float = 0.0
+    recorded_seconds: float = 0.0
+    scanned_at: float = 0.0
+
+    @property
+    def missing_count(self) -> int:
+        return self.media_count - self.recorded_count
+
+    @property
+    def completion(self) -> float:
+        """Fraction of media items with a recording (0.0 - 1.0)."""
+        return self.recorded_count / self.media_count if self.media_count else 0.0
+
+    @property
+    def complete(self) -> bool:
+        return self.media_count > 0 and self.recorded_count >= self.media_count
+
+
+@dataclass
+class MediaRecord:
+    path: str
+    kit: str
+    kind: str
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+    duration: Optional[float] = None
+    recording: Optional[str] = None
+    recording_size: Optional[int] = None
+    recording_mtime_ns: Optional[int] = None
+    recording_duration: Optional[float] = None
+
+
+@dataclass
+class ScanStats:
+    root: str
+    dirs_listed: int = 0
+    dirs_skipped: int = 0
+    kits_scanned: int = 0
+    kits_removed: int = 0
+    cancelled: bool = False
+    seconds: float = 0.0
+
+
+def _stat(path: str) -> Tuple[Optional[int], Optional[int]]:
+    try:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+    except OSError:
+        return None, None
+
+
+def wav_duration(path: str) -> Optional[float]:
+    """Duration of a PCM WAV in seconds, from its header."""
+    try:
+        with wave.open(path, "rb") as wf:
+            rate = wf.getframerate()
+            return wf.getnframes() / float(rate) if rate else None
+    except Exception:
+        return None
+
+
+def video_duration(path: str) -> Optional[float]:
+    """Duration of a video in seconds (frame count / fps), or None."""
+    if not CV2_AVAILABLE:
+        return None
+    cap = None
+    try:
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            return None
+        fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        frames = float(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0.0)
+        return frames / fps if fps > 0 and frames > 0 else None
+    except Exception:
+        return None
+    finally:
+        if cap is not None:
+            try:
+                cap.release()
+            except Exception:
+                pass
+
+
+def _under(root: str) -> Tuple[str, tuple]:
+    """SQL condition (and parameters) matching ``path`` at or below ``root``."""
+    prefix = root.rstrip(os.sep) + os.sep
+    return "(path = ? OR substr(path, 1, ?) = ?)", (root, len(prefix), prefix)
+
+
+def _is_image_subfolder(path: str) -> bool:
+    return os.path.basename(path) in IMAGE_SUBFOLDERS
+
+
+class LibraryCatalog:
+    """SQLite catalogue of kits, media and recordings under one or more roots.
+
+    Each call opens its own connection, so a catalogue object may be shared
+    between the UI thread and a scan worker.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_catalog_path()
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._connect() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                for table in ("dirs", "kits", "media"):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for stmt in _SCHEMA:
+                conn.execute(stmt)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ---- scanning ---------------------------------------------------------
+    @staticmethod
+    def _dir_changed(row, mtime: Optional[int]) -> bool:
+        if row is None or mtime is None or row["mtime_ns"] != mtime:
+            return True
+        return mtime / 1e9 >= row["scanned_at"] - _RACY_SECONDS
+
+    def scan(self, root: str, full: bool = False, durations: bool = True,
+             progress: Optional[Callable[[str], None]] = None,
+             cancelled: Optional[Callable[[], bool]] = None) -> ScanStats:
+        """Bring the catalogue up to date for every kit under ``root``.
+
+        ``full`` lists every directory and re-reads every file instead of
+        trusting unchanged mtimes. ``durations=False`` skips probing new or
+        changed files (their duration is stored as unknown). ``progress`` is
+        called with each kit path as it is indexed. When ``cancelled()``
+        returns True the walk stops; kits indexed so far are kept and nothing
+        is removed from the catalogue.
+
+        Raises the ``OSError`` from reading ``root`` itself.
+        """
+        root = os.path.abspath(root)
+        started = time.monotonic()
+        stats = ScanStats(root=root)
+        now = time.time()
+        cond, params = _under(root)
+        with self._connect() as conn:
+            known = {r["path"]: r for r in conn.execute(
+                f"SELECT path, parent, mtime_ns, scanned_at FROM dirs WHERE {cond}", params)}
+            children: Dict[str, List[str]] = {}
+            for r in known.values():
+                children.setdefault(r["parent"], []).append(r["path"])
+            known_kits = {r["path"] for r in conn.execute(f"SELECT path FROM kits WHERE {cond}", params)}
+            visited = set()
+            dir_rows = []
+            stack = [root]
+            while stack:
+                if cancelled is not None and cancelled():
+                    stats.cancelled = True
+                    break
+                d = stack.pop()
+                try:
+                    mtime = os.stat(d).st_mtime_ns
+                except OSError:
+                    if d == root:
+                        raise
+                    continue
+                visited.add(d)
+                prev = known.get(d)
+                if not full and not self._dir_changed(prev, mtime):
+                    stats.dirs_skipped += 1
+                    kids = children.get(d, [])
+                    subdirs = [c for c in kids if not _is_image_subfolder(c)]
+                    image_dirs = [c for c in kids if _is_image_subfolder(c)]
+                    kit_changed = False
+                else:
+                    stats.dirs_listed += 1
+                    subdirs, image_dirs = [], []
+                    try:
+                        with os.scandir(d) as it:
+                            for entry in it:
+                                try:
+                                    if entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
+                                        continue
+                                except OSError:
+                                    continue
+                                full_path = os.path.join(d, entry.name)
+                                (image_dirs if entry.name in IMAGE_SUBFOLDERS else subdirs).append(full_path)
+                    except OSError as e:
+                        if d == root:
+                            raise
+                        logging.info(f"Library.scan: cannot list {d}: {e}")
+                        visited.discard(d)
+                        continue
+                    dir_rows.append((d, os.path.dirname(d) if d != root else None, mtime, now))
+                    kit_changed = True
+                for sub in image_dirs:
+                    sub_mtime = _stat(sub)[1]
+                    if sub_mtime is None:
+                        continue
+                    visited.add(sub)
+                    if full or self._dir_changed(known.get(sub), sub_mtime):
+                        dir_rows.append((sub, d, sub_mtime, now))
+                        kit_changed = True
+                if kit_changed:
+                    if self._index_kit(conn, d, full, durations):
+                        stats.kits_scanned += 1
+                        known_kits.add(d)
+                        if progress is not None:
+                            try:
+                                progress(d)
+                            except Exception:
+                                pass
+                    elif d in known_kits:
+                        self._forget_kit(conn, d)
+                        known_kits.discard(d)
+                        stats.kits_removed += 1
+                stack.extend(sorted(subdirs, reverse=True))
+            gone = [] if stats.cancelled else [p for p in known if p not in visited]
+            for p in gone:
+                conn.execute("DELETE FROM dirs WHERE path = ?", (p,))
+                if p in known_kits:
+                    self._forget_kit(conn, p)
+                    stats.kits_removed += 1
+            conn.executemany("INSERT OR REPLACE INTO dirs (path, parent, mtime_ns, scanned_at) VALUES (?, ?, ?, ?)",
+                             dir_rows)
+        stats.seconds = time.monotonic() - started
+        logging.info(f"Library.scan: root={root}, listed={stats.dirs_listed}, skipped={stats.dirs_skipped}, "
+                     f"kits_scanned={stats.kits_scanned}, kits_removed={stats.kits_removed}, "
+                     f"seconds={stats.seconds:.2f}")
+        return stats
+
+    @staticmethod
+    def _forget_kit(conn: sqlite3.Connection, kit: str) -> None:
+        conn.execute("DELETE FROM kits WHERE path = ?", (kit,))
+        conn.execute("DELETE FROM media WHERE kit = ?", (kit,))
+
+    def _index_kit(self, conn: sqlite3.Connection, kit: str, full: bool, durations: bool) -> bool:
+        """(Re)catalogue one kit directory. False if it holds no media."""
+        try:
+            index = scan_folder(kit, VIDEO_EXTS, IMAGE_EXTS)
+        except OSError as e:
+            logging.info(f"Library.scan: cannot index {kit}: {e}")
+            return False
+        media = index.all_media()
+        if not media:
+            return False
+        old = {} if full else {r["path"]: r for r in conn.execute("SELECT * FROM media WHERE kit = ?", (kit,))}
+        rows = []
+        summary = KitSummary(path=kit, scanned_at=time.time())
+        # Recording sizes/mtimes in one listing per directory.
+        recordings = recording_status(media, kit, index)
+        for path, status in zip(media, recordings):
+            kind = index.kind_of(path) or "video"
+            prev = old.get(path)
+            size, mtime = _stat(path)
+            if prev is not None and prev["size"] == size and prev["mtime_ns"] == mtime:
+                duration = prev["duration"]
+            elif durations and kind == "video":
+                duration = video_duration(path)
+            else:
+                duration = None
+            rec = rec_size = rec_mtime = rec_duration = None
+            if status.exists:
+                rec, rec_size, rec_mtime = status.wav, status.size, status.mtime_ns
+                if (prev is not None and prev["recording"] == rec
+                        and prev["recording_size"] == rec_size and prev["recording_mtime_ns"] == rec_mtime):
+                    rec_duration = prev["recording_duration"]
+                elif durations:
+                    rec_duration = wav_duration(rec)
+            rows.append((path, kit, kind, size, mtime, duration, rec, rec_size, rec_mtime, rec_duration))
+            summary.media_count += 1
+            if kind == "image":
+                summary.image_count += 1
+            else:
+                summary.video_count += 1
+            summary.media_bytes += size or 0
+            summary.media_seconds += duration or 0.0
+            if rec is not None:
+                summary.recorded_count += 1
+                summary.recording_bytes += rec_size or 0
+                summary.recorded_seconds += rec_duration or 0.0
+        conn.execute("DELETE FROM media WHERE kit = ?", (kit,))
+        conn.executemany("INSERT OR REPLACE INTO media VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute(
+            "INSERT OR REPLACE INTO kits VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (kit, summary.media_count, summary.recorded_count, summary.video_count, summary.image_count,
+             summary.media_bytes, summary.recording_bytes, summary.media_seconds, summary.recorded_seconds,
+             summary.scanned_at))
+        return True
+
+    # ---- queries ----------------------------------------------------------
+    def kits(self, root: Optional[str] = None, incomplete_only: bool = False) -> List[KitSummary]:
+        """Catalogued kits (under ``root`` if given), ordered by path."""
+        sql = "SELECT * FROM kits"
+        params: tuple = ()
+        clauses = []
+        if root:
+            cond, params = _under(os.path.abspath(root))
+            clauses.append(cond)
+        if incomplete_only:
+            clauses.append("recorded_count < media_count")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY path"
+        with self._connect() as conn:
+            return [KitSummary(**dict(r)) for r in conn.execute(sql, params)]
+
+    def kit(self, path: str) -> Optional[KitSummary]:
+        with self._connect() as conn:
+            r = conn.execute("SELECT * FROM kits WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return KitSummary(**dict(r)) if r is not None else None
+
+    def media(self, kit: str) -> List[MediaRecord]:
+        """Catalogued media of one kit in queue (basename) order."""
+        with self._connect() as conn:
+            rows = [MediaRecord(**dict(r)) for r in conn.execute(
+                "SELECT * FROM media WHERE kit = ?", (os.path.abspath(kit),))]
+        rows.sort(key=lambda m: os.path.basename(m.path).lower())
+        return rows
+
+    def missing_recordings(self, kit: str) -> List[str]:
+        """Media paths in ``kit`` that have no recording."""
+        return [m.path for m in self.media(kit) if m.recording is None]
+
+
+# ---- command line -----------------------------------------------------------
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds or 0))
+    return f"{seconds // 3600:d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m vat.utils.library_catalog",
+                                     description="Index and query a library of stimulus kits")
+    parser.add_argument("--db", help=f"Catalogue file (default: {default_catalog_path()})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_scan = sub.add_parser("scan", help="Index (or incrementally re-index) every kit under a root folder")
+    p_scan.add_argument("root")
+    p_scan.add_argument("--full", action="store_true", help="Re-read everything, ignoring directory mtimes")
+    p_scan.add_argument("--no-durations", action="store_true", help="Do not probe media/recording durations")
+    p_kits = sub.add_parser("kits", help="List catalogued kits with their completion")
+    p_kits.add_argument("root", nargs="?")
+    p_kits.add_argument("--incomplete", action="store_true", help="Only kits that still lack recordings")
+    p_missing = sub.add_parser("missing", help="List media without a recording in one kit")
+    p_missing.add_argument("kit")
+    args = parser.parse_args(argv)
+
+    catalog = LibraryCatalog(args.db)
+    if args.command == "scan":
+        try:
+            stats = catalog.scan(args.root, full=args.full, durations=not args.no_durations)
+        except OSError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        print(f"{stats.kits_scanned} kit(s) indexed, {stats.kits_removed} removed; "
+              f"{stats.dirs_listed} dir(s) listed, {stats.dirs_skipped} unchanged ({stats.seconds:.1f}s)")
+        return 0
+    if args.command == "kits":
+        kits = catalog.kits(args.root, incomplete_only=args.incomplete)
+        for k in kits:
+            print(f"{k.recorded_count:5d}/{k.media_count:<5d} {k.completion * 100:5.1f}%  "
+                  f"{format_duration(k.recorded_seconds)}  {k.path}")
+        done = sum(1 for k in kits if k.complete)
+        print(f"{len(kits)} kit(s), {done} complete")
+        return 0
+    missing = catalog.missing_recordings(args.kit)
+    for path in missing:
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
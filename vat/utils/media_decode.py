@@ -0,0 +1,189 @@
+"""Shared still-image decoding.
+
+Returns QImage only (never QPixmap), so every helper here is safe to call
+from worker threads. The Images tab banner, the fullscreen viewer cache and
+the thumbnail grids all decode through these functions so format fallbacks
+(HEIC/HEIF via pillow-heif) live in one place. Video stills come from
+vat.video.poster.
+"""
+
+import io
+import logging
+import threading
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage, QImageReader, QImageIOHandler
+
+_heif_lock = threading.Lock()
+_heif_registered = False
+
+
+def _register_heif_opener() -> None:
+    """Register pillow-heif with Pillow once per process (no-op if absent)."""
+    global _heif_registered
+    with _heif_lock:
+        if _heif_registered:
+            return
+        _heif_registered = True
+        try:
+            import pillow_heif
+            pillow_heif.register_heif_opener()
+        except Exception:
+            pass
+
+
+def _pil_to_qimage(im) -> QImage:
+    if im.mode != "RGBA":
+        im = im.convert("RGB")
+    fmt = QImage.Format_RGBA8888 if im.mode == "RGBA" else QImage.Format_RGB888
+    data = im.tobytes()
+    return QImage(data, im.width, im.height, len(data) // im.height, fmt).copy()
+
+
+def _read_with_pillow(path: str, box: Optional[Tuple[int, int]] = None) -> Optional[QImage]:
+    try:
+        from PIL import Image, ImageOps
+    except Exception:
+        return None
+    _register_heif_opener()
+    try:
+        with Image.open(path) as im:
+            if box is not None:
+                # JPEG only: let libjpeg decode at 1/2, 1/4 or 1/8 scale.
+                # draft() works on the stored (pre-rotation) dimensions.
+                w, h = box
+                if _exif_orientation(im) in (5, 6, 7, 8):
+                    w, h = h, w
+                try:
+                    im.draft("RGB", (w, h))
+                except Exception:
+                    pass
+            im = ImageOps.exif_transpose(im)
+            if box is not None:
+                im.thumbnail(box)
+            return _pil_to_qimage(im)
+    except Exception as e:
+        logging.debug(f"media_decode: Pillow could not read {path}: {e}")
+        return None
+
+
+# Pillow transpose operations for EXIF orientations 2..8 (1 is identity).
+_ORIENTATION_OPS = {
+    2: "FLIP_LEFT_RIGHT",
+    3: "ROTATE_180",
+    4: "FLIP_TOP_BOTTOM",
+    5: "TRANSPOSE",
+    6: "ROTATE_270",
+    7: "TRANSVERSE",
+    8: "ROTATE_90",
+}
+
+
+def _exif_orientation(im) -> int:
+    try:
+        return int(im.getexif().get(0x0112, 1) or 1)
+    except Exception:
+        return 1
+
+
+def _read_exif_thumbnail(path: str, box: Tuple[int, int]) -> Optional[QImage]:
+    """The JPEG thumbnail embedded in EXIF IFD1, if it is at least ``box``.
+
+    Returned with the main image's EXIF orientation applied. Cameras store
+    this preview un-rotated, so it needs the same transpose as the photo.
+    """
+    try:
+        from PIL import Image, ExifTags
+    except Exception:
+        return None
+    try:
+        with Image.open(path) as im:
+            if im.format != "JPEG":
+                return None
+            raw = im.info.get("exif")
+            if not raw:
+                return None
+            exif = im.getexif()
+            ifd1 = exif.get_ifd(ExifTags.IFD.IFD1)
+            offset, length = ifd1.get(0x0201), ifd1.get(0x0202)
+            if not offset or not length:
+                return None
+            orientation = int(exif.get(0x0112, 1) or 1)
+            im_size = im.size
+        # IFD offsets are relative to the TIFF header after the "Exif\0\0" marker.
+        tiff = raw[6:] if raw.startswith(b"Exif") else raw
+        data = tiff[offset:offset + length]
+        with Image.open(io.BytesIO(data)) as th:
+            th.load()
+            op = _ORIENTATION_OPS.get(orientation)
+            if op is not None:
+                th = th.transpose(getattr(Image.Transpose, op))
+            # Reject previews too small for the box, or with a different
+            # aspect ratio (letterboxed previews would show black bars).
+            tw, th_h = th.size
+            if max(tw, th_h) < max(box) or (tw < box[0] and th_h < box[1]):
+                return None
+            sw, sh = im_size if orientation not in (5, 6, 7, 8) else im_size[::-1]
+            if abs(tw / th_h - sw / sh) > 0.02:
+                return None
+            return _pil_to_qimage(th)
+    except Exception:
+        return None
+
+
+def read_image(path: str) -> Optional[QImage]:
+    """Decode an image at full resolution, honouring EXIF orientation.
+
+    Tries Qt's QImageReader first, then Pillow (which also covers HEIC/HEIF
+    when pillow-heif is installed). Returns None when neither can decode it.
+    """
+    if not path:
+        return None
+    try:
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        img = reader.read()
+        if img is not None and not img.isNull():
+            return img
+    except Exception:
+        pass
+    return _read_with_pillow(path)
+
+
+def read_image_scaled(path: str, box: Tuple[int, int]) -> Optional[QImage]:
+    """Decode an image at roughly ``box`` size, honouring EXIF orientation.
+
+    Meant for thumbnails: the decoder is asked for a reduced size instead of
+    decoding the full image and scaling it down. In order, it tries:
+
+    - the EXIF-embedded JPEG preview, when it is large enough;
+    - QImageReader.setScaledSize (libjpeg DCT scaling for JPEG);
+    - Pillow with draft() (DCT scaling for JPEG) plus pillow-heif.
+
+    The result fits within ``box`` but may be slightly larger than needed
+    on one side; callers scale to the exact icon size.
+    """
+    if not path:
+        return None
+    box = (max(1, int(box[0])), max(1, int(box[1])))
+    img = _read_exif_thumbnail(path, box)
+    if img is not None:
+        return img
+    try:
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        src = reader.size()
+        if src.isValid():
+            w, h = box
+            # Scaling applies to the stored image, before the EXIF rotation.
+            if reader.transformation() & QImageIOHandler.TransformationRotate90:
+                w, h = h, w
+            if src.width() > w or src.height() > h:
+                reader.setScaledSize(src.scaled(QSize(w, h), Qt.KeepAspectRatio))
+        img = reader.read()
+        if img is not None and not img.isNull():
+            return img
+    except Exception:
+        pass
+    return _read_with_pillow(path, box)
@@ -0,0 +1,374 @@
+"""One-pass ``os.scandir`` index of a stimulus-kit folder.
+
+``FolderAccessManager`` used to answer every list helper (``list_videos``,
+``list_images``, ``recordings_in``, ``list_all_media``) with its own
+``os.listdir`` plus an ``os.path.isfile`` stat per entry, and to re-list the
+folder in ``is_accessible`` before each of them. Opening a kit on a NAS cost
+thousands of network round trips.
+
+``scan_folder`` lists the folder and its ``images/`` subfolder once each.
+``DirEntry.is_file()`` comes from the directory listing on Windows and on
+most Linux/macOS filesystems, so no per-file stat is needed. The result is a
+``MediaIndex``: typed, sorted lists of videos, images and WAVs plus the
+metadata file.
+
+An index records the modification time of every directory it listed.
+``is_current()`` re-checks only those (one stat per directory), so callers can
+reuse an index until a file is added, removed or renamed. An index taken within
+``_RACY_SECONDS`` of a directory change is not trusted. A coarse-mtime
+filesystem (FAT, some SMB servers) could otherwise hide a second change made
+in the same tick. Once a rescan finds the same directory mtimes as the scan
+before it, the new index is ``settled`` and trusted anyway. Otherwise every
+revalidation would rescan for the whole window, and for as long as a NAS
+clock runs ahead of ours.
+
+``recordings`` is the set of every WAV in the scanned directories, keyed by
+``recording_key``. ``has_wav`` answers "does this recording exist?" from
+memory, so painting a grid or refreshing list icons does no disk I/O.
+
+Classification is one dict lookup per entry on its suffix. With ``sniff``,
+entries whose suffix is unknown or missing are classified from their first
+bytes instead; those kinds are kept in ``kinds`` and answered by
+``kind_of``, so nothing is read twice.
+
+``recording_status`` is the batched form of that question for a list of media
+files. It returns each file's recording path, whether it exists and
+(optionally) its size and mtime. Answers come from an index where one covers
+the directory; otherwise each parent directory is listed once, however many
+files live in it.
+"""
+
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from vat.utils.media_naming import IMAGE_EXTS, VIDEO_EXTS, media_type, recording_name_for, sniff_media_type
+
+IMAGE_SUBFOLDERS = ("images", "Images")
+METADATA_NAME = "metadata.txt"
+_RACY_SECONDS = 2.0
+# macOS volumes are case-insensitive by default but normcase() keeps case.
+_FOLD_CASE = sys.platform in ("win32", "darwin")
+
+
+def recording_key(path: str) -> str:
+    """Normalised form of a WAV path for set membership."""
+    key = os.path.normcase(os.path.abspath(path))
+    return key.lower() if _FOLD_CASE else key
+
+
+@dataclass
+class MediaIndex:
+    folder: str
+    videos: List[str] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+    # WAVs at the top level (non-hidden), as recordings_in() reports them.
+    wavs: List[str] = field(default_factory=list)
+    # WAVs next to images in the images/ subfolder.
+    subfolder_wavs: List[str] = field(default_factory=list)
+    metadata: Optional[str] = None
+    # recording_key() of every WAV (hidden ones too) in the scanned dirs.
+    recordings: Set[str] = field(default_factory=set)
+    # Directory path -> st_mtime_ns at scan time, and the same dirs as keys.
+    dir_mtimes: Dict[str, int] = field(default_factory=dict)
+    dir_keys: Set[str] = field(default_factory=set)
+    scanned_at: float = 0.0
+    # Media classified by content (no or unknown suffix): path -> kind.
+    kinds: Dict[str, str] = field(default_factory=dict)
+    # A rescan saw the same dir_mtimes as the scan before it (see is_current).
+    settled: bool = False
+
+    def covers(self, path: str) -> bool:
+        """True if ``path`` lies directly in one of the scanned directories."""
+        return os.path.dirname(recording_key(path)) in self.dir_keys
+
+    def has_wav(self, path: str) -> Optional[bool]:
+        """Whether the WAV exists, or None if its directory was not scanned."""
+        if not path or not self.covers(path):
+            return None
+        return recording_key(path) in self.recordings
+
+    def note_wav(self, path: str, present: bool) -> None:
+        """Record a WAV the app itself just wrote or deleted."""
+        if not self.covers(path):
+            return
+        if present:
+            self.recordings.add(recording_key(path))
+        else:
+            self.recordings.discard(recording_key(path))
+
+    def kind_of(self, path: str) -> Optional[str]:
+        """'video', 'image' or None: a sniffed kind, else the suffix's."""
+        return self.kinds.get(path) or media_type(path)
+
+    def all_media(self) -> List[str]:
+        """Videos and images merged in basename order (the All tab queue)."""
+        combined = list(self.videos) + list(self.images)
+        combined.sort(key=lambda p: os.path.basename(p).lower())
+        return combined
+
+    def snapshot(self) -> "MediaIndex":
+        """Sorted copy (used to hand a partial scan to another thread)."""
+        return MediaIndex(
+            folder=self.folder,
+            videos=sorted(self.videos),
+            images=sorted(self.images),
+            wavs=sorted(self.wavs),
+            subfolder_wavs=sorted(self.subfolder_wavs),
+            metadata=self.metadata,
+            recordings=set(self.recordings),
+            dir_mtimes=dict(self.dir_mtimes),
+            dir_keys=set(self.dir_keys),
+            scanned_at=self.scanned_at,
+            kinds=dict(self.kinds),
+            settled=self.settled,
+        )
+
+    def is_current(self) -> bool:
+        """True if none of the scanned directories changed since the scan."""
+        try:
+            for path, mtime in self.dir_mtimes.items():
+                st = os.stat(path)
+                if st.st_mtime_ns != mtime:
+                    return False
+                if not self.settled and st.st_mtime_ns / 1e9 >= self.scanned_at - _RACY_SECONDS:
+                    return False
+            return bool(self.dir_mtimes)
+        except OSError:
+            return False
+
+
+@dataclass
+class RecordingStatus:
+    media: str
+    # The recording found, or the canonical path if there is none.
+    wav: str
+    exists: bool = False
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
+
+
+def _fold(name: str) -> str:
+    return name.lower() if _FOLD_CASE else name
+
+
+def recording_candidates(media: str, folder: str = "", image_fallbacks: bool = False,
+                         kind: Optional[str] = None) -> List[str]:
+    """WAV paths that may hold the recording for ``media``, best first.
+
+    The first entry is always the canonical recording (``recording_name_for``
+    in the media file's directory, or ``folder`` for a bare name). With
+    ``image_fallbacks`` an image also gets the legacy names
+    ``find_existing_image_audio`` accepts: "<stem>.wav" next to it, then
+    "<stem>.wav" and "<name>.wav" in ``folder``. ``kind`` overrides the
+    extension's classification (for files sniffed by content).
+    """
+    directory = os.path.dirname(media) or folder
+    name = os.path.basename(media)
+    kind = kind or media_type(name)
+    out = [os.path.join(directory, recording_name_for(name, kind))]
+    if image_fallbacks and kind == "image":
+        stem = os.path.splitext(name)[0]
+        out.append(os.path.join(directory, stem + ".wav"))
+        if folder:
+            out.extend([os.path.join(folder, stem + ".wav"), os.path.join(folder, name + ".wav")])
+        seen: Set[str] = set()
+        out = [p for p in out if not (p in seen or seen.add(p))]
+    return out
+
+
+def _list_files(directory: str, names: Set[str], stat: bool) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+    """``_fold(name)`` -> (size, mtime_ns) for the requested files in ``directory``.
+
+    One ``os.scandir``; entries are only stat'ed (``DirEntry.stat``, free on
+    Windows) when ``stat`` is set and their name was asked for.
+    """
+    found: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    try:
+        with os.scandir(directory or ".") as it:
+            for entry in it:
+                key = _fold(entry.name)
+                if key not in names:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    if stat:
+                        st = entry.stat()
+                        found[key] = (st.st_size, st.st_mtime_ns)
+                    else:
+                        found[key] = (None, None)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return found
+
+
+def recording_status(media_paths: Iterable[str], folder: str = "", index: Optional[MediaIndex] = None,
+                     image_fallbacks: bool = False, stat: bool = True) -> List[RecordingStatus]:
+    """Recording path, existence and (with ``stat``) size/mtime per media file.
+
+    ``folder`` resolves bare names and is the root for image fallbacks (see
+    ``recording_candidates``). ``index`` also supplies the kind of files it
+    classified by content. Without ``stat``, existence comes from ``index``
+    for directories it covers. Every other directory is listed once.
+    """
+    media = list(media_paths)
+
+    def kind_of(m: str) -> Optional[str]:
+        if index is None:
+            return None
+        return index.kind_of(m if os.path.dirname(m) else os.path.join(folder, m))
+
+    candidates = [recording_candidates(m, folder, image_fallbacks, kind_of(m)) for m in media]
+    wanted: Dict[str, Set[str]] = {}
+    for paths in candidates:
+        for p in paths:
+            if not stat and index is not None and index.has_wav(p) is not None:
+                continue
+            wanted.setdefault(os.path.dirname(p), set()).add(_fold(os.path.basename(p)))
+    listed = {d: _list_files(d, names, stat) for d, names in wanted.items()}
+    out = []
+    for m, paths in zip(media, candidates):
+        status = RecordingStatus(media=m, wav=paths[0])
+        for p in paths:
+            files = listed.get(os.path.dirname(p))
+            if files is None:
+                if index is not None and index.has_wav(p):
+                    status.wav, status.exists = p, True
+                    break
+                continue
+            info = files.get(_fold(os.path.basename(p)))
+            if info is not None:
+                status.wav, status.exists = p, True
+                status.size, status.mtime_ns = info
+                break
+        out.append(status)
+    return out
+
+
+class ScanCancelled(Exception):
+    """Raised by ``scan_folder`` when its ``cancelled`` callback returns True."""
+
+
+def _scan_dir(path: str) -> Tuple[int, Iterator[Tuple[str, str, bool, bool]]]:
+    """(mtime_ns, iterator of (name, full_path, is_file, is_dir)) for one directory.
+
+    The listing itself is lazy, so callers can report progress (or stop)
+    while a slow directory is still being read.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    it = os.scandir(path)
+
+    def entries():
+        with it:
+            for entry in it:
+                try:
+                    is_file = entry.is_file()
+                    is_dir = (not is_file) and entry.is_dir()
+                except OSError:
+                    continue
+                yield entry.name, os.path.join(path, entry.name), is_file, is_dir
+    return mtime, entries()
+
+
+def _kind_table(video_exts: Iterable[str], image_exts: Iterable[str]) -> Dict[str, str]:
+    table = {ext.lower(): "video" for ext in video_exts}
+    for ext in image_exts:
+        table.setdefault(ext.lower(), "image")
+    return table
+
+
+def scan_folder(folder: str, video_exts: Iterable[str] = VIDEO_EXTS, image_exts: Iterable[str] = IMAGE_EXTS,
+                on_page: Optional[Callable[[MediaIndex, int], None]] = None, page_size: int = 0,
+                cancelled: Optional[Callable[[], bool]] = None, sniff: bool = False) -> MediaIndex:
+    """Build a ``MediaIndex`` for ``folder``.
+
+    Raises the ``OSError`` from listing ``folder`` itself (callers map it to
+    their own errors). An unreadable ``images/`` subfolder is skipped.
+
+    ``on_page(index, entries_seen)`` is called after every ``page_size``
+    directory entries with the index built so far (unsorted; see
+    ``snapshot``). ``cancelled`` is polled per entry; when it returns True
+    the scan raises ``ScanCancelled``. With ``sniff``, non-hidden files with
+    no known suffix (other than WAVs and the metadata file) are classified
+    by content.
+    """
+    kind_by_ext = _kind_table(video_exts, image_exts)
+    index = MediaIndex(folder=folder, scanned_at=time.time())
+    seen = 0
+
+    def tick() -> None:
+        nonlocal seen
+        seen += 1
+        if cancelled is not None and cancelled():
+            raise ScanCancelled(folder)
+        if on_page is not None and page_size > 0 and seen % page_size == 0:
+            on_page(index, seen)
+
+    def classify(name: str, full: str) -> Tuple[str, Optional[str]]:
+        """(suffix, kind) of one file, sniffing if enabled and needed."""
+        dot = name.rfind(".")
+        ext = name[dot:].lower() if dot >= 0 else ""
+        kind = kind_by_ext.get(ext)
+        if (kind is None and sniff and ext != ".wav" and name != METADATA_NAME
+                and not name.startswith(".")):
+            kind = sniff_media_type(full)
+            if kind is not None:
+                index.kinds[full] = kind
+        return ext, kind
+
+    mtime, entries = _scan_dir(folder)
+    index.dir_mtimes[folder] = mtime
+    index.dir_keys.add(recording_key(folder))
+    subfolders = []
+    for name, full, is_file, is_dir in entries:
+        tick()
+        if is_dir:
+            if name in IMAGE_SUBFOLDERS:
+                subfolders.append(full)
+            continue
+        if not is_file:
+            continue
+        ext, kind = classify(name, full)
+        if kind == "video":
+            index.videos.append(full)
+        elif kind == "image":
+            index.images.append(full)
+        elif ext == ".wav":
+            index.recordings.add(recording_key(full))
+            if not name.startswith("."):
+                index.wavs.append(full)
+        elif name == METADATA_NAME:
+            index.metadata = full
+    for sub in subfolders:
+        try:
+            sub_mtime, sub_entries = _scan_dir(sub)
+            index.dir_mtimes[sub] = sub_mtime
+            index.dir_keys.add(recording_key(sub))
+            for name, full, is_file, _is_dir in sub_entries:
+                tick()
+                if not is_file:
+                    continue
+                ext, kind = classify(name, full)
+                if kind == "image":
+                    index.images.append(full)
+                elif kind == "video":
+                    # Only images are taken from images/.
+                    index.kinds.pop(full, None)
+                elif ext == ".wav":
+                    index.recordings.add(recording_key(full))
+                    if not name.startswith("."):
+                        index.subfolder_wavs.append(full)
+        except OSError:
+            index.dir_mtimes.pop(sub, None)
+            index.dir_keys.discard(recording_key(sub))
+            continue
+    index.videos.sort()
+    index.images.sort()
+    index.wavs.sort()
+    index.subfolder_wavs.sort()
+    return index
@@ -0,0 +1,254 @@
+"""List model behind the Images and Review thumbnail grids.
+
+Both grids used to be ``QListWidget``s that were cleared and refilled on any
+change: a new recording, a file copied into the kit, a Review scope change.
+Every item and icon was recreated each time, and every thumbnail not still
+in memory was decoded again.
+
+``MediaListModel`` holds one ``MediaRow`` per file and reports changes row by
+row. ``sync_rows`` works out which rows were removed or inserted (an
+unrelated listing, such as another folder, resets the model instead).
+``set_thumbnail`` and ``refresh_recorded`` emit ``dataChanged`` only for rows
+whose value really changed, so one new recording repaints one cell.
+
+Roles (``Qt.UserRole`` offsets match the item data the grids used before):
+
+    KeyRole       row identity: image path (Images) or item id (Review)
+    PathRole      media file
+    WavRole       recording path, if the owner knows it
+    KindRole      'video' or 'image'
+    RecordedRole  whether a recording exists (owner-supplied predicate)
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtGui import QIcon
+
+KeyRole = Qt.UserRole
+PathRole = Qt.UserRole + 1
+WavRole = Qt.UserRole + 2
+KindRole = Qt.UserRole + 3
+RecordedRole = Qt.UserRole + 4
+
+
+@dataclass
+class MediaRow:
+    key: str
+    path: str
+    wav: str = ""
+    kind: str = "image"
+    recorded: bool = False
+
+
+class MediaListModel(QAbstractListModel):
+    """One row per media file, with thumbnails keyed by media path.
+
+    ``labels`` shows the file name under the thumbnail (DisplayRole);
+    ``tooltips`` exposes it as a tooltip instead.
+    """
+
+    def __init__(self, placeholder: Optional[QIcon] = None, labels: bool = False,
+                 tooltips: bool = False, parent=None):
+        super().__init__(parent)
+        self._rows: List[MediaRow] = []
+        self._icons: Dict[str, QIcon] = {}
+        self._placeholder = placeholder if placeholder is not None else QIcon()
+        self._labels = bool(labels)
+        self._tooltips = bool(tooltips)
+        # key -> row and path -> rows; rebuilt lazily after inserts/removals.
+        self._row_of: Optional[Dict[str, int]] = None
+        self._rows_of_path: Optional[Dict[str, List[int]]] = None
+
+    # ---- QAbstractListModel ---------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return os.path.basename(row.path) if self._labels else ""
+        if role == Qt.DecorationRole:
+            return self._icons.get(row.path, self._placeholder)
+        if role == Qt.ToolTipRole:
+            return os.path.basename(row.path) if self._tooltips else None
+        if role == KeyRole:
+            return row.key
+        if role == PathRole:
+            return row.path
+        if role == WavRole:
+            return row.wav
+        if role == KindRole:
+            return row.kind
+        if role == RecordedRole:
+            return row.recorded
+        return None
+
+    # ---- lookups ----------------------------------------------------------
+    def row_at(self, i: int) -> Optional[MediaRow]:
+        return self._rows[i] if 0 <= i < len(self._rows) else None
+
+    def keys(self) -> List[str]:
+        return [r.key for r in self._rows]
+
+    def paths(self) -> List[str]:
+        return [r.path for r in self._rows]
+
+    def row_of(self, key: str) -> int:
+        """Row holding ``key``, or -1."""
+        if self._row_of is None:
+            self._row_of = {r.key: i for i, r in enumerate(self._rows)}
+        return self._row_of.get(key, -1)
+
+    def index_of(self, key: str) -> QModelIndex:
+        row = self.row_of(key)
+        return self.index(row) if row >= 0 else QModelIndex()
+
+    def rows_for_path(self, path: str) -> List[int]:
+        if self._rows_of_path is None:
+            by_path: Dict[str, List[int]] = {}
+            for i, r in enumerate(self._rows):
+                by_path.setdefault(r.path, []).append(i)
+            self._rows_of_path = by_path
+        return self._rows_of_path.get(path, [])
+
+    def has_thumbnail(self, path: str) -> bool:
+        return path in self._icons
+
+    def thumbnail_count(self) -> int:
+        return len(self._icons)
+
+    def _invalidate_lookups(self) -> None:
+        self._row_of = None
+        self._rows_of_path = None
+
+    # ---- row changes ------------------------------------------------------
+    def set_rows(self, rows: Iterable[MediaRow]) -> None:
+        """Replace every row (model reset). Thumbnails of kept paths survive."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        live = {r.path for r in self._rows}
+        self._icons = {p: icon for p, icon in self._icons.items() if p in live}
+        self._invalidate_lookups()
+        self.endResetModel()
+
+    def sync_rows(self, rows: Iterable[MediaRow]) -> bool:
+        """Make the model show ``rows`` using row-level notifications.
+
+        Rows whose key disappeared are removed, new keys are inserted at their
+        position and changed fields emit ``dataChanged``. Falls back to a reset
+        (and returns False) when nothing is shared with the current listing,
+        keys repeat, or the kept rows changed order.
+        """
+        rows = list(rows)
+        new_keys = [r.key for r in rows]
+        wanted = set(new_keys)
+        kept = [r.key for r in self._rows if r.key in wanted]
+        kept_set = set(kept)
+        if (not kept or len(wanted) != len(new_keys)
+                or kept != [k for k in new_keys if k in kept_set]):
+            self.set_rows(rows)
+            return False
+        i = len(self._rows) - 1
+        while i >= 0:
+            if self._rows[i].key in wanted:
+                i -= 1
+                continue
+            end = i
+            while i >= 0 and self._rows[i].key not in wanted:
+                i -= 1
+            self.remove_rows(i + 1, end - i)
+        pos = 0
+        while pos < len(rows):
+            cur = self._rows[pos] if pos < len(self._rows) else None
+            new = rows[pos]
+            if cur is not None and cur.key == new.key:
+                if cur != new:
+                    self._rows[pos] = new
+                    if cur.path != new.path:
+                        self._rows_of_path = None
+                    idx = self.index(pos)
+                    self.dataChanged.emit(idx, idx)
+                pos += 1
+                continue
+            end = pos
+            while end < len(rows) and (cur is None or rows[end].key != cur.key):
+                end += 1
+            self.insert_rows(pos, rows[pos:end])
+            pos = end
+        return True
+
+    def insert_row(self, pos: int, row: MediaRow) -> None:
+        self.insert_rows(pos, [row])
+
+    def insert_rows(self, pos: int, rows: List[MediaRow]) -> None:
+        if not rows:
+            return
+        pos = max(0, min(int(pos), len(self._rows)))
+        self.beginInsertRows(QModelIndex(), pos, pos + len(rows) - 1)
+        self._rows[pos:pos] = rows
+        self._invalidate_lookups()
+        self.endInsertRows()
+
+    def remove_row(self, pos: int) -> Optional[MediaRow]:
+        removed = self.remove_rows(pos, 1)
+        return removed[0] if removed else None
+
+    def remove_rows(self, pos: int, count: int) -> List[MediaRow]:
+        if count <= 0 or not (0 <= pos and pos + count <= len(self._rows)):
+            return []
+        self.beginRemoveRows(QModelIndex(), pos, pos + count - 1)
+        removed = self._rows[pos:pos + count]
+        del self._rows[pos:pos + count]
+        self._invalidate_lookups()
+        self.endRemoveRows()
+        for row in removed:
+            if not self.rows_for_path(row.path):
+                self._icons.pop(row.path, None)
+        return removed
+
+    def remove_key(self, key: str) -> Optional[MediaRow]:
+        return self.remove_row(self.row_of(key))
+
+    # ---- cell changes -----------------------------------------------------
+    def set_thumbnail(self, path: str, icon: QIcon) -> None:
+        """Show ``icon`` for every row of ``path`` (one dataChanged per row)."""
+        rows = self.rows_for_path(path)
+        if not rows:
+            return
+        self._icons[path] = icon
+        for r in rows:
+            idx = self.index(r)
+            self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
+
+    def drop_thumbnails(self, keep) -> None:
+        """Forget icons for paths not in ``keep``. No signals: callers only
+        drop rows that are scrolled out of view."""
+        self._icons = {p: icon for p, icon in self._icons.items() if p in keep}
+
+    def refresh_recorded(self, is_recorded: Callable[[MediaRow], bool]) -> List[int]:
+        """Re-evaluate RecordedRole; repaint (and return) only rows that flipped."""
+        changed = []
+        for i, row in enumerate(self._rows):
+            try:
+                recorded = bool(is_recorded(row))
+            except Exception:
+                recorded = False
+            if recorded != row.recorded:
+                row.recorded = recorded
+                changed.append(i)
+                idx = self.index(i)
+                self.dataChanged.emit(idx, idx, [RecordedRole])
+        return changed
+
+    def set_labels(self, labels: bool) -> None:
+        labels = bool(labels)
+        if labels == self._labels:
+            return
+        self._labels = labels
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [Qt.DisplayRole])
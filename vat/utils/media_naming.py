@@ -2,30 +2,84 @@
 naming. Kept free of Qt/PySide imports so it can be unit-tested headlessly and
 reused anywhere (UI, workers, and eventually the pywebview/PWA backend).
 
-NOTE: The extension tuples below must stay in sync with
-FolderAccessManager.VIDEO_EXTS / IMAGE_EXTS (vat/utils/fs_access.py). Unifying
-them on this module is tracked in the Refactoring/Modularization roadmap (TODO).
+This module is the one place the media extensions are defined;
+FolderAccessManager, the folder scan and the scripts all use these tables.
+``media_type`` is a single dict lookup on the name's last suffix.
+
+``sniff_media_type`` reads a file's first bytes for files whose extension
+says nothing (missing or unknown). The folder scan uses it on such entries
+and keeps the result in the ``MediaIndex`` (``kinds``), so the content is
+read once per scan, not once per lookup.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 
-# Keep in sync with FolderAccessManager (see note above).
 VIDEO_EXTS = (".mpg", ".mpeg", ".mp4", ".avi", ".mkv", ".mov")
 IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif", ".heic", ".heif", ".webp")
 
+# Lower-case suffix (with the dot) -> "video" / "image".
+KIND_BY_EXT: Dict[str, str] = {ext: "video" for ext in VIDEO_EXTS}
+KIND_BY_EXT.update((ext, "image") for ext in IMAGE_EXTS)
+
+# Bytes read by sniff_media_type (enough for every signature below).
+SNIFF_BYTES = 16
+# ISO base media ("ftyp") brands that are still images; any other brand is
+# treated as video (MP4, MOV, 3GP, ...).
+_HEIF_BRANDS = {b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis", b"mif1", b"msf1", b"avif"}
+
+
+def extension(name: str) -> str:
+    """Lower-case last suffix of ``name`` including the dot ("" if none)."""
+    base = os.path.basename(name)
+    dot = base.rfind(".")
+    return base[dot:].lower() if dot >= 0 else ""
+
 
 def media_type(name: str) -> Optional[str]:
     """Return 'video', 'image', or None based on the file's extension."""
-    low = os.path.basename(name).lower()
-    if low.endswith(VIDEO_EXTS):
-        return "video"
-    if low.endswith(IMAGE_EXTS):
+    return KIND_BY_EXT.get(extension(name))
+
+
+def media_type_of_bytes(head: bytes) -> Optional[str]:
+    """'video', 'image', or None from a file's leading bytes."""
+    if head.startswith(b"\xff\xd8\xff") or head.startswith(b"\x89PNG\r\n\x1a\n"):
         return "image"
+    if head[:6] in (b"GIF87a", b"GIF89a") or head[:4] in (b"II*\x00", b"MM\x00*"):
+        return "image"
+    if head.startswith(b"BM") and head[6:10] == b"\x00\x00\x00\x00":
+        # BMP: the four reserved header bytes are zero.
+        return "image"
+    if head.startswith(b"RIFF"):
+        form = head[8:12]
+        if form == b"WEBP":
+            return "image"
+        if form == b"AVI ":
+            return "video"
+        return None
+    if head[4:8] == b"ftyp":
+        return "image" if head[8:12] in _HEIF_BRANDS else "video"
+    if head.startswith(b"\x1a\x45\xdf\xa3"):
+        return "video"
+    if head[:4] in (b"\x00\x00\x01\xba", b"\x00\x00\x01\xb3"):
+        return "video"
     return None
 
 
-def recording_name_for(name: str) -> str:
+def sniff_media_type(path: str) -> Optional[str]:
+    """'video', 'image', or None from the file's content (its first bytes).
+
+    Returns None when the file cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return None
+    return media_type_of_bytes(head)
+
+
+def recording_name_for(name: str, kind: Optional[str] = None) -> str:
     """Canonical WAV recording basename for a media file.
 
     Deliberately reproduces the app's existing per-type convention so the
@@ -39,12 +93,15 @@ def recording_name_for(name: str) -> str:
     pair map to DISTINCT WAVs (foo.wav vs foo.jpg.wav) with no collision — which
     is what makes canonical-only lookups safe for mixed ("All") queues.
 
-    A file with an unrecognized extension is treated as a video (stem + .wav),
-    matching the legacy "a WAV with no embedded media extension belongs to a
-    video" convention used when loading pre-refactor work.
+    ``kind`` is the file's classification when the caller knows better than
+    the extension (a file sniffed by content, see ``MediaIndex.kind_of``).
+    Otherwise a file with an unrecognized extension is treated as a video
+    (stem + .wav), matching the legacy "a WAV with no embedded media
+    extension belongs to a video" convention used when loading pre-refactor
+    work.
     """
     base = os.path.basename(name)
-    if media_type(base) == "image":
+    if (kind or media_type(base)) == "image":
         return base + ".wav"
     stem = os.path.splitext(base)[0]
     return stem + ".wav"
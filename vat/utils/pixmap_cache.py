@@ -0,0 +1,161 @@
+"""Byte-budgeted in-memory pixmap cache shared by the Images tab, the Review
+grid and the fullscreen image viewer.
+
+Full-resolution pixmaps used to be kept in plain dicts for the lifetime of
+the process, so a day of switching between stimulus kits grew the app by
+gigabytes. Pixmaps are now held in two LRU tiers with separate byte budgets:
+
+- ``thumb``: grid icons, so that re-populating a grid (Review scope change,
+  switching back to a kit) does not go back to disk;
+- ``full``: full-size previews for the banner and the fullscreen viewer.
+
+Cost is the decoded size (width x height x depth / 8). QPixmap is GUI-thread
+only, so this cache is too; background workers hand QImages to the GUI
+thread, which converts and stores them here.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from PySide6.QtGui import QPixmap
+
+from vat.utils.thumb_cache import ThumbnailCache
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Fraction of the ceiling reserved for grid thumbnails; the rest is for
+# full-size previews.
+THUMB_SHARE = 0.25
+
+TIER_THUMB = "thumb"
+TIER_FULL = "full"
+
+
+def pixmap_cost(pixmap: QPixmap) -> int:
+    return max(1, pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8)
+
+
+def thumb_key(path: str, size) -> Optional[str]:
+    """Key for a grid thumbnail: file identity plus the cache box for ``size``
+    (same identity rules as the on-disk thumbnail cache)."""
+    return ThumbnailCache.key_for(path, size)
+
+
+class _Tier:
+    def __init__(self, budget: int):
+        self.budget = int(budget)
+        self.entries: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self.costs: Dict[str, int] = {}
+        self.total = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class PixmapCache:
+    """LRU cache of QPixmaps with a per-tier byte budget and hit/miss counters."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._tiers: Dict[str, _Tier] = {
+            TIER_THUMB: _Tier(0),
+            TIER_FULL: _Tier(0),
+        }
+        self.set_max_bytes(max_bytes)
+
+    @property
+    def max_bytes(self) -> int:
+        return sum(t.budget for t in self._tiers.values())
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Change the overall ceiling; shrinking evicts immediately."""
+        max_bytes = max(0, int(max_bytes))
+        thumb_budget = int(max_bytes * THUMB_SHARE)
+        self._tiers[TIER_THUMB].budget = thumb_budget
+        self._tiers[TIER_FULL].budget = max_bytes - thumb_budget
+        for tier in self._tiers.values():
+            self._evict(tier)
+
+    def get(self, key: Optional[str], tier: str = TIER_FULL) -> Optional[QPixmap]:
+        t = self._tiers[tier]
+        pix = t.entries.get(key) if key else None
+        if pix is None:
+            t.misses += 1
+            return None
+        t.entries.move_to_end(key)
+        t.hits += 1
+        return pix
+
+    def put(self, key: Optional[str], pixmap: QPixmap, tier: str = TIER_FULL) -> bool:
+        """Store ``pixmap``; returns False if it is null or larger than the tier budget."""
+        if not key or pixmap is None or pixmap.isNull():
+            return False
+        t = self._tiers[tier]
+        cost = pixmap_cost(pixmap)
+        if cost > t.budget:
+            return False
+        self._drop(t, key)
+        t.entries[key] = pixmap
+        t.costs[key] = cost
+        t.total += cost
+        self._evict(t)
+        return True
+
+    def discard(self, key: str, tier: Optional[str] = None) -> None:
+        for name in ([tier] if tier else list(self._tiers)):
+            self._drop(self._tiers[name], key)
+
+    def clear(self, tier: Optional[str] = None) -> None:
+        for name in ([tier] if tier else list(self._tiers)):
+            t = self._tiers[name]
+            t.entries.clear()
+            t.costs.clear()
+            t.total = 0
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-tier counters: hits, misses, bytes, count, budget."""
+        return {
+            name: {
+                "hits": t.hits,
+                "misses": t.misses,
+                "bytes": t.total,
+                "count": len(t.entries),
+                "budget": t.budget,
+            }
+            for name, t in self._tiers.items()
+        }
+
+    def log_stats(self, reason: str = "") -> None:
+        try:
+            parts = []
+            for name, s in self.stats().items():
+                lookups = s["hits"] + s["misses"]
+                rate = (100.0 * s["hits"] / lookups) if lookups else 0.0
+                parts.append(
+                    f"{name}: {s['count']} items, {s['bytes'] // 1024} KiB/{s['budget'] // 1024} KiB, "
+                    f"hits={s['hits']} misses={s['misses']} ({rate:.0f}%)"
+                )
+            logging.info(f"PixmapCache{(' ' + reason) if reason else ''}: " + "; ".join(parts))
+        except Exception:
+            pass
+
+    @staticmethod
+    def _drop(t: _Tier, key: str) -> None:
+        if key in t.entries:
+            del t.entries[key]
+            t.total -= t.costs.pop(key, 0)
+
+    @staticmethod
+    def _evict(t: _Tier) -> None:
+        while t.total > t.budget and t.entries:
+            key, _pix = t.entries.popitem(last=False)
+            t.total -= t.costs.pop(key, 0)
+
+
+_shared_cache: Optional[PixmapCache] = None
+
+
+def shared_pixmap_cache() -> PixmapCache:
+    """The process-wide instance (GUI thread only)."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = PixmapCache()
+    return _shared_cache
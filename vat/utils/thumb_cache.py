@@ -0,0 +1,259 @@
+"""Persistent, content-addressed thumbnail cache shared by the Images grid and
+the Review grid.
+
+Opening a stimulus kit used to decode every photo at full resolution just to
+draw a 240x180 icon. Thumbnails are now written once to
+``~/.videooralannotation/thumbnails`` and read back on every later open.
+
+Entries are keyed on (absolute path, file size, mtime, target box), so an edited
+or replaced file never serves a stale icon, and are stored as small JPEGs (PNG
+when the thumbnail has an alpha channel). The directory is bounded by total
+bytes; least-recently-used entries are evicted first, where "use" is recorded
+by bumping the entry's mtime on every hit (atime is unreliable on noatime
+mounts).
+
+All methods are safe to call from worker threads: only QImage is used, never
+QPixmap.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from typing import Callable, Optional, Tuple, Union
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Thumbnail boxes are rounded up to this step so that small window resizes or
+# slider nudges reuse the same cached entry instead of minting a new one.
+SIZE_STEP = 64
+
+SizeLike = Union[QSize, Tuple[int, int]]
+
+
+def default_cache_dir() -> str:
+    return os.path.join(os.path.expanduser("~/.videooralannotation"), "thumbnails")
+
+
+def thumb_box(size: SizeLike) -> Tuple[int, int]:
+    """Round a requested icon size up to the cache's size step."""
+    if isinstance(size, QSize):
+        w, h = size.width(), size.height()
+    else:
+        w, h = size
+    w = max(SIZE_STEP, ((int(w) + SIZE_STEP - 1) // SIZE_STEP) * SIZE_STEP)
+    h = max(SIZE_STEP, ((int(h) + SIZE_STEP - 1) // SIZE_STEP) * SIZE_STEP)
+    return w, h
+
+
+class ThumbnailCache:
+    """On-disk LRU cache of pre-scaled thumbnails, bounded by total bytes."""
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root or default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None
+
+    # ---- keys -----------------------------------------------------------
+    @staticmethod
+    def key_for(path: str, size: SizeLike, namespace: str = "") -> Optional[str]:
+        """Content-address for (path, file size, mtime, target box), or None if
+        the source file cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        w, h = thumb_box(size)
+        raw = f"{namespace}|{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{w}x{h}"
+        return hashlib.sha1(raw.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        # Two-level fan-out keeps directories small for kits of several thousand items.
+        return os.path.join(self.root, key[:2], key)
+
+    # ---- lookup / store -------------------------------------------------
+    def get(self, path: str, size: SizeLike, namespace: str = "") -> Optional[QImage]:
+        """Return the cached thumbnail for ``path`` at ``size``, or None."""
+        key = self.key_for(path, size, namespace)
+        if key is None:
+            return None
+        return self.get_by_key(key)
+
+    def get_by_key(self, key: str) -> Optional[QImage]:
+        entry = self._entry_path(key)
+        if not os.path.exists(entry):
+            return None
+        img = QImage(entry)
+        if img.isNull():
+            # Truncated/corrupt entry (e.g. killed mid-write): drop it.
+            self._remove(entry)
+            return None
+        try:
+            os.utime(entry, None)
+        except OSError:
+            pass
+        return img
+
+    def put(self, path: str, size: SizeLike, image: QImage, namespace: str = "") -> Optional[str]:
+        """Store ``image`` as the thumbnail for ``path`` at ``size``.
+
+        Returns the entry key, or None when nothing was written.
+        """
+        key = self.key_for(path, size, namespace)
+        if key is None:
+            return None
+        return key if self.put_by_key(key, image) else None
+
+    def put_by_key(self, key: str, image: QImage) -> bool:
+        if image is None or image.isNull():
+            return False
+        entry = self._entry_path(key)
+        tmp = f"{entry}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            if image.hasAlphaChannel():
+                ok = image.save(tmp, "PNG")
+            else:
+                ok = image.save(tmp, "JPEG", 85)
+            if not ok:
+                self._remove(tmp)
+                return False
+            written = os.path.getsize(tmp)
+            replaced = os.path.getsize(entry) if os.path.exists(entry) else 0
+            os.replace(tmp, entry)
+        except OSError as e:
+            logging.debug(f"ThumbnailCache.put failed for {key}: {e}")
+            self._remove(tmp)
+            return False
+        with self._lock:
+            if self._total is not None:
+                self._total += written - replaced
+        self._evict_if_needed()
+        return True
+
+    # ---- size accounting / eviction ------------------------------------
+    def _scan(self):
+        """Yield (path, size, mtime) for every cache entry."""
+        try:
+            buckets = list(os.scandir(self.root))
+        except OSError:
+            return
+        for bucket in buckets:
+            if not bucket.is_dir(follow_symlinks=False):
+                continue
+            try:
+                with os.scandir(bucket.path) as it:
+                    for e in it:
+                        if e.name.endswith(".tmp"):
+                            continue
+                        try:
+                            st = e.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        yield e.path, st.st_size, st.st_mtime
+            except OSError:
+                continue
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            if self._total is None:
+                self._total = sum(size for _p, size, _m in self._scan())
+            return self._total
+
+    def _evict_if_needed(self) -> None:
+        if self.total_bytes() <= self.max_bytes:
+            return
+        with self._lock:
+            # Another thread may have evicted between the check above and
+            # taking the lock; don't rescan the directory for nothing.
+            if self._total is not None and self._total <= self.max_bytes:
+                return
+            entries = sorted(self._scan(), key=lambda t: t[2])
+            total = sum(size for _p, size, _m in entries)
+            # Evict down to 90% so a full cache does not rescan on every put.
+            target = int(self.max_bytes * 0.9)
+            removed = 0
+            for p, size, _m in entries:
+                if total <= target:
+                    break
+                if self._remove(p):
+                    total -= size
+                    removed += 1
+            self._total = total
+        logging.info(f"ThumbnailCache: evicted {removed} entries; total={total} bytes")
+
+    def clear(self) -> None:
+        with self._lock:
+            for p, _size, _m in list(self._scan()):
+                self._remove(p)
+            self._total = 0
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+def scale_to_box(image: QImage, size: SizeLike) -> QImage:
+    """Scale ``image`` down to fit the cache box for ``size`` (never upscales)."""
+    w, h = thumb_box(size)
+    if image.width() <= w and image.height() <= h:
+        return image
+    return image.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def load_thumbnail(path: str, size: SizeLike,
+                   loader: Callable[[str], Optional[QImage]],
+                   namespace: str = "",
+                   cache: Optional[ThumbnailCache] = None,
+                   cancelled: Optional[Callable[[], bool]] = None) -> Optional[QImage]:
+    """Return the thumbnail for ``path``, decoding with ``loader`` on a miss.
+
+    On a miss the full-resolution image returned by ``loader`` is scaled to
+    the cache box, stored, and dropped; only the thumbnail is returned, so
+    callers that just want an icon never retain the full-size decode.
+    ``cancelled`` is polled before the decode and again before the scale so a
+    worker whose result is no longer wanted stops early. Thread-safe (QImage
+    only).
+    """
+    cache = cache or shared_thumbnail_cache()
+    key = cache.key_for(path, size, namespace)
+    if key is not None:
+        hit = cache.get_by_key(key)
+        if hit is not None:
+            return hit
+    if cancelled is not None and cancelled():
+        return None
+    try:
+        full = loader(path)
+    except Exception as e:
+        logging.debug(f"load_thumbnail: decode failed for {path}: {e}")
+        return None
+    if full is None or full.isNull():
+        return None
+    if cancelled is not None and cancelled():
+        return None
+    thumb = scale_to_box(full, size)
+    del full
+    if key is not None:
+        cache.put_by_key(key, thumb)
+    return thumb
+
+
+_shared_cache: Optional[ThumbnailCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_thumbnail_cache() -> ThumbnailCache:
+    """The process-wide cache instance used by both grids."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ThumbnailCache()
+        return _shared_cache
@@ -0,0 +1,178 @@
+"""Background thumbnail decoding for the Images and Review grids.
+
+The grids insert placeholder items immediately and ask a ThumbnailLoader for
+the icons. Decoding runs on a QThreadPool and produces QImage only (QPixmap
+must never be touched off the GUI thread); finished thumbnails come back on
+the GUI thread through ``thumbnailReady``.
+
+Each populate pass bumps the loader's generation. Queued jobs from an older
+generation are dropped from the pool, and any that were already running
+stop before their decode (or discard their result), so switching folder or
+Review scope never paints icons from the previous listing.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QPoint, QRunnable, QThreadPool, QSize, Qt, Signal
+from PySide6.QtGui import QImage
+
+from vat.utils.media_decode import read_image_scaled
+from vat.utils.thumb_cache import load_thumbnail, thumb_box
+from vat.video.poster import poster_frame
+
+# Job priorities: rows in the viewport jump ahead of everything else.
+PRIORITY_VISIBLE = 10
+PRIORITY_NORMAL = 0
+
+
+def decode_thumbnail(path: str, size: QSize, kind: str = "image", cancelled=None) -> Optional[QImage]:
+    """Thumbnail for ``path`` scaled to the cache box for ``size``.
+
+    Served from the shared on-disk cache when possible; otherwise decoded and
+    written back. ``cancelled`` is polled before the decode and the scale.
+    Safe to call from any thread.
+    """
+    if kind == "video":
+        decoder = poster_frame
+    else:
+        box = thumb_box(size)
+        decoder = lambda p: read_image_scaled(p, box)
+    return load_thumbnail(path, size, decoder, cancelled=cancelled)
+
+
+def visible_row_range(view) -> Optional[Tuple[int, int]]:
+    """First and last row intersecting ``view``'s viewport, or None.
+
+    Probes the viewport from the top-left and bottom-right corners with
+    ``indexAt`` instead of walking every item's rect, so the cost does not
+    grow with the number of rows. Probing steps inward because spacing
+    around icons means the exact corner pixel usually hits no item.
+    """
+    try:
+        vp = view.viewport().rect()
+    except Exception:
+        return None
+    if vp.isEmpty():
+        return None
+    grid = view.gridSize()
+    if not grid.isValid() or grid.isEmpty():
+        grid = view.iconSize()
+    step = max(4, min(grid.width(), grid.height()) // 4) if grid.isValid() else 16
+
+    def probe(xs, ys):
+        for y in ys:
+            for x in xs:
+                idx = view.indexAt(QPoint(x, y))
+                if idx.isValid():
+                    return idx.row()
+        return None
+
+    first = probe(range(vp.left(), vp.right() + 1, step), range(vp.top(), vp.bottom() + 1, step))
+    if first is None:
+        return None
+    last = probe(range(vp.right(), vp.left() - 1, -step), range(vp.bottom(), vp.top() - 1, -step))
+    if last is None or last < first:
+        last = first
+    return first, last
+
+
+class _ThumbnailJob(QRunnable):
+    def __init__(self, loader: "ThumbnailLoader", generation: int, path: str, size: QSize, kind: str):
+        super().__init__()
+        # The loader keeps job references in _jobs; let Python own the lifetime.
+        self.setAutoDelete(False)
+        self.loader = loader
+        self.generation = generation
+        self.path = path
+        self.size = QSize(size)
+        self.kind = kind
+
+    def _cancelled(self) -> bool:
+        return not self.loader._is_current(self.generation)
+
+    def run(self) -> None:
+        if self._cancelled():
+            return
+        try:
+            img = decode_thumbnail(self.path, self.size, self.kind, cancelled=self._cancelled)
+        except Exception as e:
+            logging.debug(f"ThumbnailLoader: decode failed for {self.path}: {e}")
+            img = None
+        if self._cancelled():
+            return
+        if img is None:
+            img = QImage()
+        self.loader._jobDone.emit(self.generation, self.path, img)
+
+
+class ThumbnailLoader(QObject):
+    """Decode thumbnails on a worker pool and deliver them on the GUI thread.
+
+    Signals:
+        thumbnailReady(str, QImage): path and its thumbnail (null QImage when
+            the file could not be decoded). Never emitted for stale jobs.
+    """
+
+    thumbnailReady = Signal(str, QImage)
+    # Internal relay: emitted from pool threads, delivered queued to the GUI thread.
+    _jobDone = Signal(int, str, QImage)
+
+    def __init__(self, parent=None, max_threads: Optional[int] = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        if max_threads is None:
+            max_threads = max(1, QThreadPool.globalInstance().maxThreadCount() // 2)
+        self._pool.setMaxThreadCount(max_threads)
+        self._lock = threading.Lock()
+        self._generation = 0
+        # path -> (job, priority) for jobs queued or running in this generation
+        self._jobs: Dict[str, Tuple[_ThumbnailJob, int]] = {}
+        self._jobDone.connect(self._on_job_done, Qt.QueuedConnection)
+
+    def _is_current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def reset(self) -> None:
+        """Cancel all outstanding work (folder or scope changed)."""
+        with self._lock:
+            self._generation += 1
+        self._pool.clear()
+        self._jobs.clear()
+
+    def request(self, path: str, size: QSize, kind: str = "image", priority: int = PRIORITY_NORMAL) -> None:
+        """Queue ``path`` for decoding; re-requesting raises a queued job's priority."""
+        if not path:
+            return
+        queued = self._jobs.get(path)
+        if queued is not None:
+            job, old_priority = queued
+            if priority <= old_priority or not self._pool.tryTake(job):
+                return  # already at this priority, or already running
+        with self._lock:
+            generation = self._generation
+        job = _ThumbnailJob(self, generation, path, size, kind)
+        self._jobs[path] = (job, priority)
+        self._pool.start(job, priority)
+
+    def cancel(self, path: str) -> bool:
+        """Drop the queued job for ``path``; False if none or already running."""
+        queued = self._jobs.get(path)
+        if queued is None or not self._pool.tryTake(queued[0]):
+            return False
+        del self._jobs[path]
+        return True
+
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def _on_job_done(self, generation: int, path: str, img: QImage) -> None:
+        if not self._is_current(generation):
+            return
+        self._jobs.pop(path, None)
+        self.thumbnailReady.emit(path, img)
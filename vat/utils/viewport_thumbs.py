@@ -0,0 +1,168 @@
+"""Viewport-driven thumbnails for the Images and Review grids.
+
+The grids used to queue a decode, and stat each file for its cache key, for
+every row as soon as a folder was listed. The model then kept an icon per
+row for as long as the listing lived. Archive kits with 5,000+ items made
+both grow with the kit.
+
+``ViewportThumbnails`` connects a ``QListView``, its ``MediaListModel`` and a
+``ThumbnailLoader``. It only works on the rows in the viewport plus
+``margin`` viewports above and below them (at least ``MIN_WINDOW`` rows, so
+small kits are loaded in one go):
+
+* rows in view are requested at PRIORITY_VISIBLE and the margin at
+  PRIORITY_NORMAL;
+* queued jobs for rows that left the window are cancelled;
+* icons of rows far outside the window are dropped from the model. The
+  byte-budgeted shared pixmap cache returns them without a decode when the
+  user scrolls back.
+
+Scrolls, resizes and row inserts are coalesced into one ``update()`` with a
+short timer.
+
+The grids also set ``uniformItemSizes`` and use a ``UniformCellDelegate``:
+every cell is one grid cell, so the view measures a single item instead of
+asking the delegate (and the model) for every row during layout.
+"""
+
+import math
+from typing import Dict, Optional, Set, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtGui import QIcon, QImage, QPixmap
+from PySide6.QtWidgets import QStyledItemDelegate
+
+from vat.utils.pixmap_cache import shared_pixmap_cache, thumb_key, TIER_THUMB
+from vat.utils.thumb_loader import ThumbnailLoader, visible_row_range, PRIORITY_VISIBLE, PRIORITY_NORMAL
+
+MIN_WINDOW = 64
+DEFAULT_MARGIN = 1.0
+DEFAULT_DELAY_MS = 40
+
+
+class UniformCellDelegate(QStyledItemDelegate):
+    """Delegate whose items fill exactly one grid cell of their view."""
+
+    def sizeHint(self, option, index):
+        view = option.widget
+        grid = view.gridSize() if view is not None else None
+        if grid is not None and grid.isValid() and not grid.isEmpty():
+            return grid
+        return super().sizeHint(option, index)
+
+
+class ViewportThumbnails(QObject):
+    """Keep thumbnails loaded for the rows around a grid's viewport."""
+
+    def __init__(self, view, model, margin: float = DEFAULT_MARGIN,
+                 delay_ms: int = DEFAULT_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.model = model
+        self.margin = max(0.0, float(margin))
+        self.loader = ThumbnailLoader(self)
+        self.loader.thumbnailReady.connect(self._on_thumbnail_ready)
+        self._pixmap_cache = shared_pixmap_cache()
+        # path -> pixmap cache key for thumbnails being decoded
+        self._keys: Dict[str, Optional[str]] = {}
+        # Paths that could not be decoded; not retried until reset()
+        self._failed: Set[str] = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(0, int(delay_ms)))
+        self._timer.timeout.connect(self.update)
+        view.verticalScrollBar().valueChanged.connect(self.schedule)
+        model.rowsInserted.connect(self.schedule)
+        model.modelReset.connect(self.schedule)
+        view.viewport().installEventFilter(self)
+
+    def schedule(self, *_args) -> None:
+        self._timer.start()
+
+    def reset(self) -> None:
+        """Drop all queued work (the listing changed wholesale)."""
+        self.loader.reset()
+        self._keys = {}
+        self._failed = set()
+
+    def cancel(self) -> None:
+        """Stop updating and wait briefly for running decodes."""
+        self._timer.stop()
+        self.reset()
+        self.loader.wait_for_done(2000)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() in (QEvent.Resize, QEvent.Show):
+            self.schedule()
+        return super().eventFilter(obj, event)
+
+    def window(self) -> Optional[Tuple[int, int, int, int]]:
+        """(first_visible, last_visible, first_loaded, last_loaded), or None."""
+        count = self.model.rowCount()
+        if count <= 0:
+            return None
+        rows = visible_row_range(self.view)
+        if rows is None:
+            # Not laid out (or hidden) yet: assume the top of the grid.
+            first, last = 0, min(count, self._page_estimate()) - 1
+        else:
+            first, last = rows
+        pad = int(math.ceil((last - first + 1) * self.margin))
+        lo = max(0, first - pad)
+        hi = min(count - 1, last + pad)
+        short = MIN_WINDOW - (hi - lo + 1)
+        if short > 0:
+            hi = min(count - 1, hi + short)
+            lo = max(0, hi - MIN_WINDOW + 1)
+        return first, last, lo, hi
+
+    def _page_estimate(self) -> int:
+        vp = self.view.viewport().size()
+        grid = self.view.gridSize()
+        if not grid.isValid() or grid.isEmpty():
+            grid = self.view.iconSize()
+        cols = max(1, vp.width() // max(1, grid.width()))
+        rows = max(1, math.ceil(vp.height() / max(1, grid.height())))
+        return cols * rows
+
+    def update(self) -> None:
+        """Request thumbnails for the current window and forget the rest."""
+        win = self.window()
+        if win is None:
+            return
+        first, last, lo, hi = win
+        icon_size = self.view.iconSize()
+        keep = set()
+        for row in range(lo, hi + 1):
+            r = self.model.row_at(row)
+            path = r.path
+            keep.add(path)
+            if self.model.has_thumbnail(path) or path in self._failed:
+                continue
+            priority = PRIORITY_VISIBLE if first <= row <= last else PRIORITY_NORMAL
+            if path not in self._keys:
+                key = thumb_key(path, icon_size)
+                pix = self._pixmap_cache.get(key, TIER_THUMB)
+                if pix is not None:
+                    self.model.set_thumbnail(path, QIcon(pix))
+                    continue
+                self._keys[path] = key
+            self.loader.request(path, icon_size, r.kind, priority)
+        for path in [p for p in self._keys if p not in keep]:
+            if self.loader.cancel(path):
+                del self._keys[path]
+        # Let the model hold a few windows' worth of icons before trimming,
+        # so scrolling back and forth a little does not even hit the cache.
+        if self.model.thumbnail_count() > 3 * len(keep):
+            self.model.drop_thumbnails(keep)
+
+    def _on_thumbnail_ready(self, path: str, img: QImage) -> None:
+        key = self._keys.pop(path, None)
+        if img.isNull():
+            self._failed.add(path)
+            return
+        if not self.model.rows_for_path(path):
+            return
+        pix = QPixmap.fromImage(img)
+        self._pixmap_cache.put(key, pix, TIER_THUMB)
+        self.model.set_thumbnail(path, QIcon(pix))
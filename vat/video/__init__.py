@@ -0,0 +1,2 @@
+# Video package: decoding and playback helpers shared by the Videos tab, the
+# All tab, the Review grid and the fullscreen viewer.
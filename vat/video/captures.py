@@ -0,0 +1,171 @@
+"""One shared pool of open ``cv2.VideoCapture`` handles.
+
+The Videos tab, the All tab, the fullscreen viewer and the Review preview
+(which opens the fullscreen viewer) each used to open and release their own
+captures, reopening the same file from scratch on every switch. They now
+``acquire()`` from a shared ``VideoCaptureManager``:
+
+- ``release()`` on a handle returns it to the pool instead of closing it.
+  Up to ``max_idle`` idle captures are kept warm (LRU); the oldest is closed
+  when the pool is full.
+- Re-acquiring a path reuses an idle capture, rewound to the start.
+- A pane that is playing can pass its handle, still positioned at the
+  current frame, straight to the fullscreen viewer instead of releasing it.
+- Each handle serialises read/grab/seek/close on its own lock, so a capture
+  is never torn down while another thread is in the middle of a read (one
+  suspect for the occasional playback segfault noted in TODO).
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import cv2  # type: ignore
+except Exception:  # pragma: no cover - cv2 optional at import time
+    cv2 = None  # type: ignore
+
+DEFAULT_MAX_IDLE = 3
+
+
+class CaptureHandle:
+    """A pooled capture with the subset of the ``cv2.VideoCapture`` API the
+    players use. ``position`` is the index of the next frame to be decoded."""
+
+    def __init__(self, manager: "VideoCaptureManager", path: str, cap):
+        self._manager = manager
+        self.path = path
+        self._cap = cap
+        self._lock = threading.RLock()
+        self.position = 0
+
+    def isOpened(self) -> bool:
+        with self._lock:
+            return self._cap is not None and self._cap.isOpened()
+
+    def read(self, image=None):
+        with self._lock:
+            if self._cap is None:
+                return False, None
+            ok, frame = self._cap.read(image) if image is not None else self._cap.read()
+            if ok:
+                self.position += 1
+            return ok, frame
+
+    def grab(self) -> bool:
+        with self._lock:
+            if self._cap is None:
+                return False
+            ok = self._cap.grab()
+            if ok:
+                self.position += 1
+            return ok
+
+    def get(self, prop):
+        with self._lock:
+            return self._cap.get(prop) if self._cap is not None else 0.0
+
+    def set(self, prop, value) -> bool:
+        with self._lock:
+            if self._cap is None:
+                return False
+            ok = self._cap.set(prop, value)
+            if prop == cv2.CAP_PROP_POS_FRAMES:
+                self.position = int(value)
+            elif prop == cv2.CAP_PROP_POS_MSEC:
+                self.position = int(self._cap.get(cv2.CAP_PROP_POS_FRAMES) or 0)
+            return ok
+
+    def rewind(self) -> None:
+        if self.position != 0:
+            self.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self) -> None:
+        """Give the capture back to the pool (it stays open while idle)."""
+        self._manager._checkin(self)
+
+    def close(self) -> None:
+        """Really release the underlying capture (waits for any read)."""
+        with self._lock:
+            cap, self._cap = self._cap, None
+            if cap is not None:
+                try:
+                    cap.release()
+                except Exception:
+                    pass
+
+
+class VideoCaptureManager:
+    """LRU pool of open captures shared by every video player."""
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_idle = max(0, int(max_idle))
+        self._lock = threading.Lock()
+        # id(handle) -> handle, oldest first
+        self._idle: "OrderedDict[int, CaptureHandle]" = OrderedDict()
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, path: str) -> Optional[CaptureHandle]:
+        """An exclusive handle on ``path`` positioned at frame 0.
+
+        Check ``isOpened()`` on the result as with ``cv2.VideoCapture``.
+        """
+        if cv2 is None or not path:
+            return None
+        key = os.path.abspath(path)
+        handle = None
+        with self._lock:
+            for hid, h in reversed(self._idle.items()):
+                if h.path == key:
+                    handle = self._idle.pop(hid)
+                    break
+        if handle is not None:
+            handle.rewind()
+            self.reused += 1
+            return handle
+        self.opened += 1
+        return CaptureHandle(self, key, cv2.VideoCapture(path))
+
+    def _checkin(self, handle: CaptureHandle) -> None:
+        if not handle.isOpened() or self.max_idle == 0:
+            handle.close()
+            return
+        evicted = []
+        with self._lock:
+            self._idle.pop(id(handle), None)
+            self._idle[id(handle)] = handle
+            while len(self._idle) > self.max_idle:
+                evicted.append(self._idle.popitem(last=False)[1])
+        for h in evicted:
+            h.close()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close_all(self) -> None:
+        with self._lock:
+            handles = list(self._idle.values())
+            self._idle.clear()
+        for h in handles:
+            h.close()
+        try:
+            logging.info(f"VideoCaptureManager: closed {len(handles)} idle captures; opened={self.opened} reused={self.reused}")
+        except Exception:
+            pass
+
+
+_shared_manager: Optional[VideoCaptureManager] = None
+_shared_lock = threading.Lock()
+
+
+def shared_capture_manager() -> VideoCaptureManager:
+    """The process-wide pool used by all players."""
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            _shared_manager = VideoCaptureManager()
+        return _shared_manager
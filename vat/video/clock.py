@@ -0,0 +1,118 @@
+"""Wall-clock presentation timing for video playback.
+
+The players used to decode one frame per ``QTimer`` tick at ``1000/fps``, so
+every slow tick pushed the rest of the clip later: a 10 s stimulus could take
+14 s on a weak laptop and drift against audio recorded at the same time.
+
+``PlaybackClock`` maps ``time.monotonic()`` to the frame index that should be
+on screen now. Players ask it which frame is due, skip late frames with
+``cap.grab()`` (no colour conversion or scaling) via ``read_due``, and log
+real versus nominal playback speed when they stop.
+"""
+
+import logging
+import time
+from typing import Optional, Tuple
+
+DEFAULT_FPS = 30.0
+
+
+def valid_fps(fps) -> Optional[float]:
+    """``fps`` as a float if it is usable for pacing, else None."""
+    try:
+        value = float(fps or 0.0)
+    except (TypeError, ValueError):
+        return None
+    if value != value or value <= 0.0 or value == float("inf"):
+        return None
+    return value
+
+
+class PlaybackClock:
+    """Which frame should be on screen, based on elapsed wall-clock time."""
+
+    def __init__(self, fps: float, start_frame: int = 0):
+        self.fps = valid_fps(fps) or DEFAULT_FPS
+        self.start_frame = int(start_frame)
+        self._origin: Optional[float] = None
+        self._paused_at: Optional[float] = None
+        self._paused_total = 0.0
+        self.last_frame: Optional[int] = None
+        self.skipped = 0
+
+    def start(self) -> None:
+        self._origin = time.monotonic()
+        self._paused_at = None
+        self._paused_total = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._origin is not None
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_at is not None
+
+    def pause(self) -> None:
+        if self._origin is not None and self._paused_at is None:
+            self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        if self._paused_at is not None:
+            self._paused_total += time.monotonic() - self._paused_at
+            self._paused_at = None
+
+    def elapsed(self) -> float:
+        """Wall-clock seconds of playback, excluding pauses."""
+        if self._origin is None:
+            return 0.0
+        now = self._paused_at if self._paused_at is not None else time.monotonic()
+        return max(0.0, now - self._origin - self._paused_total)
+
+    def due_frame(self) -> int:
+        """Index of the frame that should be on screen now."""
+        return self.start_frame + int(self.elapsed() * self.fps)
+
+    def time_until(self, frame_index: int) -> float:
+        """Seconds until ``frame_index`` is due (negative when it is late)."""
+        return (frame_index - self.start_frame) / self.fps - self.elapsed()
+
+    def presented(self, frame_index: int) -> None:
+        self.last_frame = frame_index
+
+    def speed(self) -> Tuple[float, float, float]:
+        """(media seconds shown, wall seconds elapsed, real/nominal speed)."""
+        wall = self.elapsed()
+        if self.last_frame is None:
+            return 0.0, wall, 0.0
+        media = (self.last_frame + 1 - self.start_frame) / self.fps
+        return media, wall, (media / wall) if wall > 0 else 0.0
+
+    def log_summary(self, name: str = "") -> None:
+        try:
+            media, wall, speed = self.speed()
+            logging.info(
+                f"Playback '{name}': {media:.2f} s of video in {wall:.2f} s wall clock "
+                f"(speed {speed:.2f}x nominal, {self.skipped} late frames skipped)"
+            )
+        except Exception:
+            pass
+
+
+def read_due(cap, next_index: int, due_index: int, clock: Optional[PlaybackClock] = None, pool=None):
+    """Read the frame that is due, grabbing past any that are already late.
+
+    ``next_index`` is the index the capture will decode next. Returns
+    ``(ok, frame, index)`` where ``index`` is the frame actually returned.
+    Skipped frames are added to ``clock.skipped`` when a clock is given.
+    With a ``FrameBufferPool`` the frame is decoded into a pooled buffer.
+    """
+    skip = max(0, int(due_index) - int(next_index))
+    for _ in range(skip):
+        if not cap.grab():
+            return False, None, next_index
+        next_index += 1
+    if clock is not None:
+        clock.skipped += skip
+    ok, frame = pool.read(cap) if pool is not None else cap.read()
+    return bool(ok) and frame is not None, frame, next_index
@@ -0,0 +1,165 @@
+"""Threaded video decoding for in-pane playback.
+
+``VideoDecodeThread`` owns an open ``cv2.VideoCapture`` and, on its own
+thread, reads frames, resizes them to the display size with OpenCV and
+wraps them as ``QImage``. Finished frames go into a small ring buffer. The GUI side only
+calls ``take_latest()`` from its timer and shows whatever is newest, so a
+slow repaint or a busy event loop never stalls decoding and never builds up
+a backlog. Frames the GUI never got to see are dropped, not queued, and
+counted. Pacing follows a wall-clock PlaybackClock, so a slow decode skips
+late frames instead of slowing the clip down.
+
+The capture is released on the decode thread when it finishes, so it is
+never torn down in the middle of a read. ``detach()`` instead stops the
+thread and hands the still-open capture back, with the index of the next
+frame, so the fullscreen viewer can carry on from where the pane was.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from PySide6.QtCore import QThread, QSize, Signal
+from PySide6.QtGui import QImage
+
+from vat.video.clock import PlaybackClock, read_due
+from vat.video.frames import FrameBufferPool, frame_to_qimage
+
+DEFAULT_BUFFER_FRAMES = 3
+# Longest single sleep while pacing, so stop() is honoured promptly.
+_MAX_SLEEP = 0.05
+
+
+class VideoDecodeThread(QThread):
+    """Producer thread: decode frames ahead of display into a ring buffer.
+
+    Signals:
+        endOfStream(): the last frame has been decoded (or a read failed).
+    """
+
+    endOfStream = Signal()
+
+    def __init__(self, cap, fps: float, target_size: Optional[QSize] = None,
+                 buffer_frames: int = DEFAULT_BUFFER_FRAMES, name: str = "", parent=None):
+        super().__init__(parent)
+        self._cap = cap
+        self.clock = PlaybackClock(fps)
+        self._name = name
+        self._lock = threading.Lock()
+        self._ring: deque = deque(maxlen=max(1, int(buffer_frames)))
+        # Enough buffers that one is never reused while a frame wrapping it
+        # may still sit in the ring or be on its way to the screen. Decoded
+        # frames and their display-size copies use separate pools.
+        self._pool = FrameBufferPool(self._ring.maxlen + 2)
+        self._scaled_pool = FrameBufferPool(self._ring.maxlen + 2)
+        self._target = QSize(target_size) if target_size is not None else QSize()
+        self._stop = threading.Event()
+        self._keep_capture = False
+        self._eos = False
+        self.next_index = 0
+        self.decoded = 0
+        self.displayed = 0
+        self.dropped = 0
+
+    # ---- GUI-thread API -------------------------------------------------
+    def set_target_size(self, size: QSize) -> None:
+        with self._lock:
+            self._target = QSize(size)
+
+    def take_latest(self) -> Optional[QImage]:
+        """Newest decoded frame, or None if nothing new since the last call.
+
+        Older frames still in the buffer are discarded and counted as dropped.
+        """
+        with self._lock:
+            if not self._ring:
+                return None
+            img = self._ring.pop()
+            self.dropped += len(self._ring)
+            self._ring.clear()
+            self.displayed += 1
+            return img
+
+    def at_end(self) -> bool:
+        """True once decoding finished and every buffered frame was taken."""
+        with self._lock:
+            return self._eos and not self._ring
+
+    def stop(self, wait_ms: int = 2000) -> None:
+        """Ask the thread to finish and wait for it (capture released there)."""
+        self._stop.set()
+        if self.isRunning():
+            self.wait(wait_ms)
+
+    def detach(self, wait_ms: int = 2000):
+        """Stop decoding without releasing the capture.
+
+        Returns ``(cap, next_frame_index)``, or ``(None, 0)`` if the thread
+        already finished (and released it) or did not stop in time.
+        """
+        self._keep_capture = True
+        self.stop(wait_ms)
+        if self.isRunning():
+            return None, 0
+        cap, self._cap = self._cap, None
+        return cap, self.next_index
+
+    def log_stats(self) -> None:
+        try:
+            logging.info(
+                f"VideoDecodeThread '{self._name}': decoded={self.decoded} displayed={self.displayed} "
+                f"dropped={self.dropped}"
+            )
+        except Exception:
+            pass
+        self.clock.log_summary(self._name)
+
+    # ---- decode thread --------------------------------------------------
+    def _to_qimage(self, frame) -> QImage:
+        # Preview mode: shrink to the label here, with cv2 INTER_AREA, so the
+        # GUI thread never scales moving frames (4K clips in a small pane).
+        with self._lock:
+            target = QSize(self._target)
+        if target.width() > 0 and target.height() > 0:
+            frame = self._scaled_pool.resize_to_fit(frame, target.width(), target.height())
+        return frame_to_qimage(frame)
+
+    def run(self) -> None:
+        clock = self.clock
+        clock.start()
+        next_index = 0
+        try:
+            while not self._stop.is_set():
+                # Frames that are already late are grabbed past, not decoded.
+                ok, frame, index = read_due(self._cap, next_index, clock.due_frame(), clock, self._pool)
+                if not ok:
+                    break
+                next_index = self.next_index = index + 1
+                img = self._to_qimage(frame)
+                # Hold the frame until its presentation time.
+                while not self._stop.is_set():
+                    remaining = clock.time_until(index)
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(remaining, _MAX_SLEEP))
+                with self._lock:
+                    if len(self._ring) == self._ring.maxlen:
+                        self.dropped += 1  # consumer fell behind: oldest frame goes
+                    self._ring.append(img)
+                    self.decoded += 1
+                clock.presented(index)
+        except Exception as e:
+            logging.error(f"VideoDecodeThread '{self._name}' failed: {e}")
+        finally:
+            if not (self._keep_capture and self._stop.is_set()):
+                try:
+                    self._cap.release()
+                except Exception:
+                    pass
+                self._cap = None
+            with self._lock:
+                self._eos = True
+        if not self._stop.is_set():
+            self.endOfStream.emit()
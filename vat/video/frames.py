@@ -0,0 +1,115 @@
+"""OpenCV frame -> Qt image conversion shared by every video path.
+
+The old per-frame path was ``cvtColor(BGR->RGB)``, ``QImage(...)``,
+``.copy()`` and ``QPixmap.fromImage``: three full-frame copies at 1080p.
+``frame_to_qimage`` instead wraps the decoder's BGR buffer directly as a
+``Format_BGR888`` QImage. No conversion or copy happens, and the QImage
+keeps a reference to the array so the buffer outlives it. The only copy
+left per displayed frame is the QPixmap upload (or a scale that produces a
+smaller image anyway).
+
+``FrameBufferPool`` keeps a few preallocated arrays that ``cap.read`` decodes
+into, so steady-state playback does not allocate a new frame per tick. A
+pooled buffer is reused after ``count - 1`` further reads. Callers must be
+done with an image wrapping it (converted to QPixmap, scaled, or dropped)
+within that window.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtGui import QImage, QPixmap
+
+try:
+    import cv2  # type: ignore
+except Exception:  # pragma: no cover - cv2 optional at import time
+    cv2 = None  # type: ignore
+
+DEFAULT_POOL_BUFFERS = 3
+
+
+def frame_to_qimage(frame: np.ndarray) -> QImage:
+    """Wrap a BGR (or grey/BGRA) OpenCV frame as a QImage without copying.
+
+    Only non-contiguous input (e.g. a cropped view) is copied, once, into a
+    contiguous array.
+    """
+    frame = np.ascontiguousarray(frame)
+    if frame.ndim == 2:
+        h, w = frame.shape
+        fmt = QImage.Format_Grayscale8
+    else:
+        h, w, ch = frame.shape
+        if ch == 4:
+            # OpenCV BGRA byte order is QImage ARGB32 on little-endian hosts.
+            fmt = QImage.Format_ARGB32
+        else:
+            fmt = QImage.Format_BGR888
+    return QImage(frame, w, h, frame.strides[0], fmt)
+
+
+def frame_to_pixmap(frame: np.ndarray) -> QPixmap:
+    """GUI thread only: one copy, straight from the decoder buffer."""
+    return QPixmap.fromImage(frame_to_qimage(frame))
+
+
+def fit_size(width: int, height: int, box_w: int, box_h: int) -> Tuple[int, int]:
+    """Largest (w, h) with the frame's aspect ratio that fits in the box."""
+    if width <= 0 or height <= 0 or box_w <= 0 or box_h <= 0:
+        return width, height
+    scale = min(box_w / float(width), box_h / float(height))
+    return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+
+def resize_to_fit(frame: np.ndarray, box_w: int, box_h: int,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Resize a frame to fit ``box_w`` x ``box_h`` (aspect kept) with OpenCV.
+
+    Used during playback instead of ``Qt.SmoothTransformation``: INTER_AREA
+    when shrinking (fast, no aliasing), INTER_LINEAR when enlarging. When
+    ``out`` has the right shape the result is written into it. The frame is
+    returned as-is when it already has the target size or the box is empty.
+    """
+    h, w = frame.shape[:2]
+    tw, th = fit_size(w, h, int(box_w), int(box_h))
+    if (tw, th) == (w, h) or cv2 is None:
+        return frame
+    interp = cv2.INTER_AREA if tw < w else cv2.INTER_LINEAR
+    if out is not None and out.shape[:2] == (th, tw) and out.shape[2:] == frame.shape[2:]:
+        return cv2.resize(frame, (tw, th), dst=out, interpolation=interp)
+    return cv2.resize(frame, (tw, th), interpolation=interp)
+
+
+class FrameBufferPool:
+    """Rotating preallocated buffers for ``cap.read(image=...)``."""
+
+    def __init__(self, count: int = DEFAULT_POOL_BUFFERS):
+        self._count = max(2, int(count))
+        self._buffers: List[Optional[np.ndarray]] = [None] * self._count
+        self._next = 0
+
+    def read(self, cap) -> Tuple[bool, Optional[np.ndarray]]:
+        """``cap.read()`` into the next pooled buffer (allocated on first use
+        and whenever the stream's frame shape changes)."""
+        i = self._next
+        self._next = (i + 1) % self._count
+        buf = self._buffers[i]
+        if buf is None:
+            ok, frame = cap.read()
+        else:
+            ok, frame = cap.read(buf)
+        if not ok or frame is None:
+            return False, None
+        # OpenCV reuses ``buf`` when the shape matches and returns a new
+        # array otherwise; keep whichever it used for the next round.
+        self._buffers[i] = frame
+        return True, frame
+
+    def resize_to_fit(self, frame: np.ndarray, box_w: int, box_h: int) -> np.ndarray:
+        """``resize_to_fit`` into the next pooled buffer."""
+        i = self._next
+        self._next = (i + 1) % self._count
+        out = resize_to_fit(frame, box_w, box_h, self._buffers[i])
+        if out is not frame:
+            self._buffers[i] = out
+        return out
@@ -0,0 +1,131 @@
+"""Representative "poster" frames for videos, extracted once and cached.
+
+The Videos tab, the All tab and the Review grid used to open a fresh
+``cv2.VideoCapture`` and decode frame 0 every time a video was selected or a
+grid was rebuilt. For many MPG clips frame 0 is black (fade-in), so the
+preview was useless as well as slow.
+
+``poster_frame`` seeks to a configurable offset, optionally skips ahead to
+the first frame that is not (nearly) black, scales it to ``POSTER_BOX`` and
+stores it in the shared on-disk thumbnail cache under a "poster" namespace,
+keyed on file identity and extraction settings. Later calls read the small
+JPEG back instead of touching the video. Returns QImage only, so it is safe
+to call from worker threads.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from vat.utils.thumb_cache import shared_thumbnail_cache, thumb_box
+from vat.video.frames import frame_to_qimage
+
+try:
+    import cv2  # type: ignore
+    CV2_AVAILABLE = True
+except Exception:  # pragma: no cover - cv2 optional at import time
+    cv2 = None  # type: ignore
+    CV2_AVAILABLE = False
+
+# Posters are stored at most this size; previews scale down from here.
+POSTER_BOX = (960, 720)
+# Mean 8-bit intensity (sampled) at or below which a frame counts as black.
+BLACK_THRESHOLD = 16.0
+# How far past the offset to look for a non-black frame.
+MAX_SCAN_SECONDS = 3.0
+MAX_SCAN_FRAMES = 90
+
+_settings_lock = threading.Lock()
+_offset_seconds = 0.0
+_skip_black = True
+
+
+def configure(offset_seconds: Optional[float] = None, skip_black: Optional[bool] = None) -> None:
+    """Set how posters are chosen (persisted by the app as settings)."""
+    global _offset_seconds, _skip_black
+    with _settings_lock:
+        if offset_seconds is not None:
+            _offset_seconds = max(0.0, float(offset_seconds))
+        if skip_black is not None:
+            _skip_black = bool(skip_black)
+
+
+def current_settings():
+    with _settings_lock:
+        return _offset_seconds, _skip_black
+
+
+def _namespace(offset_seconds: float, skip_black: bool) -> str:
+    return f"poster:{offset_seconds:.3f}:{int(skip_black)}"
+
+
+def is_black(frame) -> bool:
+    """True when a BGR frame is (nearly) black; samples every 8th pixel."""
+    try:
+        return float(frame[::8, ::8].mean()) <= BLACK_THRESHOLD
+    except Exception:
+        return False
+
+
+def _extract(path: str, offset_seconds: float, skip_black: bool):
+    """Decode the poster frame (BGR ndarray) or None."""
+    cap = cv2.VideoCapture(path)
+    try:
+        if not cap.isOpened():
+            return None
+        if offset_seconds > 0:
+            cap.set(cv2.CAP_PROP_POS_MSEC, offset_seconds * 1000.0)
+        ret, frame = cap.read()
+        if (not ret or frame is None) and offset_seconds > 0:
+            # Offset beyond the end (short clip) or unseekable: use the start.
+            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = cap.read()
+        if not ret or frame is None:
+            return None
+        if not skip_black or not is_black(frame):
+            return frame
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        limit = MAX_SCAN_FRAMES
+        if fps > 0:
+            limit = min(limit, int(fps * MAX_SCAN_SECONDS))
+        for _ in range(max(0, limit)):
+            ret, nxt = cap.read()
+            if not ret or nxt is None:
+                break
+            if not is_black(nxt):
+                return nxt
+        # Entirely dark opening: the first frame is still a valid poster.
+        return frame
+    finally:
+        cap.release()
+
+
+def poster_frame(path: str) -> Optional[QImage]:
+    """Poster for ``path`` (at most POSTER_BOX), from cache when possible."""
+    if not path or not CV2_AVAILABLE:
+        return None
+    offset_seconds, skip_black = current_settings()
+    cache = shared_thumbnail_cache()
+    namespace = _namespace(offset_seconds, skip_black)
+    key = cache.key_for(path, POSTER_BOX, namespace)
+    if key is not None:
+        hit = cache.get_by_key(key)
+        if hit is not None:
+            return hit
+    try:
+        frame = _extract(path, offset_seconds, skip_black)
+    except Exception as e:
+        logging.warning(f"poster_frame: failed to decode {path}: {e}")
+        return None
+    if frame is None:
+        return None
+    img = frame_to_qimage(frame)
+    w, h = thumb_box(POSTER_BOX)
+    if img.width() > w or img.height() > h:
+        img = img.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if key is not None:
+        cache.put_by_key(key, img)
+    return img